@@ -0,0 +1,158 @@
+"""Benchmark: peak memory of listing job offers, full rows vs summaries.
+
+Fills a database with job offers carrying realistic `raw_text` (~6 KB)
+and `processed_data` (~2 KB of JSON), then lists all of them in a fresh
+process per mode and reports the growth of the peak RSS, and of the
+anonymous RSS (on Linux: the peak also counts pages of the database file
+that SQLite maps in, which the kernel can reclaim):
+
+- full: ORM objects with every column loaded (how `get_all_jobs` read
+  jobs before `raw_text`/`processed_data` were deferred)
+- deferred: `get_all_jobs()`, heavy columns left in the database
+- summaries: `list_job_summaries`, JobOfferSummary rows from a
+  column-only select
+
+Usage:
+    uv run python benchmarks/bench_db_memory.py [--jobs 50000]
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from hireme.db.database import DatabaseManager, JobOffer, JobSource
+from hireme.db.schemas import JobOfferCreate
+
+MODES = ("full", "deferred", "summaries")
+
+
+def _fill(db_path: Path, jobs: int) -> None:
+    db = DatabaseManager(db_path)
+    offers = [
+        JobOfferCreate(
+            title=f"Data Engineer {i}",
+            company_name=f"Company {i % 500}",
+            url=f"https://example.com/jobs/{i}",
+            source=JobSource.INDEED,
+            location="Lyon, France",
+            raw_text=f"Job {i}. " + "Build and run data pipelines. " * 200,
+        )
+        for i in range(jobs)
+    ]
+    results = db.upsert_job_offers(offers)
+    processed = {
+        "title": "Data Engineer",
+        "company": {"name": "Company"},
+        "responsibilities": ["Maintain the batch and streaming pipelines"] * 20,
+        "skills": ["Python", "SQL", "Airflow", "Spark", "Kafka"] * 6,
+    }
+    with db.engine.begin() as conn:
+        conn.execute(
+            JobOffer.__table__.update().values(
+                processed_data=processed, is_processed=True
+            )
+        )
+    assert len(results) == jobs
+    db.close()
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux (bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _anon_rss_mb() -> float:
+    """Current anonymous (heap) RSS, 0 where /proc is not available."""
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        return 0.0
+    for line in status.splitlines():
+        if line.startswith("RssAnon:"):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _measure(mode: str, db_path: Path, jobs: int) -> None:
+    """List every job in one mode, print elapsed seconds and RSS growths."""
+    from sqlalchemy.orm import selectinload, undefer_group
+
+    db = DatabaseManager(db_path)
+    before, anon_before = _peak_rss_mb(), _anon_rss_mb()
+    start = time.perf_counter()
+
+    if mode == "full":
+        with db.get_session() as session:
+            listed = (
+                session.query(JobOffer)
+                .options(
+                    undefer_group("payload"),
+                    selectinload(JobOffer.resumes),
+                    selectinload(JobOffer.application),
+                )
+                .filter(JobOffer.is_archived == False)
+                .order_by(JobOffer.discovered_at.desc())
+                .all()
+            )
+            session.expunge_all()
+    elif mode == "deferred":
+        listed = db.get_all_jobs()
+    else:
+        listed = db.list_job_summaries(limit=jobs).jobs
+
+    elapsed = time.perf_counter() - start
+    assert len(listed) == jobs
+    rss_mb, anon_mb = _peak_rss_mb() - before, _anon_rss_mb() - anon_before
+    print(f"{elapsed:.3f} {rss_mb:.1f} {anon_mb:.1f}")
+
+
+def _run(*args: str) -> list[str]:
+    """Run this script in a child process, return its output words.
+
+    Children inherit the peak RSS of their parent on Linux, so the parent
+    does no heavy work itself.
+    """
+    return subprocess.run(
+        [sys.executable, __file__, *args], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def main(jobs: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "jobs.db"
+        _run("--fill", "--db", str(db_path), "--jobs", str(jobs))
+        size_mb = db_path.stat().st_size / 1024 / 1024
+        print(f"{jobs} jobs, database of {size_mb:.0f} MB")
+
+        results = {}
+        for mode in MODES:
+            output = _run("--measure", mode, "--db", str(db_path), "--jobs", str(jobs))
+            results[mode] = tuple(float(word) for word in output[-3:])
+
+    for mode, (elapsed, rss_mb, anon_mb) in results.items():
+        print(
+            f"{mode:10} {elapsed:7.2f} s   peak RSS +{rss_mb:7.1f} MB   "
+            f"anonymous RSS +{anon_mb:7.1f} MB"
+        )
+    full, summaries = results["full"][1], results["summaries"][1]
+    print(f"peak RSS, summaries vs full: {summaries / full:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--fill", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.fill:
+        _fill(args.db, args.jobs)
+    elif args.measure:
+        _measure(args.measure, args.db, args.jobs)
+    else:
+        main(args.jobs)
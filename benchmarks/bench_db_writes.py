@@ -0,0 +1,110 @@
+"""Benchmark: SQLite defaults vs the tuned engine for database writes.
+
+Times `add_job_offer` + `mark_job_processed` (two commits per job, as
+`job find` does) on a fresh database with SQLite defaults (rollback
+journal, synchronous=FULL, no busy timeout) and with the tuned engine
+(WAL, synchronous=NORMAL, busy timeout, pooled connections).
+
+A second run has several threads writing at once while another keeps
+reading, like a scrape running next to a resume batch, and counts the
+"database is locked" errors.
+
+Usage:
+    uv run python benchmarks/bench_db_writes.py [--jobs 500] [--writers 4]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+
+from hireme.db.database import DatabaseManager, JobSource
+
+
+def _write_jobs(db: DatabaseManager, prefix: str, jobs: int) -> int:
+    """Add and process `jobs` offers, return the number of locked errors."""
+    locked = 0
+    for i in range(jobs):
+        try:
+            job = db.add_job_offer(
+                title=f"{prefix} Data Engineer {i}",
+                company_name=f"Company {i % 50}",
+                url=f"https://example.com/{prefix}/{i}",
+                source=JobSource.INDEED,
+                raw_text="Job description " * 200,
+            )
+            db.mark_job_processed(job.id, {"title": job.title, "skills": ["SQL"]})
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+    return locked
+
+
+def _sequential(db: DatabaseManager, jobs: int) -> float:
+    start = time.perf_counter()
+    _write_jobs(db, "seq", jobs)
+    return time.perf_counter() - start
+
+
+def _concurrent(db: DatabaseManager, jobs: int, writers: int) -> tuple[float, int]:
+    """Writers share `jobs` while a reader lists jobs, return time and errors."""
+    errors = [0] * writers
+    done = threading.Event()
+
+    def writer(n: int) -> None:
+        errors[n] = _write_jobs(db, f"w{n}", jobs // writers)
+
+    def reader() -> None:
+        while not done.is_set():
+            try:
+                db.get_application_stats()
+            except OperationalError:
+                pass
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    read_thread = threading.Thread(target=reader)
+    start = time.perf_counter()
+    read_thread.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    read_thread.join()
+    return elapsed, sum(errors)
+
+
+def main(jobs: int, writers: int) -> None:
+    results = {}
+    for tuned in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DatabaseManager(Path(tmp) / "sequential.db", tuned=tuned)
+            sequential = _sequential(db, jobs)
+            db.close()
+
+            db = DatabaseManager(Path(tmp) / "concurrent.db", tuned=tuned)
+            concurrent, locked = _concurrent(db, jobs, writers)
+            db.close()
+        results[tuned] = (sequential, concurrent, locked)
+
+    for tuned, (sequential, concurrent, locked) in results.items():
+        name = "tuned" if tuned else "defaults"
+        print(
+            f"{name:9} sequential: {jobs / sequential:8.0f} jobs/s   "
+            f"{writers} writers + reader: {jobs / concurrent:8.0f} jobs/s, "
+            f"{locked} locked errors"
+        )
+    print(f"speedup (sequential): {results[False][0] / results[True][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--writers", type=int, default=4)
+    args = parser.parse_args()
+    main(args.jobs, args.writers)
@@ -0,0 +1,87 @@
+"""Microbenchmark: batched vs per-element job card extraction.
+
+Loads a saved Indeed search results page (50 cards) into headless Chromium
+and times `_extract_job_cards_batched` (one page.evaluate) against
+`_extract_job_card_per_element` (one CDP round trip per field).
+
+Usage:
+    uv run python benchmarks/bench_job_cards.py [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+from hireme.scraper.offers_finder import (
+    _extract_job_card_per_element,
+    _extract_job_cards_batched,
+)
+
+FIXTURE = (
+    Path(__file__).parent.parent
+    / "tests"
+    / "scraper"
+    / "fixtures"
+    / "indeed_search_page.html"
+)
+
+SELECTORS = {
+    "card_selector": ".job_seen_beacon",
+    "link_selector": "a[data-jk], h2 a",
+    "title_selector": "h2 span[title], .jobTitle",
+    "company_selector": "[data-testid='company-name'], .companyName",
+    "location_selector": "[data-testid='text-location'], .companyLocation",
+}
+
+
+async def _time_rounds(fn, rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def main(rounds: int) -> None:
+    html = FIXTURE.read_text(encoding="utf-8")
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.set_content(html)
+
+        async def batched():
+            return await _extract_job_cards_batched(page, max_results=50, **SELECTORS)
+
+        async def per_element():
+            return await _extract_job_card_per_element(
+                page, source="indeed", max_results=50, **SELECTORS
+            )
+
+        # Sanity check: both paths see the same cards
+        batched_cards = await batched()
+        per_element_cards = await per_element()
+        assert batched_cards is not None
+        assert len(batched_cards) == len(per_element_cards) == 50
+
+        batched_ms = await _time_rounds(batched, rounds)
+        per_element_ms = await _time_rounds(per_element, rounds)
+        await browser.close()
+
+    b, p = statistics.median(batched_ms), statistics.median(per_element_ms)
+    print(f"cards per page:  {len(batched_cards)}")
+    print(f"per-element:     {p:8.2f} ms/page (median of {rounds})")
+    print(f"batched:         {b:8.2f} ms/page (median of {rounds})")
+    print(f"speedup:         {p / b:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
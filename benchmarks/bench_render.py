@@ -0,0 +1,114 @@
+"""Benchmark: warm render pool vs one `rendercv` subprocess per resume.
+
+Writes the RenderCV input of a sample tailored resume and times, per
+resume, `run_rendercv` (CLI subprocess: interpreter start, imports, font
+scan) against `RenderPool.render` (worker process with RenderCV imported
+and the Typst compiler built once). Each round renders into its own
+directory, as `resume generate --all` does.
+
+Usage:
+    uv run python benchmarks/bench_render.py [--rounds 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from hireme.utils.models.resume_models import (
+    TailoredEducation,
+    TailoredExperience,
+    TailoredResume,
+    TailoredSkill,
+)
+from hireme.utils.render_pool import RenderPool
+from hireme.utils.rendercv_helpers import generate_rendercv_input, run_rendercv
+
+RESUME = TailoredResume(
+    name="Jane Doe",
+    email="jane.doe@example.com",
+    location="Lyon, France",
+    github_username="janedoe",
+    professional_summary="Data engineer building batch and streaming pipelines.",
+    education=[
+        TailoredEducation(
+            institution="Université Lyon 1",
+            area="Computer Science",
+            degree="MSc",
+            location="Lyon, France",
+            start_date="2016-09",
+            end_date="2018-06",
+            highlights=["Thesis on distributed query planning"],
+        )
+    ],
+    experience=[
+        TailoredExperience(
+            company="Acme",
+            position="Data Engineer",
+            location="Lyon, France",
+            start_date="2018-09",
+            end_date="present",
+            highlights=[
+                "Moved nightly ETL to incremental loads, cutting runtime by 70%",
+                "Maintained the Airflow platform used by 12 teams",
+            ],
+        )
+    ],
+    projects=[],
+    skills=[TailoredSkill(label="Languages", details="Python, SQL, Scala")],
+)
+
+
+def _inputs(root: Path, rounds: int) -> list[Path]:
+    """Write one RenderCV input per round, each in its own directory."""
+    paths = []
+    for i in range(rounds):
+        output_dir = root / f"job_{i}"
+        output_dir.mkdir()
+        paths.append(generate_rendercv_input(RESUME, output_dir))
+    return paths
+
+
+async def main(rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "subprocess").mkdir()
+        (root / "pool").mkdir()
+
+        subprocess_ms = []
+        for yaml_path in _inputs(root / "subprocess", rounds):
+            start = time.perf_counter()
+            run_rendercv(yaml_path, yaml_path.parent)
+            subprocess_ms.append((time.perf_counter() - start) * 1000)
+
+        pool = RenderPool(workers=1)
+        try:
+            start = time.perf_counter()
+            warm_dir = root / "pool" / "warm_up"
+            warm_dir.mkdir()
+            await pool.render(generate_rendercv_input(RESUME, warm_dir), warm_dir)
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            pool_ms = []
+            for yaml_path in _inputs(root / "pool", rounds):
+                start = time.perf_counter()
+                pdf_path = await pool.render(yaml_path, yaml_path.parent)
+                pool_ms.append((time.perf_counter() - start) * 1000)
+                assert pdf_path.exists()
+        finally:
+            pool.shutdown()
+
+    s, p = statistics.median(subprocess_ms), statistics.median(pool_ms)
+    print(f"subprocess:      {s:8.1f} ms/resume (median of {rounds})")
+    print(f"pool (first):    {cold_ms:8.1f} ms (worker start and warm-up)")
+    print(f"pool (warm):     {p:8.1f} ms/resume (median of {rounds})")
+    print(f"speedup:         {s / p:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
@@ -4,12 +4,18 @@ Extracts structured job information from web pages or text content
 to help users prepare quality applications.
 """
 
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import cache, partial
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 # from pydantic_ai import Agent
 from pydantic_ai.agent import Agent
@@ -18,7 +24,17 @@ from hireme.scraper.offers_finder import get_job_urls
 from hireme.scraper.offers_parser import get_job_page
 
 # from hireme.utils.providers import ollama_model
-from hireme.utils.providers import get_llm_model
+from hireme.utils.providers import (
+    PROVIDER_CONCURRENCY,
+    SUPPORTED_MODELS,
+    get_llm_model,
+    get_provider_name,
+)
+
+if TYPE_CHECKING:
+    from hireme.agents.job_compaction import CompactionResult
+    from hireme.agents.job_rules import RuleFindings
+    from hireme.utils.cache import CacheStats, PersistentCache
 
 logger = structlog.get_logger(logger_name=__name__)
 
@@ -174,21 +190,37 @@ Guidelines:
 - If the text is not a job posting, return ExtractionFailed with reason
 """
 
-# Lazy-loaded agent instance
-_job_extraction_agent: Agent[None, ExtractionFailed | JobDetails] | None = None
+JOB_EXTRACTION_MODEL: SUPPORTED_MODELS = "mistral-medium-latest"
+EXTRACTION_PROMPT = "Extract job details from this posting:\n\n"
+HINTS_PROMPT = "\n\nFields already identified in this posting (reuse as-is):\n"
 
+# Lazy-loaded agent instances, by model
+_job_extraction_agents: dict[str, Agent[None, ExtractionFailed | JobDetails]] = {}
 
-def get_job_extraction_agent() -> Agent[None, ExtractionFailed | JobDetails]:
-    """Get or create the job extraction agent lazily."""
-    global _job_extraction_agent
-    if _job_extraction_agent is None:
-        _job_extraction_agent = Agent(
-            model=get_llm_model("mistral-medium-latest"),
+
+def get_job_extraction_agent(
+    model: str = JOB_EXTRACTION_MODEL,
+) -> Agent[None, ExtractionFailed | JobDetails]:
+    """Get or create the job extraction agent of a model lazily."""
+    if model not in _job_extraction_agents:
+        _job_extraction_agents[model] = Agent(
+            model=get_llm_model(model),  # type: ignore[arg-type]
             # model=get_llm_model("default"),
             output_type=JobDetails | ExtractionFailed,
             retries=3,
         )
-    return _job_extraction_agent
+    return _job_extraction_agents[model]
+
+
+def job_output_check(output: JobDetails | ExtractionFailed) -> str | None:
+    """Get why an extraction should go to a bigger model (None if usable)."""
+    from hireme.agents.model_router import first_placeholder
+
+    if isinstance(output, ExtractionFailed):
+        return f"extraction failed: {output.reason}"
+    return first_placeholder(
+        title=output.title, company=output.company.name, location=output.location
+    )
 
 
 # Backwards compatibility alias (for imports that expect the module-level variable)
@@ -250,34 +282,418 @@ SAMPLE_POSTING = """
     """
 
 
-async def extract_job(text: str) -> JobDetails | ExtractionFailed:
+# =============================================================================
+# Extraction cache
+# =============================================================================
+
+# Bump when extraction changes in a way the schema and prompt do not show
+EXTRACTION_CACHE_VERSION = 1
+
+_extraction_cache: "PersistentCache | None" = None
+
+
+def get_extraction_cache() -> "PersistentCache":
+    """Get the on-disk cache of successful extractions, creating it lazily."""
+    global _extraction_cache
+    if _extraction_cache is None:
+        from hireme.config import cfg
+        from hireme.utils.cache import PersistentCache
+
+        _extraction_cache = PersistentCache(
+            cfg.hireme_dir / "cache" / "extractions.sqlite3",
+            max_bytes=50 * 1024 * 1024,
+        )
+    return _extraction_cache
+
+
+def extraction_cache_stats() -> "CacheStats | None":
+    """Get the extraction cache counters (None if the cache was never used)."""
+    return _extraction_cache.stats if _extraction_cache else None
+
+
+def _token_budget(token_budget: int | None) -> int:
+    """Resolve the posting token budget (None: configured default)."""
+    if token_budget is None:
+        from hireme.config import cfg
+
+        return cfg.extraction_token_budget
+    return token_budget
+
+
+@cache
+def _extraction_fingerprint(model_name: str, token_budget: int) -> str:
+    """Everything besides the posting that determines the extraction."""
+    from hireme.agents.job_compaction import COMPACTION_VERSION
+    from hireme.agents.job_rules import RULES_VERSION
+
+    return json.dumps(
+        {
+            "version": EXTRACTION_CACHE_VERSION,
+            "rules_version": RULES_VERSION,
+            "compaction_version": COMPACTION_VERSION,
+            "token_budget": token_budget,
+            "model": model_name,
+            "prompt": [EXTRACTION_PROMPT, HINTS_PROMPT],
+            "schema": [
+                JobDetails.model_json_schema(),
+                ExtractionFailed.model_json_schema(),
+            ],
+        },
+        sort_keys=True,
+    )
+
+
+def extraction_cache_key(
+    text: str,
+    model_name: str | None = None,
+    token_budget: int | None = None,
+) -> str:
+    """Hash a posting with the model, prompt, token budget and output schema.
+
+    Whitespace is normalized so that re-cleaned copies of a posting share
+    their entry. The model defaults to the extraction route's cascade.
+    """
+    if model_name is None:
+        from hireme.agents.model_router import get_router
+
+        model_name = "+".join(get_router().models("job_extraction"))
+    fingerprint = _extraction_fingerprint(model_name, _token_budget(token_budget))
+    digest = hashlib.sha256(fingerprint.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(" ".join(text.split()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _get_cached_extraction(key: str) -> JobDetails | None:
+    """Look up a validated extraction, dropping entries that no longer parse."""
+    extraction_cache = get_extraction_cache()
+    cached = extraction_cache.get(key)
+    if cached is None:
+        return None
+    try:
+        return JobDetails.model_validate_json(cached)
+    except ValidationError:
+        extraction_cache.delete(key)
+        return None
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+
+@dataclass
+class ExtractionStats:
+    """Token usage of LLM extractions (cache hits and rule-only excluded)."""
+
+    requests: int = 0
+    postings: int = 0
+    tokens: int = 0
+
+    @property
+    def tokens_per_posting(self) -> float:
+        return self.tokens / self.postings if self.postings else 0.0
+
+
+_extraction_stats = ExtractionStats()
+
+
+def extraction_stats() -> ExtractionStats:
+    """Get the process-wide LLM extraction counters."""
+    return _extraction_stats
+
+
+@dataclass
+class PreparedPosting:
+    """A posting ready for the LLM: rule findings and compacted text."""
+
+    text: str
+    findings: "RuleFindings"
+    compaction: "CompactionResult"
+    cache_key: str | None
+
+    @property
+    def prompt_section(self) -> str:
+        """The posting as sent to the LLM, with the rule hints."""
+        if hints := self.findings.as_hints():
+            return f"{self.compaction.text}{HINTS_PROMPT}{hints}"
+        return self.compaction.text
+
+
+def prepare_posting(
+    text: str,
+    use_cache: bool = True,
+    skip_llm_when_complete: bool = False,
+    token_budget: int | None = None,
+) -> JobDetails | PreparedPosting:
+    """Resolve a posting without the LLM if possible, else prepare its prompt.
+
+    Returns JobDetails on a cache hit (or when the rules are enough and
+    `skip_llm_when_complete` is set), a PreparedPosting otherwise.
+    """
+    from hireme.agents.job_compaction import compact_posting
+    from hireme.agents.job_rules import pre_extract
+
+    token_budget = _token_budget(token_budget)
+
+    findings = pre_extract(text)
+    if skip_llm_when_complete and (rules_job := findings.to_job_details()):
+        logger.info(
+            "Job extracted by rules, LLM skipped",
+            job_company=rules_job.company.name,
+            job_title=rules_job.title,
+        )
+        return rules_job
+
+    key = extraction_cache_key(text, token_budget=token_budget) if use_cache else None
+    if key is not None:
+        cached = _get_cached_extraction(key)
+        if cached is not None:
+            logger.info(
+                "Job extraction cache hit",
+                job_company=cached.company.name,
+                job_title=cached.title,
+                hit_rate=round(get_extraction_cache().stats.hit_rate, 3),
+            )
+            return cached
+
+    # Rules ran on the full text, so footers can still feed the hints
+    return PreparedPosting(text, findings, compact_posting(text, token_budget), key)
+
+
+def complete_extraction(
+    posting: PreparedPosting,
+    output: JobDetails | ExtractionFailed,
+    tokens: float,
+    mode: Literal["single", "packed"] = "single",
+) -> JobDetails | ExtractionFailed:
+    """Merge the rule findings into an LLM output and cache it."""
+    _extraction_stats.postings += 1
+    if isinstance(output, ExtractionFailed):
+        logger.error("Job extraction failed", reason=output.reason, mode=mode)
+        return output
+
+    job = posting.findings.fill(output)
+    logger.info(
+        "Job extraction completed",
+        job_company=job.company.name,
+        job_title=job.title,
+        mode=mode,
+        tokens_per_posting=round(tokens),
+        rule_fields=len(posting.findings.found),
+        compression=round(posting.compaction.ratio, 3),
+    )
+    if posting.cache_key is not None:
+        get_extraction_cache().set(posting.cache_key, job.model_dump_json())
+    return job
+
+
+async def extract_prepared(posting: PreparedPosting) -> JobDetails | ExtractionFailed:
+    """Extract a prepared posting with its own LLM request.
+
+    The request goes through the extraction route's model cascade.
+    """
+    from hireme.agents.model_router import get_router
+
+    routed = await get_router().run(
+        "job_extraction",
+        f"{EXTRACTION_PROMPT}{posting.prompt_section}",
+        agent_for=get_job_extraction_agent,
+        check=job_output_check,
+    )
+    _extraction_stats.requests += 1 + routed.escalations
+    _extraction_stats.tokens += routed.tokens
+    return complete_extraction(posting, routed.output, routed.tokens)
+
+
+async def extract_job(
+    text: str,
+    use_cache: bool = True,
+    skip_llm_when_complete: bool = False,
+    token_budget: int | None = None,
+) -> JobDetails | ExtractionFailed:
     """Extract job details from text content.
 
+    Fields found by the rule pre-extractor (email, salary, contract...) are
+    given to the LLM as hints and fill the gaps of its output. Postings
+    over the token budget are compacted to their most relevant sections.
+    Successful extractions are cached on disk, keyed by the posting text,
+    model, prompt and output schema: identical postings cost no tokens.
+
     Args:
         text: Raw text content from a job posting page
+        use_cache: Whether to read/write the extraction cache
+        skip_llm_when_complete: Return the rule findings without calling the
+            LLM when they cover every required field
+        token_budget: Maximum tokens of posting text sent to the LLM
+            (default: cfg.extraction_token_budget, 0 to disable compaction)
 
     Returns:
         Structured JobDetails or ExtractionFailed
     """
-    agent = get_job_extraction_agent()
-    result = await agent.run(f"Extract job details from this posting:\n\n{text}")
-    if isinstance(result.output, ExtractionFailed):
-        logger.error("Job extraction failed", reason=result.output.reason)
-    else:
-        logger.info(
-            "Job extraction completed",
-            job_company=result.output.company.name,
-            job_title=result.output.title,
-            usage=result.usage(),
-        )
-    return result.output
+    prepared = prepare_posting(text, use_cache, skip_llm_when_complete, token_budget)
+    if isinstance(prepared, JobDetails):
+        return prepared
+    return await extract_prepared(prepared)
 
 
-def extract_job_sync(text: str) -> JobDetails | ExtractionFailed:
+def extract_job_sync(
+    text: str, use_cache: bool = True
+) -> JobDetails | ExtractionFailed:
     """Synchronous version of extract_job."""
-    import asyncio
+    return asyncio.run(extract_job(text, use_cache=use_cache))
 
-    return asyncio.run(extract_job(text))
+
+# =============================================================================
+# Batch extraction
+# =============================================================================
+
+ExtractionCallback = Callable[[int, JobDetails | ExtractionFailed], None]
+_ExtractionUnit = tuple[
+    list[int], Callable[[], Awaitable[list[JobDetails | ExtractionFailed]]]
+]
+
+
+def extraction_concurrency(model_name: SUPPORTED_MODELS | None = None) -> int:
+    """Get how many extractions to run at once against a model's provider.
+
+    Defaults to the most permissive provider of the extraction cascade.
+    """
+    if model_name is not None:
+        return PROVIDER_CONCURRENCY[get_provider_name(model_name)]
+
+    from hireme.agents.model_router import get_router
+
+    return max(
+        PROVIDER_CONCURRENCY[get_provider_name(model)]  # type: ignore[arg-type]
+        for model in get_router().models("job_extraction")
+    )
+
+
+async def _extract_one(
+    text: str, use_cache: bool
+) -> list[JobDetails | ExtractionFailed]:
+    return [await extract_job(text, use_cache=use_cache)]
+
+
+async def iter_extract_jobs(
+    postings: Sequence[str],
+    concurrency: int | None = None,
+    use_cache: bool = True,
+    pack: bool = False,
+) -> AsyncIterator[tuple[int, JobDetails | ExtractionFailed]]:
+    """Extract job postings concurrently, yielding results as they complete.
+
+    An extraction raising (network or provider error) yields an
+    ExtractionFailed instead of aborting the batch.
+
+    Args:
+        postings: Raw text of each job posting
+        concurrency: Maximum LLM requests in flight (default: provider limit)
+        use_cache: Whether to read/write the extraction cache
+        pack: Send several postings per LLM request (see job_batching)
+
+    Yields:
+        (index in postings, result) tuples in completion order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency or extraction_concurrency()))
+
+    async def run(
+        indices: list[int],
+        work: Callable[[], Awaitable[list[JobDetails | ExtractionFailed]]],
+    ) -> list[tuple[int, JobDetails | ExtractionFailed]]:
+        async with semaphore:
+            try:
+                return list(zip(indices, await work()))
+            except Exception as e:
+                logger.error("Job extraction error", indices=indices, error=str(e))
+                failed = ExtractionFailed(reason=f"Extraction error: {e}")
+                return [(index, failed) for index in indices]
+
+    units: list[_ExtractionUnit] = []
+    if pack:
+        from hireme.agents.job_batching import (
+            extract_packed,
+            pack_postings,
+            posting_tokens,
+        )
+
+        # Cache hits are answered right away and take no room in the packs
+        prepared: dict[int, PreparedPosting] = {}
+        for i, text in enumerate(postings):
+            resolved = prepare_posting(text, use_cache)
+            if isinstance(resolved, JobDetails):
+                yield i, resolved
+            else:
+                prepared[i] = resolved
+
+        indices = list(prepared)
+        for group in pack_postings([posting_tokens(prepared[i]) for i in indices]):
+            members = [indices[g] for g in group]
+            units.append(
+                (members, partial(extract_packed, [prepared[i] for i in members]))
+            )
+    else:
+        units = [
+            ([i], partial(_extract_one, text, use_cache))
+            for i, text in enumerate(postings)
+        ]
+
+    tasks = [asyncio.create_task(run(indices, work)) for indices, work in units]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for item in await next_done:
+                yield item
+    finally:
+        # Consumer stopped early: drop the pending extractions
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def extract_jobs_batch(
+    postings: Sequence[str],
+    concurrency: int | None = None,
+    use_cache: bool = True,
+    on_result: ExtractionCallback | None = None,
+    pack: bool = False,
+) -> list[JobDetails | ExtractionFailed]:
+    """Extract job postings concurrently.
+
+    Args:
+        postings: Raw text of each job posting
+        concurrency: Maximum LLM requests in flight (default: provider limit)
+        use_cache: Whether to read/write the extraction cache
+        on_result: Called with (index, result) as soon as each one completes
+        pack: Send several postings per LLM request (see job_batching)
+
+    Returns:
+        One result per posting, in input order
+    """
+    from hireme.utils.llm_scheduler import scheduling
+
+    before = replace(_extraction_stats)
+    results: list[JobDetails | ExtractionFailed | None] = [None] * len(postings)
+    # Bulk work: interactive LLM requests go first
+    with scheduling("batch"):
+        async for index, result in iter_extract_jobs(
+            postings, concurrency, use_cache, pack
+        ):
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+    llm_postings = _extraction_stats.postings - before.postings
+    tokens = _extraction_stats.tokens - before.tokens
+    logger.info(
+        "Batch extraction complete",
+        total=len(postings),
+        extracted=sum(isinstance(r, JobDetails) for r in results),
+        mode="packed" if pack else "single",
+        requests=_extraction_stats.requests - before.requests,
+        tokens_per_posting=round(tokens / llm_postings) if llm_postings else 0,
+    )
+    return results  # type: ignore[return-value]  # every index was filled
 
 
 # =============================================================================
@@ -290,6 +706,7 @@ async def main_extraction(
     query: str = "Data analyst",
     location: str = "Lille, France",
     export_dir: Path | None = None,
+    pack: bool = False,
 ) -> list[JobDetails | ExtractionFailed]:
     """Extract job offers characteristics using LLM, given a list of job postings.
 
@@ -305,6 +722,8 @@ async def main_extraction(
         maximum number of results to extract per source, by default 1
     export_dir : Path | None, optional
         optional path to export results as text and JSON, by default does not save
+    pack : bool, optional
+        send several postings per LLM request, by default one request per posting
     """
     from hireme.utils.common import write_job_offer_to_json
 
@@ -313,7 +732,6 @@ async def main_extraction(
         query=query,
         location=location,
     )
-    results: list[JobDetails | ExtractionFailed] = []
 
     raw_export_dir: Path = Path()
     processed_export_dir: Path = Path()
@@ -327,18 +745,16 @@ async def main_extraction(
         if not raw_export_dir.exists():
             raw_export_dir.mkdir(parents=True, exist_ok=True)
 
-    for i, posting in enumerate(job_offers):
-        url = posting.get("url", "unknown")
-        content = posting["content"]
+    def export(i: int, result: JobDetails | ExtractionFailed) -> None:
+        url = job_offers[i].get("url", "unknown")
+        content = job_offers[i]["content"]
 
         logger.debug(
-            "Processing offer",
+            "Processed offer",
             preview_url=url[:URL_PREVIEW],
             index=i + 1,
             total=len(job_offers),
         )
-        result = await extract_job(content)
-
         if isinstance(result, JobDetails):
             if export_dir:
                 job_json_path = write_job_offer_to_json(
@@ -351,9 +767,10 @@ async def main_extraction(
                     f.write(content)
                 logger.debug("Job offer saved", path=job_json_path)
             # print(result.model_dump_json(indent=2))
-        results.append(result)
 
-    return results
+    return await extract_jobs_batch(
+        [posting["content"] for posting in job_offers], on_result=export, pack=pack
+    )
 
 
 async def main(
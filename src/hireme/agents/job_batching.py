@@ -0,0 +1,192 @@
+"""Multi-posting LLM requests for job extraction.
+
+For short postings the fixed cost of a request (instructions, output
+schema, round trip) dominates. Packing several postings into one request
+shares that cost: postings are grouped greedily up to a token budget and
+the model returns one indexed result per posting. Results missing from a
+malformed batch response are extracted again one posting at a time.
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+import structlog
+from pydantic import BaseModel, Field
+from pydantic_ai.agent import Agent
+
+from hireme.agents.job_agent import (
+    JOB_EXTRACTION_MODEL,
+    ExtractionFailed,
+    JobDetails,
+    PreparedPosting,
+    complete_extraction,
+    extract_prepared,
+    extraction_stats,
+    job_output_check,
+)
+from hireme.agents.job_compaction import estimate_tokens
+from hireme.agents.model_router import get_router
+from hireme.utils.providers import get_llm_model
+
+logger = structlog.get_logger(logger_name=__name__)
+
+BATCH_PROMPT = (
+    "Extract job details from each of the {count} job postings below. "
+    "Return exactly one result per posting, tagged with the posting index.\n\n"
+)
+POSTING_HEADER = "### Posting {index}\n"
+
+# Posting tokens per request; leaves room for the schema and the answers
+PACK_TOKEN_BUDGET = 6000
+PACK_MAX_POSTINGS = 8
+
+
+class PostingExtraction(BaseModel):
+    """Extraction result of one posting of a batch."""
+
+    index: int = Field(..., description="Index of the posting in the request")
+    result: JobDetails | ExtractionFailed
+
+
+class ExtractionBatch(BaseModel):
+    """Extraction results of several postings sent in one request."""
+
+    results: list[PostingExtraction]
+
+
+# Lazy-loaded agent instances, by model
+_batch_extraction_agents: dict[str, Agent[None, ExtractionBatch]] = {}
+
+
+def get_batch_extraction_agent(
+    model: str = JOB_EXTRACTION_MODEL,
+) -> Agent[None, ExtractionBatch]:
+    """Get or create the multi-posting extraction agent of a model lazily."""
+    if model not in _batch_extraction_agents:
+        _batch_extraction_agents[model] = Agent(
+            model=get_llm_model(model),  # type: ignore[arg-type]
+            output_type=ExtractionBatch,
+            retries=3,
+        )
+    return _batch_extraction_agents[model]
+
+
+def pack_postings(
+    token_counts: Sequence[int],
+    token_budget: int = PACK_TOKEN_BUDGET,
+    max_postings: int = PACK_MAX_POSTINGS,
+) -> list[list[int]]:
+    """Group posting indices greedily, in order, up to a token budget.
+
+    A posting over the budget on its own gets a group of its own.
+    """
+    groups: list[list[int]] = []
+    group: list[int] = []
+    group_tokens = 0
+    for index, tokens in enumerate(token_counts):
+        if group and (
+            group_tokens + tokens > token_budget or len(group) >= max_postings
+        ):
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(index)
+        group_tokens += tokens
+    if group:
+        groups.append(group)
+    return groups
+
+
+def posting_tokens(posting: PreparedPosting) -> int:
+    """Estimate the prompt tokens of a prepared posting."""
+    return estimate_tokens(posting.prompt_section)
+
+
+def build_batch_prompt(postings: Sequence[PreparedPosting]) -> str:
+    """Build the prompt of a multi-posting request."""
+    sections = [
+        POSTING_HEADER.format(index=i) + posting.prompt_section
+        for i, posting in enumerate(postings)
+    ]
+    return BATCH_PROMPT.format(count=len(postings)) + "\n\n".join(sections)
+
+
+def align_results(
+    batch: ExtractionBatch, size: int
+) -> list[JobDetails | ExtractionFailed | None]:
+    """Order batch results by posting index.
+
+    Indices that are missing, out of range or answered twice are None.
+    """
+    aligned: list[JobDetails | ExtractionFailed | None] = [None] * size
+    seen: set[int] = set()
+    for item in batch.results:
+        if not 0 <= item.index < size:
+            continue
+        aligned[item.index] = None if item.index in seen else item.result
+        seen.add(item.index)
+    return aligned
+
+
+async def extract_packed(
+    postings: Sequence[PreparedPosting],
+) -> list[JobDetails | ExtractionFailed]:
+    """Extract several prepared postings with a single LLM request.
+
+    Postings the response does not answer properly (or all of them, if the
+    request fails) fall back to single-posting extraction, run concurrently
+    within the provider's scheduling limits. A posting the model reports as
+    not extractable (ExtractionFailed) is a valid answer.
+
+    Returns:
+        One result per posting, in input order
+    """
+    if len(postings) == 1:
+        return [await extract_prepared(postings[0])]
+
+    def check(batch: ExtractionBatch) -> str | None:
+        for output in align_results(batch, len(postings)):
+            if output is None:
+                return "incomplete batch"
+            # Only placeholder details escalate: a failure is an answer
+            if isinstance(output, JobDetails) and (reason := job_output_check(output)):
+                return reason
+        return None
+
+    stats = extraction_stats()
+    aligned: list[JobDetails | ExtractionFailed | None] = [None] * len(postings)
+    tokens = 0.0
+    try:
+        routed = await get_router().run(
+            "job_extraction",
+            build_batch_prompt(postings),
+            agent_for=get_batch_extraction_agent,
+            check=check,
+        )
+    except Exception as e:
+        logger.warning("Batch extraction failed", size=len(postings), error=str(e))
+    else:
+        aligned = align_results(routed.output, len(postings))
+        total = routed.tokens
+        stats.requests += 1 + routed.escalations
+        stats.tokens += total
+        answered = sum(output is not None for output in aligned)
+        tokens = total / answered if answered else 0.0
+
+    missing = [i for i, output in enumerate(aligned) if output is None]
+    if missing:
+        logger.warning(
+            "Malformed batch extraction, falling back to single postings",
+            size=len(postings),
+            missing=len(missing),
+        )
+
+    # LLM calls go through the provider scheduler, which bounds them
+    fallbacks = await asyncio.gather(*[extract_prepared(postings[i]) for i in missing])
+    retried = dict(zip(missing, fallbacks))
+
+    return [
+        retried[i]
+        if output is None
+        else complete_extraction(posting, output, tokens, mode="packed")
+        for i, (posting, output) in enumerate(zip(postings, aligned))
+    ]
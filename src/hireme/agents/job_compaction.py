@@ -0,0 +1,236 @@
+"""Token-budgeted compaction of job postings before LLM extraction.
+
+Pages where no description selector matched fall back to the whole `body`
+and carry navigation, similar-jobs lists and footers around the posting.
+The text is split into sections at heading lines, each section is scored
+for job relevance (responsibilities, requirements, salary, company...) and
+the best ones are kept, in their original order, up to a token budget.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Bump when segmentation, scoring or selection change (invalidates cached
+# extractions)
+COMPACTION_VERSION = 2
+
+# Rough average for French/English text with the Mistral/Llama tokenizers
+CHARS_PER_TOKEN = 4
+
+_RELEVANT = [
+    (
+        3,
+        re.compile(
+            r"(?i)\b(responsibilit\w*|missions?|what you('ll| will) do|your role"
+            r"|le poste|vos t[âa]ches|tasks)\b"
+        ),
+    ),
+    (
+        3,
+        re.compile(
+            r"(?i)\b(requirements?|qualifications?|profil\w*|skills|compétences"
+            r"|you have|experience|expérience|diplôme|degree)\b"
+        ),
+    ),
+    (
+        2,
+        re.compile(
+            r"(?i)\b(salary|salaire|rémunération|compensation|benefits|avantages"
+            r"|package)\b"
+        ),
+    ),
+    (
+        2,
+        re.compile(
+            r"(?i)\b(about us|who we are|qui sommes[- ]nous|company|entreprise"
+            r"|team|équipe|culture)\b"
+        ),
+    ),
+    (
+        1,
+        re.compile(
+            r"\b(CDI|CDD)\b|(?i:\b(remote|télétravail|hybrid\w*|contrat|contract"
+            r"|location|lieu)\b)"
+        ),
+    ),
+]
+_NOISE = re.compile(
+    r"(?i)(similar jobs|offres similaires|jobs you may like|other jobs|autres offres"
+    r"|sign in|se connecter|connexion|cookies?|all rights reserved|privacy"
+    r"|newsletter|download the app|télécharger l'application|follow us"
+    r"|suivez[- ]nous|report this job|signaler)"
+)
+
+_MAX_HEADING_WORDS = 8
+_SHORT_LINE_WORDS = 4  # navigation/link list entries
+_HEAD_BUDGET_SHARE = 4  # the head gets at least 1/4 of the budget
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the LLM token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class Section:
+    """A heading and the lines following it."""
+
+    index: int
+    lines: list[str]
+    score: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text) + 1  # joining newline
+
+
+@dataclass
+class CompactionResult:
+    """A compacted posting and how much it shrank."""
+
+    text: str
+    original_tokens: int
+    tokens: int
+    sections_kept: int
+    sections_total: int
+
+    @property
+    def ratio(self) -> float:
+        """Compacted size over original size (1.0 when untouched)."""
+        return self.tokens / self.original_tokens if self.original_tokens else 1.0
+
+
+def split_sections(text: str) -> list[Section]:
+    """Split text into sections, starting a new one at each heading line.
+
+    A heading is a short line without closing punctuation that either ends
+    with a colon, is followed by a full sentence or names a page element
+    (similar jobs, footer links...).
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    sections: list[Section] = []
+    for i, line in enumerate(lines):
+        next_line = lines[i + 1] if i + 1 < len(lines) else ""
+        is_heading = (
+            len(line.split()) <= _MAX_HEADING_WORDS
+            and not line.endswith((".", ",", ";"))
+            and (
+                line.endswith(":")
+                or len(next_line.split()) > _MAX_HEADING_WORDS
+                or _NOISE.search(line) is not None
+            )
+        )
+        if is_heading or not sections:
+            sections.append(Section(index=len(sections), lines=[line]))
+        else:
+            sections[-1].lines.append(line)
+    return sections
+
+
+def score_section(section: Section) -> float:
+    """Score how likely a section is part of the job description."""
+    heading, body = section.lines[0], section.text
+    score = 0.0
+    for weight, pattern in _RELEVANT:
+        score += weight * min(len(pattern.findall(body)), 3)
+        if pattern.search(heading):
+            score += weight
+    score -= 3 * len(_NOISE.findall(heading)) + len(_NOISE.findall(body))
+
+    # Runs of very short lines are menus and link lists
+    short = sum(len(line.split()) <= _SHORT_LINE_WORDS for line in section.lines)
+    if len(section.lines) >= 5 and short / len(section.lines) > 0.6:
+        score -= 2
+    return score
+
+
+def compact_posting(text: str, token_budget: int) -> CompactionResult:
+    """Keep the most job-relevant sections of a posting within a token budget.
+
+    The first section is always kept, as it holds the title, company and
+    location, which score nothing. The others are picked by decreasing score
+    (never the negative ones, which look like navigation) and put back in
+    their original order. Postings already under budget are returned
+    unchanged.
+
+    Args:
+        text: Cleaned posting text
+        token_budget: Maximum estimated tokens to keep, 0 to disable
+
+    Returns:
+        The compacted text with before/after token counts
+    """
+    original_tokens = estimate_tokens(text)
+    if token_budget <= 0 or original_tokens <= token_budget:
+        return CompactionResult(text, original_tokens, original_tokens, 1, 1)
+
+    sections = split_sections(text)
+    for section in sections:
+        section.score = score_section(section)
+
+    # Reserve room for the head, it gets whatever the others leave on top
+    head, rest = sections[0], sections[1:]
+    head_tokens = min(head.tokens, token_budget // _HEAD_BUDGET_SHARE)
+
+    kept: list[Section] = []
+    remaining = token_budget - head_tokens
+    for section in sorted(rest, key=lambda s: (-s.score, s.index)):
+        if section.score < 0 or remaining <= 0:
+            break
+        if section.tokens <= remaining:
+            kept.append(section)
+            remaining -= section.tokens
+        elif not kept:
+            # Even the best section is over budget: keep its head
+            section.lines = _truncate_lines(section.lines, remaining)
+            kept.append(section)
+            remaining = 0
+
+    remaining += head_tokens
+    if head.tokens > remaining:
+        head.lines = _truncate_lines(head.lines, remaining)
+    if head.lines:
+        kept.append(head)
+
+    compacted = "\n".join(s.text for s in sorted(kept, key=lambda s: s.index))
+    if not compacted:
+        compacted = text[: token_budget * CHARS_PER_TOKEN]
+
+    result = CompactionResult(
+        text=compacted,
+        original_tokens=original_tokens,
+        tokens=estimate_tokens(compacted),
+        sections_kept=len(kept),
+        sections_total=len(sections),
+    )
+    logger.info(
+        "Compacted posting",
+        original_tokens=result.original_tokens,
+        tokens=result.tokens,
+        ratio=round(result.ratio, 3),
+        sections=f"{result.sections_kept}/{result.sections_total}",
+    )
+    return result
+
+
+def _truncate_lines(lines: list[str], token_budget: int) -> list[str]:
+    """Keep the leading lines fitting in the budget (cutting the last one)."""
+    kept: list[str] = []
+    chars = token_budget * CHARS_PER_TOKEN
+    for line in lines:
+        if len(line) + 1 > chars:
+            if chars > 0:
+                kept.append(line[:chars])
+            break
+        kept.append(line)
+        chars -= len(line) + 1
+    return kept
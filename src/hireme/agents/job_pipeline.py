@@ -0,0 +1,206 @@
+"""Concurrent search -> fetch -> clean -> extract -> persist pipeline.
+
+Each stage runs its own workers and hands items to the next one through a
+bounded queue, so fetching later postings overlaps with the LLM extraction
+of earlier ones. When a downstream stage falls behind, its queue fills up
+and upstream workers wait (back-pressure) instead of piling up pages in
+memory.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from hireme.agents.job_agent import ExtractionFailed, JobDetails
+
+logger = structlog.get_logger(logger_name=__name__)
+
+STAGES = ("search", "fetch", "clean", "extract", "persist")
+
+
+@dataclass
+class PipelineConfig:
+    """Worker counts and queue sizes of the job pipeline."""
+
+    fetch_workers: int = 4
+    clean_workers: int = 1
+    extract_workers: int = 2
+    persist_workers: int = 1  # DB writes stay serialized
+    queue_size: int = 8  # per stage; bounds pages held in memory
+
+
+@dataclass
+class JobItem:
+    """A job posting moving through the pipeline."""
+
+    url: str
+    source: str = ""
+    raw: str | None = None  # fetched page text
+    text: str | None = None  # cleaned text sent to the LLM
+    result: JobDetails | ExtractionFailed | None = None
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+
+    done: int = 0
+    failed: int = 0  # raised or produced nothing
+    in_flight: int = 0
+
+
+@dataclass
+class PipelineStats:
+    """Counters for every stage, keyed by stage name."""
+
+    stages: dict[str, StageStats] = field(
+        default_factory=lambda: {name: StageStats() for name in STAGES}
+    )
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self.stages[stage]
+
+
+ProgressCallback = Callable[[str, StageStats], None]
+
+# Marks the end of a stage's input
+_DONE: Any = object()
+
+
+async def run_job_pipeline(
+    items: AsyncIterable[JobItem],
+    fetch: Callable[[str], Awaitable[str | None]],
+    clean: Callable[[str], str],
+    extract: Callable[[str], Awaitable[JobDetails | ExtractionFailed]],
+    persist: Callable[[JobItem], None],
+    config: PipelineConfig | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> PipelineStats:
+    """Run job items through the fetch, clean, extract and persist stages.
+
+    Items that already carry `raw` content skip the fetch. Items whose
+    fetch, cleaning or extraction fails are dropped (and counted); failed
+    extractions (ExtractionFailed) are still handed to `persist` so the
+    caller can report them.
+
+    Args:
+        items: Job items to process, typically streamed from the search
+        fetch: Coroutine returning the page text of a URL (None if failed)
+        clean: Function cleaning page text (run in a worker thread)
+        extract: Coroutine extracting job details from cleaned text
+        persist: Function saving an extracted item (run in the event loop)
+        config: Worker counts and queue sizes
+        on_progress: Called with the stage name and its stats on each change
+
+    Returns:
+        Per-stage counters
+    """
+    cfg = config or PipelineConfig()
+    stats = PipelineStats()
+
+    def report(stage: str) -> None:
+        if on_progress is not None:
+            on_progress(stage, stats[stage])
+
+    to_fetch: asyncio.Queue[JobItem] = asyncio.Queue(maxsize=cfg.queue_size)
+    to_clean: asyncio.Queue[JobItem] = asyncio.Queue(maxsize=cfg.queue_size)
+    to_extract: asyncio.Queue[JobItem] = asyncio.Queue(maxsize=cfg.queue_size)
+    to_persist: asyncio.Queue[JobItem] = asyncio.Queue(maxsize=cfg.queue_size)
+
+    async def search() -> None:
+        try:
+            async for item in items:
+                stats["search"].done += 1
+                report("search")
+                await to_fetch.put(item)
+        except Exception as e:
+            stats["search"].failed += 1
+            report("search")
+            logger.error("Job search failed", error=str(e))
+        finally:
+            await to_fetch.put(_DONE)
+
+    async def do_fetch(item: JobItem) -> JobItem | None:
+        if item.raw is None:
+            item.raw = await fetch(item.url)
+        return item if item.raw else None
+
+    async def do_clean(item: JobItem) -> JobItem | None:
+        assert item.raw is not None
+        item.text = await asyncio.to_thread(clean, item.raw)
+        return item if item.text else None
+
+    async def do_extract(item: JobItem) -> JobItem | None:
+        assert item.text is not None
+        item.result = await extract(item.text)
+        return item
+
+    async def do_persist(item: JobItem) -> JobItem | None:
+        persist(item)
+        return item
+
+    stages = [
+        ("fetch", to_fetch, to_clean, do_fetch, cfg.fetch_workers),
+        ("clean", to_clean, to_extract, do_clean, cfg.clean_workers),
+        ("extract", to_extract, to_persist, do_extract, cfg.extract_workers),
+        ("persist", to_persist, None, do_persist, cfg.persist_workers),
+    ]
+    async with asyncio.TaskGroup() as group:
+        group.create_task(search())
+        for name, inbox, outbox, handle, workers in stages:
+            group.create_task(
+                _run_stage(name, inbox, outbox, handle, workers, stats, report)
+            )
+
+    logger.info(
+        "Job pipeline complete",
+        **{name: stage.done for name, stage in stats.stages.items()},
+    )
+    return stats
+
+
+async def _run_stage(
+    name: str,
+    inbox: asyncio.Queue[JobItem],
+    outbox: asyncio.Queue[JobItem] | None,
+    handle: Callable[[JobItem], Awaitable[JobItem | None]],
+    workers: int,
+    stats: PipelineStats,
+    report: Callable[[str], None],
+) -> None:
+    """Run `workers` copies of a stage until its input is exhausted."""
+    stage = stats[name]
+
+    async def worker() -> None:
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                # Let the sibling workers see the end marker too
+                await inbox.put(_DONE)
+                return
+
+            stage.in_flight += 1
+            report(name)
+            try:
+                result = await handle(item)
+            except Exception as e:
+                logger.error(f"Pipeline {name} failed", url=item.url, error=str(e))
+                result = None
+            finally:
+                stage.in_flight -= 1
+
+            if result is None:
+                stage.failed += 1
+            else:
+                stage.done += 1
+            report(name)
+
+            if result is not None and outbox is not None:
+                await outbox.put(result)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, workers))])
+    if outbox is not None:
+        await outbox.put(_DONE)
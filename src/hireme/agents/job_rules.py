@@ -0,0 +1,269 @@
+"""Rule-based pre-extraction of job posting fields.
+
+Some JobDetails fields are written in predictable forms (contact email,
+application link, salary range, contract type, work mode, deadline) and
+regex matchers find them without an LLM. Matchers only report a value
+when it is unambiguous; the findings are then:
+
+- passed to the LLM as hints
+- used to fill the fields the LLM left empty
+- turned into JobDetails directly when they cover every required field
+  (title, company, location), skipping the LLM altogether
+"""
+
+import re
+from dataclasses import dataclass, field, fields
+
+import structlog
+
+from hireme.agents.job_agent import (
+    CompanyInfo,
+    ContractType,
+    JobDetails,
+    Salary,
+    WorkMode,
+)
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Bump when matchers change, it invalidates cached LLM extractions
+RULES_VERSION = 1
+
+# =============================================================================
+# Matchers
+# =============================================================================
+
+_EMAIL_RE = re.compile(r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-zA-Z]{2,}\b")
+_URL_RE = re.compile(r"https?://[^\s<>\"')\]]+")
+_APPLY_RE = re.compile(r"(?i)\b(apply|application|postuler|candidat\w*)\b")
+
+_LABELS = {
+    "title": r"job title|title|poste|intitulé du poste",
+    "company": r"company|entreprise|société",
+    "location": r"location|lieu|localisation",
+}
+_LABEL_RES = {
+    name: re.compile(rf"(?im)^[ \t]*(?:{labels})[ \t]*:[ \t]*(\S.*?)[ \t]*$")
+    for name, labels in _LABELS.items()
+}
+
+_CONTRACT_RES = [
+    (ContractType.CDI, re.compile(r"\bCDI\b")),
+    (ContractType.CDD, re.compile(r"\bCDD\b")),
+    (ContractType.FREELANCE, re.compile(r"(?i)\b(freelance|indépendant)\b")),
+    (
+        ContractType.INTERNSHIP,
+        re.compile(r"\bStage\b|(?i:\b(internship|stagiaire)\b)"),
+    ),
+    (
+        ContractType.APPRENTICESHIP,
+        re.compile(r"(?i)\b(alternance|apprentissage|apprenticeship)\b"),
+    ),
+    (ContractType.PART_TIME, re.compile(r"(?i)\b(part[- ]time|temps partiel)\b")),
+    (ContractType.FULL_TIME, re.compile(r"(?i)\b(full[- ]time|temps plein)\b")),
+    (ContractType.TEMPORARY, re.compile(r"(?i)\b(intérim|interim|temporary)\b")),
+]
+
+_HYBRID_RE = re.compile(
+    r"(?i)\b(hybrid|hybride)\b|\d\s*jours?\s+(de\s+)?(télétravail|remote)"
+    r"|\b\d\s*days?\s+(of\s+)?remote\b"
+)
+_REMOTE_RE = re.compile(
+    r"(?i)\b(full[- ]remote|fully remote|100\s*%\s*(remote|télétravail)"
+    r"|télétravail complet|remote[- ]first)\b"
+)
+_ONSITE_RE = re.compile(
+    r"(?i)\b(on[- ]site|onsite|sur site|présentiel|no remote|pas de télétravail)\b"
+)
+
+_DATE = (
+    r"\d{4}-\d{2}-\d{2}|\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}"
+    r"|\d{1,2}(?:er)?\s+[A-Za-zéû]+\s+\d{4}|[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}"
+)
+_DEADLINE_RE = re.compile(
+    r"(?i)\b(?:deadline|closing date|date limite|apply before|avant le)\b"
+    rf"[^\n\d]{{0,20}}({_DATE})"
+)
+
+_SALARY_RE = re.compile(
+    r"(?i)\b(salaire|salary|rémunération|remuneration|compensation|package|pay|tjm"
+    r"|brut|gross)\b"
+)
+_CURRENCIES = {
+    "€": "EUR",
+    "eur": "EUR",
+    "$": "USD",
+    "usd": "USD",
+    "£": "GBP",
+    "gbp": "GBP",
+}
+_CURRENCY_RE = re.compile(r"(?i)[€$£]|\b(eur|usd|gbp)\b")
+_AMOUNT_RE = re.compile(
+    r"(?<![\w.,])(\d{1,3}(?:[ \u00a0\u202f.,]\d{3})+|\d+)"  # 45 000 / 45,000 / 45
+    r"(?:[.,](\d{1,2}))?\s*([kK])?(?!\w)"  # decimals, thousands suffix
+)
+_PERIOD_RES = [
+    ("hourly", re.compile(r"(?i)(/\s*h\b|per hour|de l'heure|horaire|/\s*heure)")),
+    ("daily", re.compile(r"(?i)(/\s*j(our)?\b|per day|par jour|\bTJM\b|daily)")),
+    ("monthly", re.compile(r"(?i)(/\s*mois|per month|par mois|mensuel|monthly)")),
+    ("yearly", re.compile(r"(?i)(/\s*an\b|per year|par an|annuel|yearly|annual|k€)")),
+]
+_NET_RE = re.compile(r"(?i)\bnet\b")
+
+
+@dataclass
+class RuleFindings:
+    """Fields found by the rule matchers (None/empty when not found)."""
+
+    title: str | None = None
+    company: str | None = None
+    location: str | None = None
+    contact_email: str | None = None
+    application_url: str | None = None
+    application_deadline: str | None = None
+    salary: Salary | None = None
+    contract_type: list[ContractType] = field(default_factory=list)
+    work_mode: WorkMode | None = None
+
+    @property
+    def found(self) -> dict[str, object]:
+        """The fields that were found, by name."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) not in (None, [])
+        }
+
+    @property
+    def is_complete(self) -> bool:
+        """Check whether every required JobDetails field was found."""
+        return bool(self.title and self.company and self.location)
+
+    def as_hints(self) -> str:
+        """Format the findings as a prompt section for the LLM."""
+        lines = []
+        for name, value in self.found.items():
+            if isinstance(value, Salary):
+                value = value.model_dump_json(exclude_none=True)
+            elif isinstance(value, list):
+                value = ", ".join(item.value for item in value)
+            elif isinstance(value, WorkMode):
+                value = value.value
+            lines.append(f"- {name}: {value}")
+        return "\n".join(lines)
+
+    def fill(self, job: JobDetails) -> JobDetails:
+        """Fill the fields an extraction left empty with the findings."""
+        updates: dict[str, object] = {}
+        for name in ("contact_email", "application_url", "application_deadline"):
+            if getattr(job, name) is None and getattr(self, name):
+                updates[name] = getattr(self, name)
+        if job.salary is None and self.salary is not None:
+            updates["salary"] = self.salary
+        if self.contract_type and job.contract_type in ([], [ContractType.UNKNOWN]):
+            updates["contract_type"] = self.contract_type
+        if job.work_mode is WorkMode.UNKNOWN and self.work_mode is not None:
+            updates["work_mode"] = self.work_mode
+        return job.model_copy(update=updates) if updates else job
+
+    def to_job_details(self) -> JobDetails | None:
+        """Build JobDetails from the findings alone (None if incomplete)."""
+        if not self.is_complete:
+            return None
+        assert self.title and self.company and self.location
+        return JobDetails(
+            title=self.title,
+            company=CompanyInfo(name=self.company),
+            location=self.location,
+            work_mode=self.work_mode or WorkMode.UNKNOWN,
+            contract_type=self.contract_type or [ContractType.UNKNOWN],
+            salary=self.salary,
+            contact_email=self.contact_email,
+            application_url=self.application_url,
+            application_deadline=self.application_deadline,
+        )
+
+
+def pre_extract(text: str) -> RuleFindings:
+    """Run the rule matchers over a job posting."""
+    findings = RuleFindings(
+        contact_email=_find_email(text),
+        application_url=_find_application_url(text),
+        application_deadline=_find_deadline(text),
+        salary=_find_salary(text),
+        contract_type=[
+            contract for contract, pattern in _CONTRACT_RES if pattern.search(text)
+        ],
+        work_mode=_find_work_mode(text),
+    )
+    for name, pattern in _LABEL_RES.items():
+        if match := pattern.search(text):
+            setattr(findings, name, match.group(1))
+
+    logger.debug("Rule pre-extraction", fields=sorted(findings.found))
+    return findings
+
+
+def _find_email(text: str) -> str | None:
+    emails = {match.group(0).lower() for match in _EMAIL_RE.finditer(text)}
+    # Several addresses: no way to tell which one is the contact
+    return emails.pop() if len(emails) == 1 else None
+
+
+def _find_application_url(text: str) -> str | None:
+    for line in text.splitlines():
+        if _APPLY_RE.search(line) and (match := _URL_RE.search(line)):
+            return match.group(0).rstrip(".,;")
+    return None
+
+
+def _find_deadline(text: str) -> str | None:
+    match = _DEADLINE_RE.search(text)
+    return match.group(1) if match else None
+
+
+def _find_work_mode(text: str) -> WorkMode | None:
+    if _HYBRID_RE.search(text):
+        return WorkMode.HYBRID
+    remote, onsite = _REMOTE_RE.search(text), _ONSITE_RE.search(text)
+    if remote and not onsite:
+        return WorkMode.REMOTE
+    if onsite and not remote:
+        return WorkMode.ONSITE
+    return None
+
+
+def _parse_amount(match: re.Match[str]) -> int:
+    whole, decimals, thousands = match.groups()
+    value = float(re.sub(r"[ \u00a0\u202f.,]", "", whole) + f".{decimals or 0}")
+    return round(value * 1000) if thousands else round(value)
+
+
+def _find_salary(text: str) -> Salary | None:
+    """Find a salary (range) on a line mentioning pay and a currency."""
+    for line in text.splitlines():
+        currency = _CURRENCY_RE.search(line)
+        if currency is None or not _SALARY_RE.search(line):
+            continue
+        amounts = [
+            amount for m in _AMOUNT_RE.finditer(line) if (amount := _parse_amount(m))
+        ][:2]
+        if not amounts:
+            continue
+        period = next(
+            (name for name, pattern in _PERIOD_RES if pattern.search(line)), "yearly"
+        )
+        min_amount, max_amount = amounts[0], amounts[-1]
+        # "45 - 55k€": the k applies to both ends of the range
+        if max_amount >= 1000 > min_amount and max_amount // min_amount >= 100:
+            min_amount *= 1000
+        if min_amount > max_amount:
+            continue
+        return Salary(
+            min_amount=min_amount,
+            max_amount=max_amount if max_amount != min_amount else None,
+            currency=_CURRENCIES[currency.group(0).lower()],
+            period=period,  # type: ignore[arg-type]
+            is_gross=not _NET_RE.search(line),
+        )
+    return None
@@ -0,0 +1,251 @@
+"""Local-first model routing for the LLM agents.
+
+Each route (job extraction, resume tailoring) has a cascade of models,
+cheapest first (typically a local Ollama model, then Mistral). A prompt
+goes to the first model; the next one is only tried when the answer is
+unusable:
+
+- the run raised (invalid structured output after retries, server down)
+- the route's check rejects the output (failure result, placeholder or
+  empty required fields)
+
+Local models are left out of the cascades when the Ollama server does not
+answer at startup, and a local server that keeps erroring later is skipped
+for a while (circuit breaker) instead of adding a failed call in front of
+every request.
+Calls go through the provider schedulers (rate limits, priorities).
+Per-route and per-model latency, tokens and escalations are recorded.
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+from hireme.agents.job_compaction import estimate_tokens
+from hireme.utils.circuit_breaker import CircuitBreaker
+from hireme.utils.llm_scheduler import (
+    DeadlineExceeded,
+    get_llm_scheduler,
+    usage_tokens,
+)
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Check returning why an output should be escalated (None to accept it)
+OutputCheck = Callable[[Any], str | None]
+
+# Tokens budgeted for a structured answer on top of the prompt
+OUTPUT_TOKEN_ALLOWANCE = 1000
+
+
+@dataclass
+class ModelStats:
+    """Counters for one model of a route."""
+
+    calls: int = 0
+    rejected: int = 0  # raised or failed the route check
+    latency: float = 0.0  # seconds, summed
+    tokens: int = 0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency / self.calls if self.calls else 0.0
+
+
+@dataclass
+class RouteStats:
+    """Counters for one route."""
+
+    requests: int = 0
+    escalations: int = 0
+    models: dict[str, ModelStats] = field(default_factory=dict)
+
+
+@dataclass
+class RoutedResult[OutputT]:
+    """Output of a routed run and what it cost."""
+
+    output: OutputT
+    model: str
+    tokens: int  # every attempt included
+    escalations: int
+
+
+class ModelRouter:
+    """Runs prompts through per-route model cascades."""
+
+    def __init__(
+        self,
+        cascades: dict[str, Sequence[str]],
+        breaker: CircuitBreaker | None = None,
+    ):
+        """
+        Args:
+            cascades: Model identifiers per route, tried in order
+            breaker: Skips models whose server keeps erroring
+        """
+        self.cascades = {route: list(models) for route, models in cascades.items()}
+        self.breaker = breaker or CircuitBreaker(failure_threshold=3, reset_timeout=300)
+        self.stats: dict[str, RouteStats] = {}
+
+    def models(self, route: str) -> list[str]:
+        """Get the cascade of a route."""
+        return self.cascades[route]
+
+    async def run(
+        self,
+        route: str,
+        prompt: str,
+        agent_for: Callable[[str], Any],
+        check: OutputCheck,
+    ) -> RoutedResult:
+        """Run a prompt through the route's cascade.
+
+        The last model's answer is returned even if the check rejects it,
+        and its errors are raised. A request that waited past its
+        scheduling deadline raises DeadlineExceeded without escalating.
+
+        Args:
+            route: Route name (selects the cascade)
+            prompt: User prompt for the agent
+            agent_for: Returns the pydantic-ai agent for a model identifier
+            check: Returns why an output should be escalated, or None
+        """
+        models = self.cascades[route]
+        stats = self.stats.setdefault(route, RouteStats())
+        stats.requests += 1
+        tokens = 0
+        escalations = 0
+        estimated = estimate_tokens(prompt) + OUTPUT_TOKEN_ALLOWANCE
+
+        for position, model in enumerate(models):
+            is_last = position == len(models) - 1
+            if not is_last and not self.breaker.allow(model):
+                continue
+
+            model_stats = stats.models.setdefault(model, ModelStats())
+            model_stats.calls += 1
+            started = time.monotonic()
+            try:
+                result = await get_llm_scheduler().run(
+                    model,
+                    lambda model=model: agent_for(model).run(prompt),
+                    estimated_tokens=estimated,
+                    tokens_of=usage_tokens,
+                )
+            except DeadlineExceeded:
+                model_stats.calls -= 1
+                raise
+            except Exception as e:
+                model_stats.latency += time.monotonic() - started
+                model_stats.rejected += 1
+                # Invalid output is the model's fault, anything else the server's
+                if not isinstance(e, UnexpectedModelBehavior):
+                    self.breaker.record_failure(model)
+                if is_last:
+                    raise
+                reason = f"error: {e}"
+            else:
+                run_tokens = usage_tokens(result)
+                model_stats.latency += time.monotonic() - started
+                model_stats.tokens += run_tokens
+                tokens += run_tokens
+                self.breaker.record_success(model)
+
+                reason = check(result.output)
+                if reason is None or is_last:
+                    logger.debug(
+                        "Model route answered",
+                        route=route,
+                        model=model,
+                        escalations=escalations,
+                        tokens=tokens,
+                    )
+                    return RoutedResult(result.output, model, tokens, escalations)
+                model_stats.rejected += 1
+
+            escalations += 1
+            stats.escalations += 1
+            logger.info(
+                "Escalating model route", route=route, model=model, reason=reason
+            )
+
+        raise RuntimeError(f"No model available for route {route!r}")
+
+    def log_stats(self) -> None:
+        """Log latency, token and escalation counters per route and model."""
+        for route, stats in self.stats.items():
+            logger.info(
+                "Model route stats",
+                route=route,
+                requests=stats.requests,
+                escalations=stats.escalations,
+                models={
+                    model: {
+                        "calls": m.calls,
+                        "rejected": m.rejected,
+                        "avg_latency": round(m.avg_latency, 2),
+                        "tokens": m.tokens,
+                    }
+                    for model, m in stats.models.items()
+                },
+            )
+
+
+# Global router instance
+_router: ModelRouter | None = None
+
+
+def reachable_models(models: Sequence[str]) -> list[str]:
+    """Drop the local models of a cascade when Ollama is not running.
+
+    The cascade is kept whole when it has no remote model to fall back on,
+    so that the error of the local server is reported.
+    """
+    from hireme.utils.providers import get_provider_name, ollama_available
+
+    remote = [model for model in models if get_provider_name(model) != "ollama"]
+    if not remote or len(remote) == len(models) or ollama_available():
+        return list(models)
+    skipped = [model for model in models if model not in remote]
+    logger.info("Ollama unreachable, skipping local models", models=skipped)
+    return remote
+
+
+def get_router() -> ModelRouter:
+    """Get the global model router (cascades from the config)."""
+    global _router
+    if _router is None:
+        from hireme.config import cfg
+
+        _router = ModelRouter(
+            {
+                "job_extraction": reachable_models(cfg.job_offer_models),
+                "resume": reachable_models(cfg.resume_models),
+            }
+        )
+    return _router
+
+
+# =============================================================================
+# Output checks
+# =============================================================================
+
+_PLACEHOLDERS = {"", "unknown", "n/a", "na", "none", "null", "not specified", "-"}
+
+
+def is_placeholder(value: str | None) -> bool:
+    """Check whether a required text field carries no information."""
+    return value is None or value.strip().lower() in _PLACEHOLDERS
+
+
+def first_placeholder(**values: str | None) -> str | None:
+    """Get an escalation reason naming the first placeholder field, if any."""
+    for name, value in values.items():
+        if is_placeholder(value):
+            return f"low-confidence {name}: {value!r}"
+    return None
@@ -0,0 +1,225 @@
+"""Locally cached prompt templates from Langfuse.
+
+Fetching a prompt from Langfuse is a network round trip; doing it for
+every resume of a `--all` run adds up. The registry keeps each template
+in memory for a TTL:
+
+- fresh entries are served directly
+- stale entries are served immediately while a background task refreshes
+  them (stale-while-revalidate)
+- when Langfuse is slow or unreachable and nothing is cached, the
+  template is read from `cfg.prompts_dir/<name>.md` (a slow fetch keeps
+  running and replaces it once it lands)
+
+Hits, stale hits, misses and disk fallbacks are counted and logged.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import structlog
+
+logger = structlog.get_logger(logger_name=__name__)
+
+PROMPT_TTL = 300.0  # seconds
+FETCH_TIMEOUT = 5  # seconds, per Langfuse request
+MISS_TIMEOUT = 2.0  # seconds waited for an uncached template before the file
+
+PromptSource = Literal["langfuse", "disk"]
+PromptLookup = Literal["hit", "stale", "miss", "fallback"]
+
+# Fetches (template, version) of a prompt name and label
+PromptFetcher = Callable[[str, str], tuple[str, int | None]]
+
+_VARIABLE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+@dataclass
+class CachedPrompt:
+    """A prompt template and where it came from."""
+
+    name: str
+    template: str
+    version: int | None
+    source: PromptSource
+    fetched_at: float
+
+    def compile(self, **variables: str) -> str:
+        """Fill the `{{variable}}` placeholders (unknown ones are kept)."""
+        return _VARIABLE.sub(
+            lambda m: variables.get(m.group(1), m.group(0)), self.template
+        )
+
+
+@dataclass
+class PromptStats:
+    """Counters for prompt lookups."""
+
+    hits: int = 0
+    stale_hits: int = 0  # served while refreshing
+    misses: int = 0  # fetched from Langfuse before answering
+    fallbacks: int = 0  # read from disk, Langfuse failing
+    refresh_errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.stale_hits + self.misses + self.fallbacks
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+def fetch_from_langfuse(name: str, label: str) -> tuple[str, int | None]:
+    """Fetch a text prompt template from Langfuse (blocking)."""
+    from langfuse import get_client
+
+    prompt = get_client().get_prompt(
+        name,
+        label=label,
+        type="text",
+        cache_ttl_seconds=0,  # the registry does the caching
+        max_retries=1,
+        fetch_timeout_seconds=FETCH_TIMEOUT,
+    )
+    return prompt.prompt, prompt.version
+
+
+class PromptRegistry:
+    """TTL cache of prompt templates in front of Langfuse."""
+
+    def __init__(
+        self,
+        fetch: PromptFetcher = fetch_from_langfuse,
+        fallback_dir: Path | None = None,
+        ttl: float = PROMPT_TTL,
+    ):
+        """
+        Args:
+            fetch: Loads (template, version) of a prompt name and label
+            fallback_dir: Directory of `<name>.md` templates (default:
+                cfg.prompts_dir)
+            ttl: Seconds before a cached template gets refreshed
+        """
+        self.fetch = fetch
+        self.fallback_dir = fallback_dir
+        self.ttl = ttl
+        self.stats = PromptStats()
+        self._entries: dict[tuple[str, str], CachedPrompt] = {}
+        self._fetches: dict[tuple[str, str], asyncio.Task[CachedPrompt]] = {}
+
+    async def get(self, name: str, label: str = "dev") -> CachedPrompt:
+        """Get a prompt template, from the cache when possible.
+
+        Raises:
+            FileNotFoundError: Langfuse failed and there is no file fallback
+        """
+        key = (name, label)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.monotonic() - entry.fetched_at < self.ttl:
+                self._record(entry, "hit")
+            else:
+                self._refresh(key)
+                self._record(entry, "stale")
+            return entry
+
+        try:
+            entry = await asyncio.wait_for(
+                asyncio.shield(self._refresh(key)), MISS_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning("Prompt fetch failed, using file", prompt=name, error=str(e))
+            entry = self._load_fallback(name)
+            self._entries[key] = entry  # Langfuse is retried once it is stale
+            self._record(entry, "fallback")
+        else:
+            self._record(entry, "miss")
+        return entry
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached templates (all of them, or those of a name)."""
+        for key in list(self._entries):
+            if name is None or key[0] == name:
+                del self._entries[key]
+
+    def _refresh(self, key: tuple[str, str]) -> asyncio.Task[CachedPrompt]:
+        """Start fetching a template, unless a fetch is already running."""
+        task = self._fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key))
+            self._fetches[key] = task
+
+            def done(task: asyncio.Task[CachedPrompt]) -> None:
+                self._fetches.pop(key, None)
+                if not task.cancelled():
+                    task.exception()  # background failures are logged in _fetch
+
+            task.add_done_callback(done)
+        return task
+
+    async def _fetch(self, key: tuple[str, str]) -> CachedPrompt:
+        name, label = key
+        try:
+            template, version = await asyncio.to_thread(self.fetch, name, label)
+        except Exception as e:
+            self.stats.refresh_errors += 1
+            if key in self._entries:
+                # Keep serving the stale copy; retry after another TTL
+                self._entries[key].fetched_at = time.monotonic()
+                logger.warning("Prompt refresh failed", prompt=name, error=str(e))
+            raise
+        entry = CachedPrompt(name, template, version, "langfuse", time.monotonic())
+        self._entries[key] = entry
+        return entry
+
+    def _load_fallback(self, name: str) -> CachedPrompt:
+        if self.fallback_dir is None:
+            from hireme.config import cfg
+
+            self.fallback_dir = cfg.prompts_dir
+        path = self.fallback_dir / f"{name}.md"
+        return CachedPrompt(name, path.read_text(), None, "disk", time.monotonic())
+
+    def _record(self, entry: CachedPrompt, lookup: PromptLookup) -> None:
+        if lookup == "hit":
+            self.stats.hits += 1
+        elif lookup == "stale":
+            self.stats.stale_hits += 1
+        elif lookup == "miss":
+            self.stats.misses += 1
+        else:
+            self.stats.fallbacks += 1
+        logger.debug(
+            "Prompt lookup",
+            prompt=entry.name,
+            lookup=lookup,
+            source=entry.source,
+            version=entry.version,
+        )
+
+    def log_stats(self) -> None:
+        """Log prompt cache counters."""
+        logger.info(
+            "Prompt cache",
+            hits=self.stats.hits,
+            stale_hits=self.stats.stale_hits,
+            misses=self.stats.misses,
+            fallbacks=self.stats.fallbacks,
+            refresh_errors=self.stats.refresh_errors,
+            hit_rate=round(self.stats.hit_rate, 3),
+        )
+
+
+# Global registry instance
+_prompt_registry: PromptRegistry | None = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get the process-wide prompt registry."""
+    global _prompt_registry
+    if _prompt_registry is None:
+        _prompt_registry = PromptRegistry()
+    return _prompt_registry
@@ -14,17 +14,22 @@ from pydantic_ai import Agent
 
 # from pydantic_ai.agent import Agent
 from hireme.agents.job_agent import JobDetails
+from hireme.agents.model_router import first_placeholder, get_router
+from hireme.agents.prompt_registry import get_prompt_registry
 from hireme.agents.prompts import SystemPrompts
 
 # from hireme.config import cfg
 # from hireme.utils.common import load_user_context_from_directory
 from hireme.utils.models.models import UserContext
 from hireme.utils.models.resume_models import GenerationFailed, TailoredResume
-from hireme.utils.providers import get_llm_model
-from hireme.utils.rendercv_helpers import (
-    generate_rendercv_input,
-    run_rendercv,
+from hireme.utils.providers import (
+    PROVIDER_CONCURRENCY,
+    get_llm_model,
+    get_provider_name,
 )
+from hireme.utils.render_cache import get_render_cache, render_cache_key
+from hireme.utils.render_pool import get_render_pool
+from hireme.utils.rendercv_helpers import build_rendercv_input, generate_rendercv_input
 
 logger = structlog.get_logger(logger_name=__name__)
 
@@ -32,33 +37,40 @@ logger = structlog.get_logger(logger_name=__name__)
 # Lazy-loaded globals
 # =============================================================================
 
-_langfuse_client = None
-_resume_agent = None
+_resume_agents: dict[str, Agent[None, TailoredResume | GenerationFailed]] = {}
 
 
-def get_langfuse_client():
-    """Get or create the Langfuse client lazily."""
-    global _langfuse_client
-    if _langfuse_client is None:
-        from langfuse import get_client
-
-        _langfuse_client = get_client()
-    return _langfuse_client
-
-
-def get_resume_agent() -> Agent[None, TailoredResume | GenerationFailed]:
-    """Get or create the resume agent lazily."""
-    global _resume_agent
-    if _resume_agent is None:
-        _resume_agent = Agent(
-            model=get_llm_model("mistral-medium-latest"),
+def get_resume_agent(
+    model: str = "mistral-medium-latest",
+) -> Agent[None, TailoredResume | GenerationFailed]:
+    """Get or create the resume agent of a model lazily."""
+    if model not in _resume_agents:
+        _resume_agents[model] = Agent(
+            model=get_llm_model(model),  # type: ignore[arg-type]
             # model=get_llm_model("default"),
             output_type=TailoredResume | GenerationFailed,
             retries=3,
             instructions=SystemPrompts.resume_agent_system_prompt(),
             name="Resume Agent",
         )
-    return _resume_agent
+    return _resume_agents[model]
+
+
+def resume_concurrency() -> int:
+    """Get how many resumes to tailor at once (the cascade's provider limit)."""
+    return max(
+        PROVIDER_CONCURRENCY[get_provider_name(model)]  # type: ignore[arg-type]
+        for model in get_router().models("resume")
+    )
+
+
+def resume_output_check(output: TailoredResume | GenerationFailed) -> str | None:
+    """Get why a resume should go to a bigger model (None if usable)."""
+    if isinstance(output, GenerationFailed):
+        return f"generation failed: {output.reason}"
+    if not output.experience and not output.education:
+        return "no experience nor education"
+    return first_placeholder(name=output.name, email=output.email)
 
 
 # Backwards compatibility: lazy wrapper for module-level access
@@ -103,10 +115,9 @@ async def tailor_resume_from_context(
     Returns:
         Structured TailoredResume based on given information
     """
-    langfuse = get_langfuse_client()
-    langfuse_prompt = langfuse.get_prompt("resume_agent_text", label="dev")
+    prompt_template = await get_prompt_registry().get("resume_agent_text", label="dev")
 
-    agent_prompt = langfuse_prompt.compile(
+    agent_prompt = prompt_template.compile(
         user_context=user_context.model_dump_json(indent=2),
         job_description=job.model_dump_json(indent=2),
     )
@@ -114,15 +125,26 @@ async def tailor_resume_from_context(
     # agent_history = convert_langfuse_to_pydantic_ai(agent_prompt)
     # current_prompt = agent_history[-1]
 
-    agent = get_resume_agent()
-    result = await agent.run(agent_prompt)
+    routed = await get_router().run(
+        "resume",
+        agent_prompt,
+        agent_for=get_resume_agent,
+        check=resume_output_check,
+    )
 
-    logger.info("Resume tailoring completed", usage=result.usage())
-    if isinstance(result.output, GenerationFailed):
-        logger.warning("Resume generation failed", reason=result.output.reason)
-        raise RuntimeError(f"Resume generation failed: {result.output.reason}")
-    elif isinstance(result.output, TailoredResume):
-        return result.output
+    logger.info(
+        "Resume tailoring completed",
+        model=routed.model,
+        escalations=routed.escalations,
+        tokens=routed.tokens,
+        prompt_source=prompt_template.source,
+        prompt_version=prompt_template.version,
+    )
+    if isinstance(routed.output, GenerationFailed):
+        logger.warning("Resume generation failed", reason=routed.output.reason)
+        raise RuntimeError(f"Resume generation failed: {routed.output.reason}")
+    elif isinstance(routed.output, TailoredResume):
+        return routed.output
     else:
         raise RuntimeError("Unexpected output type from resume agent")
 
@@ -132,16 +154,45 @@ async def tailor_resume_from_context(
 # =============================================================================
 
 
+async def render_resume(
+    tailored_resume: TailoredResume, output_dir: Path, use_cache: bool = True
+) -> Path:
+    """Write the RenderCV input of a tailored resume and render its PDF.
+
+    Rendering goes to the warm worker pool (see render_pool). With the
+    cache, a resume whose RenderCV input was rendered before reuses that
+    PDF (see render_cache).
+
+    Returns:
+        Path of the generated PDF
+    """
+    rendercv_input = build_rendercv_input(tailored_resume)
+    yaml_path = generate_rendercv_input(tailored_resume, output_dir, rendercv_input)
+    pdf_path = output_dir / f"{yaml_path.stem}.pdf"
+    key = render_cache_key(rendercv_input)
+    if use_cache and get_render_cache().get(key, pdf_path) is not None:
+        return pdf_path
+
+    # A PDF linked from the cache by an earlier run must not be rewritten in place
+    pdf_path.unlink(missing_ok=True)
+    pdf_path = await get_render_pool().render(yaml_path, output_dir)
+    if use_cache:
+        get_render_cache().put(key, pdf_path)
+    return pdf_path
+
+
 async def generate_resume(
-    candidate_profile: UserContext, structured_job: JobDetails, output_dir: Path
+    candidate_profile: UserContext,
+    structured_job: JobDetails,
+    output_dir: Path,
+    use_cache: bool = True,
 ):
     tailored_resume = await tailor_resume_from_context(
         user_context=candidate_profile, job=structured_job
     )
     if isinstance(tailored_resume, TailoredResume):
         logger.info("Tailored resume generated successfully")
-        yaml_path = generate_rendercv_input(tailored_resume, output_dir)
-        pdf_path = run_rendercv(yaml_path, output_dir)
+        pdf_path = await render_resume(tailored_resume, output_dir, use_cache)
         return tailored_resume, pdf_path
     else:
         logger.error("Resume generation failed", reason=tailored_resume.reason)
@@ -0,0 +1,212 @@
+"""Concurrent tailor -> render -> persist pipeline for resume generation.
+
+Tailoring a resume is an LLM call and rendering it a RenderCV job;
+running them one job after the other leaves both the provider and the
+CPU idle half of the time. Each stage here runs its own workers (N LLM
+workers, M render workers) fed through bounded queues, and every resume
+is persisted as soon as its PDF is ready.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from hireme.agents.job_agent import JobDetails
+from hireme.utils.models.resume_models import GenerationFailed, TailoredResume
+from hireme.utils.render_pool import DEFAULT_RENDER_WORKERS
+
+logger = structlog.get_logger(logger_name=__name__)
+
+STAGES = ("tailor", "render", "persist")
+
+
+@dataclass
+class ResumePipelineConfig:
+    """Worker counts and queue sizes of the resume pipeline."""
+
+    tailor_workers: int = 2  # LLM requests in flight
+    render_workers: int = DEFAULT_RENDER_WORKERS  # RenderCV renders at once
+    persist_workers: int = 1  # DB writes stay serialized
+    queue_size: int = 4
+
+
+@dataclass
+class ResumeItem:
+    """A job moving through the resume pipeline."""
+
+    job_id: int
+    job: JobDetails
+    output_dir: Path
+    resume: TailoredResume | None = None
+    pdf_path: Path | None = None
+    error: str | None = None  # set by the stage that failed
+    timings: dict[str, float] = field(default_factory=dict)  # seconds per stage
+
+
+@dataclass
+class StageStats:
+    """Counters and timings for one pipeline stage."""
+
+    done: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    busy: float = 0.0  # seconds, summed over items
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        runs = self.done + self.failed
+        return self.busy / runs if runs else 0.0
+
+
+@dataclass
+class ResumePipelineStats:
+    """Counters for every stage, keyed by stage name."""
+
+    stages: dict[str, StageStats] = field(
+        default_factory=lambda: {name: StageStats() for name in STAGES}
+    )
+    elapsed: float = 0.0  # wall-clock seconds
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self.stages[stage]
+
+
+ProgressCallback = Callable[[str, StageStats], None]
+
+# Marks the end of a stage's input
+_DONE: Any = object()
+
+
+async def run_resume_pipeline(
+    items: Sequence[ResumeItem],
+    tailor: Callable[[JobDetails], Awaitable[TailoredResume | GenerationFailed]],
+    render: Callable[[TailoredResume, Path], Awaitable[Path]],
+    persist: Callable[[ResumeItem], None],
+    config: ResumePipelineConfig | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> ResumePipelineStats:
+    """Run jobs through the tailor, render and persist stages.
+
+    Every item reaches `persist`: failed ones carry an `error` (and skip
+    the stages after the failure) so the caller can report them.
+
+    Args:
+        items: Jobs to generate resumes for
+        tailor: Coroutine tailoring a resume to a job
+        render: Coroutine rendering a tailored resume into an output dir
+        persist: Function saving or reporting an item (run in the event loop)
+        config: Worker counts and queue sizes
+        on_progress: Called with the stage name and its stats on each change
+
+    Returns:
+        Per-stage counters and timings
+    """
+    cfg = config or ResumePipelineConfig()
+    stats = ResumePipelineStats()
+    started = time.monotonic()
+
+    def report(stage: str) -> None:
+        if on_progress is not None:
+            on_progress(stage, stats[stage])
+
+    to_tailor: asyncio.Queue[ResumeItem] = asyncio.Queue()
+    to_render: asyncio.Queue[ResumeItem] = asyncio.Queue(maxsize=cfg.queue_size)
+    to_persist: asyncio.Queue[ResumeItem] = asyncio.Queue(maxsize=cfg.queue_size)
+    for item in items:
+        to_tailor.put_nowait(item)
+    to_tailor.put_nowait(_DONE)
+
+    async def do_tailor(item: ResumeItem) -> None:
+        output = await tailor(item.job)
+        if isinstance(output, GenerationFailed):
+            raise TypeError(f"Resume generation failed: {output.reason}")
+        item.resume = output
+
+    async def do_render(item: ResumeItem) -> None:
+        assert item.resume is not None
+        item.output_dir.mkdir(parents=True, exist_ok=True)
+        item.pdf_path = await render(item.resume, item.output_dir)
+
+    async def do_persist(item: ResumeItem) -> None:
+        persist(item)
+
+    stages = [
+        ("tailor", to_tailor, to_render, do_tailor, cfg.tailor_workers),
+        ("render", to_render, to_persist, do_render, cfg.render_workers),
+        ("persist", to_persist, None, do_persist, cfg.persist_workers),
+    ]
+    async with asyncio.TaskGroup() as group:
+        for name, inbox, outbox, handle, workers in stages:
+            group.create_task(
+                _run_stage(name, inbox, outbox, handle, workers, stats, report)
+            )
+
+    stats.elapsed = time.monotonic() - started
+    logger.info(
+        "Resume pipeline complete",
+        elapsed=round(stats.elapsed, 1),
+        **{
+            name: {"done": s.done, "failed": s.failed, "avg": round(s.avg_time, 2)}
+            for name, s in stats.stages.items()
+        },
+    )
+    return stats
+
+
+async def _run_stage(
+    name: str,
+    inbox: asyncio.Queue[ResumeItem],
+    outbox: asyncio.Queue[ResumeItem] | None,
+    handle: Callable[[ResumeItem], Awaitable[None]],
+    workers: int,
+    stats: ResumePipelineStats,
+    report: Callable[[str], None],
+) -> None:
+    """Run `workers` copies of a stage until its input is exhausted."""
+    stage = stats[name]
+
+    async def worker() -> None:
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                # Let the sibling workers see the end marker too
+                await inbox.put(_DONE)
+                return
+
+            # Items failed upstream only go on to be reported
+            if item.error is None or outbox is None:
+                stage.in_flight += 1
+                report(name)
+                started = time.monotonic()
+                try:
+                    await handle(item)
+                except Exception as e:
+                    logger.error(
+                        f"Resume pipeline {name} failed",
+                        job_id=item.job_id,
+                        error=str(e),
+                    )
+                    item.error = item.error or str(e)
+                    stage.failed += 1
+                else:
+                    stage.done += 1
+                finally:
+                    elapsed = time.monotonic() - started
+                    item.timings[name] = elapsed
+                    stage.in_flight -= 1
+                    stage.busy += elapsed
+                    stage.max_time = max(stage.max_time, elapsed)
+                report(name)
+
+            if outbox is not None:
+                await outbox.put(item)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, workers))])
+    if outbox is not None:
+        await outbox.put(_DONE)
@@ -41,13 +41,21 @@ def list_jobs(
     include_archived: Annotated[
         bool, typer.Option("--archived", help="Include archived jobs")
     ] = False,
-    limit: Annotated[int, typer.Option(help="Limit results")] = 20,
+    limit: Annotated[int, typer.Option(min=1, help="Limit results")] = 20,
+    after: Annotated[
+        Optional[int],
+        typer.Option("--after", help="Show jobs older than this job ID (next page)"),
+    ] = None,
 ):
     """List all job offers."""
     db = get_db()
-    jobs = db.get_all_jobs(
-        include_archived=include_archived, only_processed=processed_only
-    )[:limit]
+    page = db.list_job_summaries(
+        limit=limit,
+        after_id=after,
+        include_archived=include_archived,
+        only_processed=processed_only,
+    )
+    jobs = page.jobs
 
     if not jobs:
         console.print("[yellow]No job offers found.[/yellow]")
@@ -64,7 +72,6 @@ def list_jobs(
 
     for job in jobs:
         status = "✓ Parsed" if job.is_processed else "Raw"
-        resumes = len(job.resumes) if job.resumes else 0
         date = job.discovered_at.strftime("%Y-%m-%d")
 
         table.add_row(
@@ -73,11 +80,13 @@ def list_jobs(
             job.company_name[:20] if job.company_name else "N/A",
             (job.location or "N/A")[:15],
             status,
-            str(resumes),
+            str(job.resumes_count),
             date,
         )
 
     console.print(table)
+    if page.next_after is not None:
+        console.print(f"[dim]More jobs: --after {page.next_after}[/dim]")
 
 
 @jobs_app.command("show")
@@ -122,7 +131,7 @@ def search_jobs(
 ):
     """Search job offers by title or company."""
     db = get_db()
-    jobs = db.search_jobs(query)
+    jobs = db.search_job_summaries(query)
 
     if not jobs:
         console.print(f"[yellow]No jobs found matching '{query}'.[/yellow]")
@@ -368,6 +377,18 @@ def show_stats():
         bar = "█" * min(count, 20)
         console.print(f"  [{style}]{label:20}[/] {count:3} {bar}")
 
+    if stats["by_source"]:
+        console.print("\n[bold]Jobs by Source:[/bold]")
+        for source, count in stats["by_source"].items():
+            console.print(f"  {source:20} {count:3}")
+
+    # Most recent weeks only
+    if stats["by_week"]:
+        console.print("\n[bold]Jobs per Week:[/bold]")
+        for week, count in list(stats["by_week"].items())[-8:]:
+            bar = "█" * min(count, 20)
+            console.print(f"  Week of {week:12} {count:3} {bar}")
+
 
 @app.command("init")
 def init_db():
@@ -382,6 +403,7 @@ def import_existing():
     import json
 
     from hireme.config import cfg
+    from hireme.db.schemas import JobOfferCreate
 
     db = get_db()
     raw_dir = cfg.job_offers_dir / "raw"
@@ -389,8 +411,9 @@ def import_existing():
 
     imported = 0
 
-    # Import raw jobs
+    # Import raw jobs, in a single transaction
     if raw_dir.exists():
+        raw_jobs = []
         for f in raw_dir.glob("*.txt"):
             content = f.read_text()
             # Try to extract title and company from filename
@@ -402,13 +425,16 @@ def import_existing():
             title = parts[0] if parts else name
             company = parts[1] if len(parts) > 1 else "Unknown"
 
-            db.add_job_offer(
-                title=title,
-                company_name=company,
-                raw_text=content,
-                raw_file_path=str(f),
+            raw_jobs.append(
+                JobOfferCreate(
+                    title=title,
+                    company_name=company,
+                    raw_text=content,
+                    raw_file_path=str(f),
+                )
             )
-            imported += 1
+        results = db.upsert_job_offers(raw_jobs)
+        imported += sum(result.created for result in results)
 
     # Import processed jobs
     if processed_dir.exists():
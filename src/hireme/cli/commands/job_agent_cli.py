@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import structlog
 import typer
@@ -9,6 +9,9 @@ from rich.console import Console
 # from hireme.config import cfg
 # from hireme.db import JobSource, get_db
 
+if TYPE_CHECKING:
+    from hireme.db import JobSource
+
 logger = structlog.get_logger()
 console = Console()
 
@@ -32,6 +35,19 @@ def job_agent(
     export_dir: Annotated[
         Path | None, typer.Option(help="Directory to save the jobs data (legacy).")
     ] = None,
+    use_cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache/--no-cache", help="Reuse cached extractions of unchanged postings."
+        ),
+    ] = True,
+    skip_llm_when_complete: Annotated[
+        bool,
+        typer.Option(
+            help="Skip the LLM for postings whose title, company and location "
+            "the rule-based extractor already found."
+        ),
+    ] = False,
 ):
     """Find and extract job postings.
 
@@ -54,6 +70,8 @@ def job_agent(
             location=location,
             max_results_per_source=max_results_per_source,
             save_to_db=save_to_db,
+            use_cache=use_cache,
+            skip_llm_when_complete=skip_llm_when_complete,
         )
     )
 
@@ -65,110 +83,182 @@ async def _find_jobs(
     mode: Literal["scrapper", "testing"],
     save_to_db: bool,
     export_dir: Path | None,
+    use_cache: bool = True,
+    skip_llm_when_complete: bool = False,
 ):
-    """Find jobs and optionally save to database."""
+    """Find jobs and optionally save to database.
+
+    Postings flow through a concurrent search -> fetch -> clean -> extract
+    -> persist pipeline, so later pages are fetched while earlier ones are
+    being extracted.
+    """
     from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, track
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
     from hireme.agents.job_agent import (
         SAMPLE_POSTING,
         JobDetails,
         extract_job,
+        extraction_cache_stats,
+        extraction_concurrency,
+        extraction_stats,
+    )
+    from hireme.agents.job_pipeline import (
+        STAGES,
+        JobItem,
+        PipelineConfig,
+        StageStats,
+        run_job_pipeline,
     )
-    from hireme.scraper import get_job_page_async, get_job_urls_async
+    from hireme.agents.model_router import get_router
+    from hireme.scraper import BrowserManager, cleanup, iter_jobs_async
+    from hireme.scraper.offers_finder import DEFAULT_SOURCES
+    from hireme.scraper.offers_parser import clean_text, get_job_page_raw_async
+    from hireme.utils.llm_scheduler import get_llm_scheduler, scheduling
 
     console.print(Panel(f"Job Search - Mode: {mode}", style="bold blue"))
 
-    job_offers: list[dict[str, str]] = []
+    # Extraction workers follow the LLM provider's concurrency limit
+    pipeline_cfg = PipelineConfig(extract_workers=extraction_concurrency())
+
+    async def job_items():
+        if mode == "testing":
+            console.print(
+                Panel("Using sample job posting for extraction.", style="yellow")
+            )
+            yield JobItem(url="sample_url", raw=SAMPLE_POSTING)
+            return
+
+        console.print(Panel("Fetching live job postings...", style="yellow"))
+        async for result in iter_jobs_async(
+            query, location=location, max_results_per_source=max_results_per_source
+        ):
+            yield JobItem(url=result.url, source=result.source)
+
+    # Process and extract job details
+    if save_to_db:
+        from hireme.db import get_db
+
+        db = get_db()
+    else:
+        db = None
+    results_count = 0
+
+    def persist(item: JobItem) -> None:
+        nonlocal results_count
+        url = item.url
+        content = item.text or ""
+        result = item.result
+
+        if not isinstance(result, JobDetails):
+            reason = result.reason if result is not None else "no result"
+            console.print(f"[red]✗ Extraction failed: {reason}[/red]")
+            return
+
+        results_count += 1
+        console.print(
+            f"[green]✓ Extracted: {result.title} @ {result.company.name}[/green]"
+        )
+
+        # Save to database
+        if db:
+            job = db.add_job_offer(
+                title=result.title,
+                company_name=result.company.name,
+                url=url if url != "sample_url" else None,
+                source=_job_source(item.source),
+                location=result.location,
+                raw_text=content,
+            )
+            db.mark_job_processed(job.id, result.model_dump())
+            console.print(f"[dim]  → Saved to database (ID: {job.id})[/dim]")
+
+        # Legacy: save to files
+        if export_dir:
+            from hireme.utils.common import write_job_offer_to_json
+
+            processed_dir = export_dir / "processed"
+            raw_dir = export_dir / "raw"
+            processed_dir.mkdir(parents=True, exist_ok=True)
+            raw_dir.mkdir(parents=True, exist_ok=True)
+
+            write_job_offer_to_json(url, result.model_dump(), processed_dir)
+            raw_filename = f"job_{result.title}-{result.company.name}.txt"
+            (raw_dir / raw_filename).write_text(content)
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        if mode == "testing":
-            console.print(
-                Panel("Using sample job posting for extraction.", style="yellow")
-            )
-            job_offers = [{"url": "sample_url", "content": SAMPLE_POSTING}]
-        else:
-            console.print(Panel("Fetching live job postings...", style="yellow"))
-            job_urls = await get_job_urls_async(
-                query, location=location, max_results_per_source=max_results_per_source
+        tasks = {stage: progress.add_task(stage.capitalize()) for stage in STAGES}
+
+        def on_progress(stage: str, stats: StageStats) -> None:
+            progress.update(
+                tasks[stage],
+                description=(
+                    f"{stage.capitalize()}: {stats.done} done, "
+                    f"{stats.in_flight} running, {stats.failed} failed"
+                ),
             )
-            console.print(f"Found {len(job_urls)} job URLs to process.")
-
-            # for i, url in track(
-            #     enumerate(job_urls),
-            #     total=len(job_urls),
-            #     description="Fetching job postings...",
-            # ):
-            progress.add_task("Fetching job postings...", total=len(job_urls))
-            for url in job_urls:
-                job_posting = await get_job_page_async(url)
-                if job_posting:
-                    job_offers.append({"url": url, "content": job_posting})
-
-            # Process and extract job details
-            if save_to_db:
-                from hireme.db import get_db
-
-                db = get_db()
-            else:
-                db = None
-            results_count = 0
-
-            task = progress.add_task("Extracting job details...", total=len(job_offers))
-
-            # for posting in track(job_offers, description="Extracting job details..."):
-            logger.info(f"Processing {len(job_offers)} job postings")
-            for posting in job_offers:
-                # progress.advance(task)
-                url = posting.get("url", "")
-                content = posting["content"]
-
-                result = await extract_job(content)
-
-                if isinstance(result, JobDetails):
-                    results_count += 1
-                    console.print(
-                        f"[green]✓ Extracted: {result.title} @ {result.company.name}[/green]"
-                    )
-
-                    # Save to database
-                    if db:
-                        from hireme.db import JobSource
-
-                        job = db.add_job_offer(
-                            title=result.title,
-                            company_name=result.company.name,
-                            url=url if url != "sample_url" else None,
-                            source=JobSource.INDEED,  # TODO: detect source from URL
-                            location=result.location,
-                            raw_text=content,
-                        )
-                        db.mark_job_processed(job.id, result.model_dump())
-                        console.print(
-                            f"[dim]  → Saved to database (ID: {job.id})[/dim]"
-                        )
-
-                    # Legacy: save to files
-                    if export_dir:
-                        from hireme.utils.common import write_job_offer_to_json
-
-                        processed_dir = export_dir / "processed"
-                        raw_dir = export_dir / "raw"
-                        processed_dir.mkdir(parents=True, exist_ok=True)
-                        raw_dir.mkdir(parents=True, exist_ok=True)
-
-                        write_job_offer_to_json(url, result.model_dump(), processed_dir)
-                        raw_filename = f"job_{result.title}-{result.company.name}.txt"
-                        (raw_dir / raw_filename).write_text(content)
-                else:
-                    console.print(f"[red]✗ Extraction failed: {result.reason}[/red]")
 
-            console.print(
-                Panel(
-                    f"Completed: {results_count}/{len(job_offers)} jobs extracted",
-                    style="green" if results_count > 0 else "red",
-                )
+        if mode != "testing":
+            # One warm browser page per fetch worker, plus one per search
+            # crawl so result pages never wait behind posting fetches
+            await BrowserManager.set_pool_size(
+                pipeline_cfg.fetch_workers + len(DEFAULT_SOURCES)
             )
+        try:
+            # Search results are bulk work: interactive LLM requests go first
+            with scheduling("batch"):
+                stats = await run_job_pipeline(
+                    job_items(),
+                    fetch=get_job_page_raw_async,
+                    clean=clean_text,
+                    extract=lambda text: extract_job(
+                        text,
+                        use_cache=use_cache,
+                        skip_llm_when_complete=skip_llm_when_complete,
+                    ),
+                    persist=persist,
+                    config=pipeline_cfg,
+                    on_progress=on_progress,
+                )
+        finally:
+            if mode != "testing":
+                await cleanup()
+
+    logger.info(f"Processed {stats['extract'].done} job postings")
+    if (cache_stats := extraction_cache_stats()) is not None:
+        logger.info(
+            "Extraction cache",
+            hits=cache_stats.hits,
+            misses=cache_stats.misses,
+            hit_rate=round(cache_stats.hit_rate, 3),
+        )
+    llm_stats = extraction_stats()
+    logger.info(
+        "LLM extraction usage",
+        requests=llm_stats.requests,
+        tokens_per_posting=round(llm_stats.tokens_per_posting),
+    )
+    get_router().log_stats()
+    get_llm_scheduler().log_stats()
+    console.print(
+        Panel(
+            f"Completed: {results_count}/{stats['fetch'].done} jobs extracted",
+            style="green" if results_count > 0 else "red",
+        )
+    )
+
+
+def _job_source(source: str) -> "JobSource":
+    """Map a search source name to the database JobSource."""
+    from hireme.db import JobSource
+
+    return {
+        "indeed": JobSource.INDEED,
+        "wttj": JobSource.WELCOME_TO_THE_JUNGLE,
+        "linkedin": JobSource.LINKEDIN,
+        "": JobSource.MANUAL,
+    }.get(source, JobSource.OTHER)
@@ -5,6 +5,7 @@ Supports both database-based and file-based job loading.
 """
 
 import json
+from functools import partial
 from pathlib import Path
 from typing import Annotated
 
@@ -58,6 +59,25 @@ def generate(
     parse_job: bool = typer.Option(
         False, help="[Legacy] Parse raw job posting to extract structured job details."
     ),
+    use_cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache/--no-cache",
+            help="Reuse cached extractions and PDFs of unchanged inputs.",
+        ),
+    ] = True,
+    llm_workers: Annotated[
+        int | None,
+        typer.Option(
+            "--llm-workers",
+            min=1,
+            help="Concurrent resume tailoring requests (default: provider limit).",
+        ),
+    ] = None,
+    render_workers: Annotated[
+        int | None,
+        typer.Option("--render-workers", min=1, help="Concurrent RenderCV renders."),
+    ] = None,
 ):
     """Generate a tailored resume for a job posting.
 
@@ -89,6 +109,9 @@ def generate(
                 profile_dir=profile_dir,
                 profile_name=profile_name or "default",
                 output_dir=output_dir,
+                llm_workers=llm_workers,
+                render_workers=render_workers,
+                use_cache=use_cache,
             )
         )
     else:
@@ -104,6 +127,7 @@ def generate(
                 profile_dir=profile_dir,
                 output_dir=output_dir,
                 parse_job=parse_job,
+                use_cache=use_cache,
             )
         )
 
@@ -114,13 +138,34 @@ async def _generate_resume_from_db(
     profile_dir: Path,
     profile_name: str,
     output_dir: Path,
+    llm_workers: int | None = None,
+    render_workers: int | None = None,
+    use_cache: bool = True,
 ):
-    """Generate resumes from jobs stored in database."""
+    """Generate resumes from jobs stored in database.
+
+    Jobs go through a tailor -> render -> persist pipeline: LLM calls and
+    RenderCV runs overlap, and each resume is saved once its PDF is ready.
+    """
     from hireme.agents.job_agent import JobDetails
-    from hireme.agents.resume_agent import generate_resume
+    from hireme.agents.prompt_registry import get_prompt_registry
+    from hireme.agents.resume_agent import (
+        render_resume,
+        resume_concurrency,
+        tailor_resume_from_context,
+    )
+    from hireme.agents.resume_pipeline import (
+        DEFAULT_RENDER_WORKERS,
+        ResumeItem,
+        ResumePipelineConfig,
+        run_resume_pipeline,
+    )
     from hireme.db import get_db
     from hireme.utils.common import load_user_context_from_directory
-    from hireme.utils.models.resume_models import GenerationFailed
+    from hireme.utils.llm_scheduler import get_llm_scheduler, scheduling
+    from hireme.utils.render_cache import get_render_cache
+    from hireme.utils.render_pool import get_render_pool, shutdown_render_pool
+    from hireme.utils.rendercv_helpers import rendercv_input_path
 
     console = Console()
     db = get_db()
@@ -156,7 +201,7 @@ async def _generate_resume_from_db(
 
     elif all_jobs:
         # All processed jobs
-        all_db_jobs = db.get_all_jobs(only_processed=True)
+        all_db_jobs = db.get_all_jobs(only_processed=True, with_processed_data=True)
         for job in all_db_jobs:
             if job.processed_data:
                 job_details = JobDetails.model_validate(job.processed_data)
@@ -172,50 +217,68 @@ async def _generate_resume_from_db(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for db_job_id, job_details in jobs_to_process:
-        try:
-            resume_output_dir = (
-                output_dir / f"job_{db_job_id}_{job_details.company.name}"
-            )
-            resume_output_dir.mkdir(parents=True, exist_ok=True)
-
-            console.print(
-                f"[blue]Generating resume for: {job_details.title} @ {job_details.company.name}[/blue]"
-            )
-
-            tailored_resume, pdf_path = await generate_resume(
-                candidate_profile=user_context,
-                structured_job=job_details,
-                output_dir=resume_output_dir,
-            )
-
-            # Check if generation failed
-            if isinstance(tailored_resume, GenerationFailed):
-                console.print(
-                    f"[red]Resume generation failed: {tailored_resume.reason}[/red]"
-                )
-                continue
-
-            # Save to database
-            db.add_generated_resume(
-                job_offer_id=db_job_id,
-                profile_name=profile_name,
-                resume_data=tailored_resume.model_dump(),
-                pdf_path=str(pdf_path),
-                yaml_path=str(
-                    resume_output_dir
-                    / f"{tailored_resume.name.replace(' ', '_').lower()}_cv.yaml"
-                ),
-            )
+    def persist(item: ResumeItem) -> None:
+        job_label = f"{item.job.title} @ {item.job.company.name}"
+        if item.error is not None or item.resume is None:
+            console.print(f"[red]✗ {job_label} (job {item.job_id}): {item.error}[/red]")
+            return
+
+        # Save to database as soon as the PDF is ready
+        db.add_generated_resume(
+            job_offer_id=item.job_id,
+            profile_name=profile_name,
+            resume_data=item.resume.model_dump(),
+            pdf_path=str(item.pdf_path),
+            yaml_path=str(rendercv_input_path(item.resume, item.output_dir)),
+        )
+        console.print(f"[green]✓ {job_label} → {item.pdf_path}[/green]")
 
-            console.print("[green]✓ Resume generated and saved to database![/green]")
-            console.print(f"[blue]PDF saved to: {pdf_path}[/blue]")
+    items = [
+        ResumeItem(
+            job_id=db_job_id,
+            job=job_details,
+            output_dir=output_dir / f"job_{db_job_id}_{job_details.company.name}",
+        )
+        for db_job_id, job_details in jobs_to_process
+    ]
+    pipeline_cfg = ResumePipelineConfig(
+        tailor_workers=llm_workers or resume_concurrency(),
+        render_workers=render_workers or DEFAULT_RENDER_WORKERS,
+    )
 
-        except Exception as e:
-            console.print(
-                f"[red]Error generating resume for job {db_job_id}: {e}[/red]"
+    # --all yields its LLM budget to interactive requests, which give up
+    # instead of waiting indefinitely behind a saturated provider
+    if all_jobs:
+        llm_scheduling = scheduling("batch")
+    else:
+        from hireme.config import cfg
+
+        llm_scheduling = scheduling("interactive", timeout=cfg.llm_queue_timeout)
+
+    # Warm RenderCV workers, one per render worker
+    get_render_pool(pipeline_cfg.render_workers)
+    try:
+        with llm_scheduling:
+            stats = await run_resume_pipeline(
+                items,
+                tailor=lambda job: tailor_resume_from_context(user_context, job),
+                render=partial(render_resume, use_cache=use_cache),
+                persist=persist,
+                config=pipeline_cfg,
             )
-            logger.error("Error generating PDF", error=e, job_id=db_job_id)
+    finally:
+        shutdown_render_pool()
+
+    _print_stage_timings(console, stats)
+    render_stats = get_render_cache().stats
+    logger.info(
+        "Render cache",
+        hits=render_stats.hits,
+        misses=render_stats.misses,
+        hit_rate=round(render_stats.hit_rate, 3),
+    )
+    get_llm_scheduler().log_stats()
+    get_prompt_registry().log_stats()
 
 
 async def _generate_resume_from_files(
@@ -223,6 +286,7 @@ async def _generate_resume_from_files(
     profile_dir: Path,
     output_dir: Path,
     parse_job: bool = False,
+    use_cache: bool = True,
 ):
     """Async implementation of resume generation."""
     from hireme.agents.job_agent import JobDetails
@@ -230,6 +294,7 @@ async def _generate_resume_from_files(
     from hireme.config import cfg
     from hireme.utils.common import load_user_context_from_directory
     from hireme.utils.models.resume_models import GenerationFailed, TailoredResume
+    from hireme.utils.render_pool import shutdown_render_pool
 
     console = Console()
     # Determine job file path
@@ -262,7 +327,7 @@ async def _generate_resume_from_files(
     if parse_job:
         job_dir = job_dir / "raw"
         logger.debug("Loading raw job files from", job_dir=job_dir)
-        job_results = await process_raw_jobs(console, job_dir)
+        job_results = await process_raw_jobs(console, job_dir, use_cache=use_cache)
     else:
         job_dir = job_dir / "processed"
         logger.debug("Loading processed job files from", job_dir=job_dir)
@@ -286,6 +351,7 @@ async def _generate_resume_from_files(
                 candidate_profile=user_context,
                 structured_job=job_result,
                 output_dir=resume_output_dir,
+                use_cache=use_cache,
             )
             tailored_resumes.append(tailored_resume)
             console.print("[green]✓ Resume generated successfully![/green]")
@@ -294,6 +360,7 @@ async def _generate_resume_from_files(
         except Exception as e:
             console.print(f"[red]Error generating PDF: {e}[/red]")
             logger.error("Error generating PDF", error=e)
+    shutdown_render_pool()
 
 
 async def process_raw_jobs(
@@ -301,21 +368,20 @@ async def process_raw_jobs(
     job_dir: Annotated[
         Path, typer.Option(help="Directory containing job posting files.")
     ],
+    use_cache: bool = True,
 ) -> list:
     """Parse job postings to extract structured job details.
 
     Reads raw job posting text files from the specified directory
     and extracts structured job details into JSON files.
     """
-    from hireme.agents.job_agent import JobDetails, extract_job
+    from hireme.agents.job_agent import JobDetails, extract_jobs_batch
 
     logger.debug("Loading raw job files from", job_dir=job_dir)
     # console.print(Panel("Extracting job details from posting...", style="blue"))
+    job_texts = [job_file.read_text() for job_file in job_dir.glob("*.txt")]
     job_results: list[JobDetails] = []
-    for job_file in job_dir.glob("*.txt"):
-        # console.print(f"[blue]Processing job file: {job_file}[/blue]")
-        job_text = job_file.read_text()
-        job_result = await extract_job(job_text)
+    for job_result in await extract_jobs_batch(job_texts, use_cache=use_cache):
         if not isinstance(job_result, JobDetails):
             console.print(f"[red]Job extraction failed: {job_result.reason}[/red]")
             continue
@@ -354,3 +420,22 @@ def process_parsed_jobs(
             f"[green]Loaded job: {job_details.title} at {job_details.company.name}[/green]"
         )
     return job_results
+
+
+def _print_stage_timings(console: Console, stats) -> None:
+    """Print the per-stage counters and timings of a resume pipeline run."""
+    from rich.table import Table
+
+    table = Table(title=f"Resume generation ({stats.elapsed:.1f}s)")
+    for column in ("Stage", "Done", "Failed", "Avg (s)", "Max (s)", "Total (s)"):
+        table.add_column(column, justify="left" if column == "Stage" else "right")
+    for name, stage in stats.stages.items():
+        table.add_row(
+            name,
+            str(stage.done),
+            str(stage.failed),
+            f"{stage.avg_time:.2f}",
+            f"{stage.max_time:.2f}",
+            f"{stage.busy:.1f}",
+        )
+    console.print(table)
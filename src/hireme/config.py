@@ -91,6 +91,31 @@ class Config(BaseSettings):
     )
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
 
+    job_offer_models: list[str] = Field(
+        default=["qwen3:14b", "mistral-medium-latest"],
+        description="Job extraction model cascade: tried in order, escalating "
+        "on invalid or low-confidence output. Local models are skipped when "
+        "the Ollama server does not answer at startup.",
+    )
+    resume_models: list[str] = Field(
+        default=["qwen3:14b", "mistral-medium-latest"],
+        description="Resume tailoring model cascade: tried in order, escalating "
+        "on invalid or low-confidence output. Local models are skipped when "
+        "the Ollama server does not answer at startup.",
+    )
+
+    llm_queue_timeout: Optional[float] = Field(
+        default=300.0,
+        description="Seconds an interactive LLM request may wait for its "
+        "provider's budget before failing (None waits indefinitely).",
+    )
+
+    extraction_token_budget: int = Field(
+        default=3000,
+        description="Maximum tokens of posting text sent to the job extraction "
+        "LLM; longer postings are compacted (0 disables compaction).",
+    )
+
     project_root: Path = Field(
         default=Path.cwd(),
         description="Root directory for HireME project.",
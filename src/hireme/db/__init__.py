@@ -7,7 +7,10 @@ from hireme.db.database import (
     GeneratedResume,
     JobOffer,
     JobSource,
+    JobSummaryPage,
+    JobUpsertResult,
     get_db,
+    job_dedup_key,
 )
 
 __all__ = [
@@ -17,5 +20,8 @@ __all__ = [
     "GeneratedResume",
     "JobOffer",
     "JobSource",
+    "JobSummaryPage",
+    "JobUpsertResult",
     "get_db",
+    "job_dedup_key",
 ]
@@ -6,10 +6,13 @@ Simple SQLite-based database for tracking:
 - Application status and history
 """
 
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     JSON,
@@ -17,11 +20,19 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    and_,
     create_engine,
+    event,
+    func,
+    or_,
+    select,
+    text,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -29,10 +40,43 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
     selectinload,
+    undefer,
+    undefer_group,
 )
 
 from hireme.config import cfg
 
+if TYPE_CHECKING:
+    from hireme.db.schemas import JobOfferCreate, JobOfferSummary
+
+# Connection settings of the tuned engine: WAL lets readers run alongside a
+# writer, and commits only fsync at checkpoints (synchronous=NORMAL)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 10_000,  # ms to wait on a lock before "database is locked"
+    "cache_size": -64_000,  # negative: KiB, so 64 MB of page cache
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# Connections kept open, and extra ones allowed under load
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+
+# Counters kept up to date by triggers, so `db stats` reads a handful of
+# rows however many jobs there are. Names: jobs, jobs:processed,
+# jobs:source:<source>, jobs:week:<monday>, resumes, applications:<status>
+STATS_COUNTERS_DDL = """
+CREATE TABLE IF NOT EXISTS stats_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+)
+"""
+
+# Jobs per round of a bulk upsert (insert, then look up the known ones)
+UPSERT_CHUNK_SIZE = 500
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -88,13 +132,21 @@ class JobOffer(Base):
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     company_name: Mapped[str] = mapped_column(String(500), nullable=False)
     location: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # Normalized company and title (see job_dedup_key), unique among active jobs
+    dedup_key: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
 
     # Raw data storage
-    raw_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # raw_text and processed_data are large and deferred: loaded on first
+    # access, or upfront with undefer_group("payload")
+    raw_text: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="payload"
+    )
     raw_file_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
 
     # Processed data (JSON blob of JobDetails)
-    processed_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    processed_data: Mapped[Optional[dict]] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_group="payload"
+    )
     processed_file_path: Mapped[Optional[str]] = mapped_column(
         String(1024), nullable=True
     )
@@ -120,10 +172,46 @@ class JobOffer(Base):
         "Application", back_populates="job_offer", uselist=False
     )
 
+    __table_args__ = (
+        Index(
+            "ux_job_offers_dedup_key",
+            "dedup_key",
+            unique=True,
+            sqlite_where=text("is_archived = 0"),
+        ),
+        # Newest-first listing and keyset pagination
+        Index("ix_job_offers_discovered_at_id", "discovered_at", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<JobOffer(id={self.id}, title='{self.title}', company='{self.company_name}')>"
 
 
+def job_dedup_key(title: str, company_name: str) -> str:
+    """Key identifying a job offer across case, accent forms and spacing."""
+
+    def normalize(value: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+    return f"{normalize(company_name)}|{normalize(title)}"
+
+
+@dataclass
+class JobUpsertResult:
+    """Outcome of upserting one job offer."""
+
+    id: int
+    created: bool  # False when an active offer with the same key existed
+
+
+@dataclass
+class JobSummaryPage:
+    """One page of job summaries, newest first."""
+
+    jobs: list["JobOfferSummary"]
+    next_after: int | None  # pass as `after_id` for the next page, None at the end
+
+
 class GeneratedResume(Base):
     """A resume generated for a specific job offer and profile."""
 
@@ -133,7 +221,7 @@ class GeneratedResume(Base):
 
     # Foreign keys
     job_offer_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("job_offers.id"), nullable=False
+        Integer, ForeignKey("job_offers.id"), nullable=False, index=True
     )
     profile_name: Mapped[str] = mapped_column(
         String(255), nullable=False, default="default"
@@ -248,17 +336,110 @@ class Application(Base):
 class DatabaseManager:
     """Manager for database operations."""
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        tuned: bool = True,
+        pool_size: int = DB_POOL_SIZE,
+    ):
+        """
+        Args:
+            db_path: SQLite file (default: hireme.db in the hireme directory)
+            tuned: Open connections with SQLITE_PRAGMAS (WAL, relaxed fsync,
+                busy timeout); False keeps SQLite defaults
+            pool_size: Connections kept open by the engine
+        """
         if db_path is None:
             db_path = cfg.hireme_dir / "hireme.db"
 
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        self.tuned = tuned
+        if tuned:
+            self.engine = create_engine(
+                f"sqlite:///{db_path}",
+                echo=False,
+                pool_size=pool_size,
+                max_overflow=DB_MAX_OVERFLOW,
+                connect_args={
+                    "timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000,
+                    "check_same_thread": False,
+                },
+            )
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        else:
+            self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
         self._create_tables()
 
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.engine.dispose()
+
     def _create_tables(self):
         """Create all tables if they don't exist."""
         Base.metadata.create_all(self.engine)
+        self._add_dedup_keys()
+        self._add_stats_counters()
+
+        # Indexes added after a table was first created
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+    def _add_dedup_keys(self) -> None:
+        """Add and fill the dedup key of databases created without it.
+
+        When several active jobs share a key, only the oldest one gets it
+        (the others stay without a key) so that the unique index holds.
+        """
+        with self.engine.begin() as conn:
+            columns = {
+                row[1] for row in conn.exec_driver_sql("PRAGMA table_info(job_offers)")
+            }
+            if "dedup_key" in columns:
+                return
+            conn.exec_driver_sql(
+                "ALTER TABLE job_offers ADD COLUMN dedup_key VARCHAR(1024)"
+            )
+
+            rows = conn.execute(
+                select(
+                    JobOffer.id,
+                    JobOffer.title,
+                    JobOffer.company_name,
+                    JobOffer.is_archived,
+                ).order_by(JobOffer.id)
+            )
+            active: set[str] = set()
+            keys = []
+            for job_id, title, company_name, is_archived in rows:
+                key = job_dedup_key(title, company_name)
+                if not is_archived:
+                    if key in active:
+                        continue
+                    active.add(key)
+                keys.append((key, job_id))
+            if keys:
+                conn.exec_driver_sql(
+                    "UPDATE job_offers SET dedup_key = ? WHERE id = ?", keys
+                )
+
+    def _add_stats_counters(self) -> None:
+        """Create the stats counters and their triggers, counting existing rows."""
+        with self.engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE name = 'stats_counters'"
+            ).first()
+            conn.exec_driver_sql(STATS_COUNTERS_DDL)
+            for trigger in _stats_triggers():
+                conn.exec_driver_sql(trigger)
+            if not exists:
+                _recount_stats(conn)
+
+    def recount_stats(self) -> None:
+        """Rebuild the stats counters from the tables."""
+        with self.engine.begin() as conn:
+            _recount_stats(conn)
 
     def get_session(self) -> Session:
         """Get a new database session."""
@@ -278,34 +459,93 @@ class DatabaseManager:
         raw_text: str | None = None,
         raw_file_path: str | None = None,
     ) -> JobOffer:
-        """Add a new job offer to the database."""
-        with self.get_session() as session:
-            # Check for duplicates
-            existing = (
-                session.query(JobOffer)
-                .filter(
-                    JobOffer.title == title,
-                    JobOffer.company_name == company_name,
-                    JobOffer.is_archived == False,
+        """Add a new job offer, or return the active one with the same key."""
+        from hireme.db.schemas import JobOfferCreate
+
+        (result,) = self.upsert_job_offers(
+            [
+                JobOfferCreate(
+                    title=title,
+                    company_name=company_name,
+                    url=url,
+                    source=source,
+                    location=location,
+                    raw_text=raw_text,
+                    raw_file_path=raw_file_path,
                 )
-                .first()
-            )
-            if existing:
-                return existing
+            ]
+        )
+        with self.get_session() as session:
+            job = session.get(JobOffer, result.id, options=[undefer_group("payload")])
+            assert job is not None
+            return job
 
-            job = JobOffer(
-                title=title,
-                company_name=company_name,
-                url=url,
-                source=source.value,
-                location=location,
-                raw_text=raw_text,
-                raw_file_path=raw_file_path,
+    def upsert_job_offers(
+        self, jobs: Sequence["JobOfferCreate"]
+    ) -> list[JobUpsertResult]:
+        """Add job offers in a single transaction, skipping known ones.
+
+        Offers are matched on `job_dedup_key` against active (non-archived)
+        offers and earlier offers of the batch. The unique index does the
+        check: rows are written with INSERT ... ON CONFLICT DO NOTHING,
+        several per statement.
+
+        Returns:
+            The id of each offer, in input order, and whether it was created
+        """
+        keys = [job_dedup_key(job.title, job.company_name) for job in jobs]
+        ids: dict[str, int] = {}
+        created: set[str] = set()
+        insert = (
+            sqlite_insert(JobOffer)
+            .on_conflict_do_nothing(
+                index_elements=[JobOffer.dedup_key],
+                index_where=text("is_archived = 0"),
             )
-            session.add(job)
-            session.commit()
-            session.refresh(job)
-            return job
+            .returning(JobOffer.id, JobOffer.dedup_key)
+        )
+
+        with self.engine.begin() as conn:
+            for start in range(0, len(jobs), UPSERT_CHUNK_SIZE):
+                now = datetime.now()
+                chunk = range(start, min(start + UPSERT_CHUNK_SIZE, len(jobs)))
+                rows = [
+                    {
+                        "title": jobs[i].title,
+                        "company_name": jobs[i].company_name,
+                        "dedup_key": keys[i],
+                        "url": jobs[i].url,
+                        "source": JobSource(jobs[i].source).value,
+                        "location": jobs[i].location,
+                        "raw_text": jobs[i].raw_text,
+                        "raw_file_path": jobs[i].raw_file_path,
+                        "is_processed": False,
+                        "is_archived": False,
+                        "discovered_at": now,
+                        "last_updated": now,
+                    }
+                    for i in chunk
+                ]
+                # Compiled once, sent as multi-row INSERTs ("insertmanyvalues")
+                for job_id, key in conn.execute(insert, rows):
+                    ids[key] = job_id
+                    created.add(key)
+
+                existing = {keys[i] for i in chunk} - ids.keys()
+                if existing:
+                    rows = conn.execute(
+                        select(JobOffer.id, JobOffer.dedup_key).where(
+                            JobOffer.dedup_key.in_(existing),
+                            JobOffer.is_archived == False,
+                        )
+                    )
+                    ids.update({key: job_id for job_id, key in rows})
+
+        results = []
+        for key in keys:
+            results.append(JobUpsertResult(id=ids[key], created=key in created))
+            created.discard(key)  # repeats within the batch are not new
+        return results
 
     def mark_job_processed(
         self,
@@ -322,18 +562,34 @@ class DatabaseManager:
                 job.is_processed = True
                 job.processed_at = datetime.now(timezone.utc)
                 session.commit()
-                session.refresh(job)
+                # Reload with the payload, a refresh leaves it deferred
+                job = session.get(
+                    JobOffer,
+                    job_id,
+                    options=[undefer_group("payload")],
+                    populate_existing=True,
+                )
             return job
 
     def get_all_jobs(
-        self, include_archived: bool = False, only_processed: bool = False
+        self,
+        include_archived: bool = False,
+        only_processed: bool = False,
+        with_processed_data: bool = False,
     ) -> list[JobOffer]:
-        """Get all job offers."""
+        """Get all job offers.
+
+        `raw_text` and `processed_data` are not loaded (and cannot be read
+        from the returned jobs) unless `with_processed_data` asks for the
+        latter. Listings should use `list_job_summaries` instead.
+        """
         with self.get_session() as session:
             query = session.query(JobOffer).options(
                 selectinload(JobOffer.resumes),
                 selectinload(JobOffer.application),
             )
+            if with_processed_data:
+                query = query.options(undefer(JobOffer.processed_data))
             if not include_archived:
                 query = query.filter(JobOffer.is_archived == False)
             if only_processed:
@@ -343,12 +599,70 @@ class DatabaseManager:
             session.expunge_all()
             return jobs
 
+    def list_job_summaries(
+        self,
+        limit: int = 20,
+        after_id: int | None = None,
+        include_archived: bool = False,
+        only_processed: bool = False,
+    ) -> JobSummaryPage:
+        """Get a page of job summaries, newest first.
+
+        Only the summary columns are selected (see `_summary_select`), and
+        filtered, ordered and limited in SQL, with keyset pagination on
+        (discovered_at, id).
+
+        Args:
+            limit: Jobs per page
+            after_id: Last job of the previous page (None for the first page)
+            include_archived: Include archived jobs
+            only_processed: Only jobs with extracted data
+
+        Raises:
+            ValueError: If limit is lower than 1
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+
+        query = (
+            _summary_select()
+            .order_by(JobOffer.discovered_at.desc(), JobOffer.id.desc())
+            .limit(limit + 1)
+        )
+        if not include_archived:
+            query = query.where(JobOffer.is_archived == False)
+        if only_processed:
+            query = query.where(JobOffer.is_processed == True)
+
+        with self.get_session() as session:
+            if after_id is not None:
+                after_date = session.scalar(
+                    select(JobOffer.discovered_at).where(JobOffer.id == after_id)
+                )
+                if after_date is None:
+                    return JobSummaryPage(jobs=[], next_after=None)
+                query = query.where(
+                    or_(
+                        JobOffer.discovered_at < after_date,
+                        and_(
+                            JobOffer.discovered_at == after_date,
+                            JobOffer.id < after_id,
+                        ),
+                    )
+                )
+            rows = session.execute(query).all()
+
+        jobs = _to_summaries(rows[:limit])
+        next_after = jobs[-1].id if len(rows) > limit else None
+        return JobSummaryPage(jobs=jobs, next_after=next_after)
+
     def get_job_by_id(self, job_id: int) -> JobOffer | None:
-        """Get a job offer by ID."""
+        """Get a job offer by ID, with all its data."""
         with self.get_session() as session:
             job = (
                 session.query(JobOffer)
                 .options(
+                    undefer_group("payload"),
                     selectinload(JobOffer.resumes),
                     selectinload(JobOffer.application),
                 )
@@ -379,6 +693,20 @@ class DatabaseManager:
             session.expunge_all()
             return jobs
 
+    def search_job_summaries(
+        self, query: str, include_archived: bool = False
+    ) -> list["JobOfferSummary"]:
+        """Search jobs by title or company name, as summaries (newest first)."""
+        q = _summary_select().where(
+            (JobOffer.title.ilike(f"%{query}%"))
+            | (JobOffer.company_name.ilike(f"%{query}%"))
+        )
+        if not include_archived:
+            q = q.where(JobOffer.is_archived == False)
+        q = q.order_by(JobOffer.discovered_at.desc(), JobOffer.id.desc())
+        with self.get_session() as session:
+            return _to_summaries(session.execute(q).all())
+
     def archive_job(self, job_id: int) -> bool:
         """Archive a job offer."""
         with self.get_session() as session:
@@ -527,22 +855,160 @@ class DatabaseManager:
             )
 
     def get_application_stats(self) -> dict:
-        """Get statistics about applications."""
-        with self.get_session() as session:
-            stats = {}
-            for status in ApplicationStatus:
-                count = (
-                    session.query(Application)
-                    .filter(Application.status == status.value)
-                    .count()
-                )
-                stats[status.value] = count
-            stats["total_jobs"] = session.query(JobOffer).count()
-            stats["processed_jobs"] = (
-                session.query(JobOffer).filter(JobOffer.is_processed == True).count()
+        """Get statistics about applications, jobs and resumes.
+
+        Read from the trigger-maintained `stats_counters` table in a single
+        query, so the cost does not grow with the number of jobs.
+
+        Returns:
+            Counts per application status, total_jobs, processed_jobs and
+            total_resumes, plus jobs per source (by_source) and per week
+            (by_week, keyed by the week's Monday, oldest first)
+        """
+        with self.engine.connect() as conn:
+            counters = dict(
+                conn.exec_driver_sql("SELECT name, value FROM stats_counters").all()
             )
-            stats["total_resumes"] = session.query(GeneratedResume).count()
-            return stats
+
+        stats: dict = {
+            status.value: counters.get(f"applications:{status.value}", 0)
+            for status in ApplicationStatus
+        }
+        stats["total_jobs"] = counters.get("jobs", 0)
+        stats["processed_jobs"] = counters.get("jobs:processed", 0)
+        stats["total_resumes"] = counters.get("resumes", 0)
+        breakdowns = {"by_source": "jobs:source:", "by_week": "jobs:week:"}
+        for breakdown, prefix in breakdowns.items():
+            stats[breakdown] = {
+                name.removeprefix(prefix): value
+                for name, value in sorted(counters.items())
+                if name.startswith(prefix) and value
+            }
+        return stats
+
+
+def _summary_select():
+    """Select the JobOfferSummary columns of job offers, and nothing else.
+
+    Resume counts come from a count subquery and the application status
+    from a join, so neither relationship is loaded.
+    """
+    resumes_count = (
+        select(func.count(GeneratedResume.id))
+        .where(GeneratedResume.job_offer_id == JobOffer.id)
+        .scalar_subquery()
+    )
+    return select(
+        JobOffer.id,
+        JobOffer.title,
+        JobOffer.company_name,
+        JobOffer.location,
+        JobOffer.source,
+        JobOffer.is_processed,
+        JobOffer.discovered_at,
+        resumes_count.label("resumes_count"),
+        Application.status.label("application_status"),
+    ).outerjoin(Application, Application.job_offer_id == JobOffer.id)
+
+
+def _to_summaries(rows) -> list["JobOfferSummary"]:
+    """Build summaries from rows of `_summary_select`."""
+    from hireme.db.schemas import JobOfferSummary
+
+    return [
+        JobOfferSummary(**row._mapping, has_resume=row.resumes_count > 0)
+        for row in rows
+    ]
+
+
+# Week of a job, as the date of its Monday
+_JOB_WEEK = "date({row}.discovered_at, 'weekday 0', '-6 days')"
+
+
+def _bump(name: str, delta: str) -> str:
+    return (
+        f"INSERT INTO stats_counters (name, value) VALUES ({name}, {delta}) "
+        f"ON CONFLICT (name) DO UPDATE SET value = value + ({delta});"
+    )
+
+
+def _job_bumps(row: str, sign: str) -> str:
+    """Counter updates adding (sign "+") or removing ("-") a job row."""
+    return "".join(
+        [
+            _bump("'jobs'", f"{sign}1"),
+            _bump("'jobs:processed'", f"{sign}{row}.is_processed"),
+            _bump(f"'jobs:source:' || ifnull({row}.source, '')", f"{sign}1"),
+            _bump(f"'jobs:week:' || {_JOB_WEEK.format(row=row)}", f"{sign}1"),
+        ]
+    )
+
+
+def _stats_triggers() -> list[str]:
+    """Triggers keeping `stats_counters` in step with the tables."""
+    triggers = {
+        "job_offers_ai": ("AFTER INSERT ON job_offers", _job_bumps("NEW", "+")),
+        "job_offers_ad": ("AFTER DELETE ON job_offers", _job_bumps("OLD", "-")),
+        "job_offers_au": (
+            "AFTER UPDATE OF is_processed, source, discovered_at ON job_offers",
+            _job_bumps("OLD", "-") + _job_bumps("NEW", "+"),
+        ),
+        "generated_resumes_ai": (
+            "AFTER INSERT ON generated_resumes",
+            _bump("'resumes'", "1"),
+        ),
+        "generated_resumes_ad": (
+            "AFTER DELETE ON generated_resumes",
+            _bump("'resumes'", "-1"),
+        ),
+        "applications_ai": (
+            "AFTER INSERT ON applications",
+            _bump("'applications:' || ifnull(NEW.status, '')", "1"),
+        ),
+        "applications_ad": (
+            "AFTER DELETE ON applications",
+            _bump("'applications:' || ifnull(OLD.status, '')", "-1"),
+        ),
+        "applications_au": (
+            "AFTER UPDATE OF status ON applications",
+            _bump("'applications:' || ifnull(OLD.status, '')", "-1")
+            + _bump("'applications:' || ifnull(NEW.status, '')", "1"),
+        ),
+    }
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS stats_{name} {event_} BEGIN {body} END"
+        for name, (event_, body) in triggers.items()
+    ]
+
+
+def _recount_stats(conn) -> None:
+    """Fill `stats_counters` from grouped counts of the tables."""
+    week = _JOB_WEEK.format(row="job_offers")
+    conn.exec_driver_sql("DELETE FROM stats_counters")
+    conn.exec_driver_sql(
+        f"""
+        INSERT INTO stats_counters (name, value)
+        SELECT 'jobs', COUNT(*) FROM job_offers
+        UNION ALL SELECT 'jobs:processed', COUNT(*) FROM job_offers WHERE is_processed
+        UNION ALL SELECT 'resumes', COUNT(*) FROM generated_resumes
+        UNION ALL SELECT 'jobs:source:' || ifnull(source, ''), COUNT(*)
+            FROM job_offers GROUP BY source
+        UNION ALL SELECT 'jobs:week:' || {week}, COUNT(*) FROM job_offers
+            GROUP BY {week}
+        UNION ALL SELECT 'applications:' || ifnull(status, ''), COUNT(*)
+            FROM applications GROUP BY status
+        """
+    )
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Set SQLITE_PRAGMAS on each new pooled connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
 
 
 # =============================================================================
@@ -24,6 +24,7 @@ class JobOfferSummary(BaseModel):
     source: str
     is_processed: bool
     has_resume: bool = False
+    resumes_count: int = 0
     application_status: str | None = None
     discovered_at: datetime
 
@@ -62,6 +63,7 @@ class JobOfferCreate(BaseModel):
     source: JobSource = JobSource.OTHER
     location: str | None = None
     raw_text: str | None = None
+    raw_file_path: str | None = None
 
 
 # =============================================================================
@@ -181,6 +183,8 @@ class ApplicationStats(BaseModel):
     accepted: int
     rejected: int
     withdrawn: int
+    by_source: dict[str, int] = {}
+    by_week: dict[str, int] = {}  # keyed by the week's Monday (YYYY-MM-DD)
 
     @property
     def application_rate(self) -> float:
@@ -1,5 +1,3 @@
-from textwrap import dedent
-
 from hireme.config import cfg
 
 # Lazy-loaded langfuse client
@@ -51,27 +49,9 @@ def setup_lgfuse_prompts(prompt_name, prompt_file, prompt_role: str = "system"):
 
 def setup_all_prompts():
     """Setup all Langfuse prompts. Call this explicitly when needed."""
-    langfuse = get_langfuse()
     setup_lgfuse_prompts("system_resume_agent", "resume_agent_system_prompt")
-    langfuse.create_prompt(
-        name="resume_agent_text",
-        type="text",
-        prompt=dedent(
-            """
-        UserContext (as json):
-        ```
-        {{user_context}}
-        ```
-
-        JobDescription (as json):
-        ```
-        {{job_description}}
-        ```
-        Generate a tailored resume based on the job description.
-        """
-        ),
-        labels=["dev"],  # directly promote to production
-    )
+    # Same file the prompt registry falls back to when Langfuse is down
+    setup_lgfuse_prompts("resume_agent_text", "resume_agent_text")
 
 
 # Only run setup when this module is executed directly
@@ -6,7 +6,7 @@ Migrated from Selenium to Playwright for:
 - Native async support
 - Shared browser instance (reduced overhead)
 - Built-in resource blocking
-- URL caching to avoid duplicate requests
+- URL caching to avoid duplicate requests (persisted on disk across runs)
 """
 
 # Legacy sync imports (backwards compatible)
@@ -15,6 +15,7 @@ from .offers_finder import (
     JobSearchResult,
     get_job_urls,
     get_job_urls_async,
+    iter_jobs_async,
     search_jobs,
     search_jobs_async,
 )
@@ -32,6 +33,7 @@ from .playwright_scraper import (
     ScraperConfig,
     cleanup,
     get_cache,
+    get_page_store,
 )
 
 __all__ = [
@@ -46,10 +48,12 @@ __all__ = [
     "get_job_page_async",
     "get_job_pages_async",
     "get_page_text_async",
+    "iter_jobs_async",
     "search_jobs_async",
     # Utilities
     "BrowserManager",
     "ScraperConfig",
     "get_cache",
+    "get_page_store",
     "cleanup",
 ]
@@ -0,0 +1,260 @@
+"""HTTP-first fetch path for server-rendered job pages.
+
+Many job boards (Lever, Greenhouse, Workable, Indeed's description block)
+ship the posting in the initial HTML. Fetching those with a pooled HTTP
+client and parsing it is far cheaper than a Chromium navigation; the
+browser is only needed when the known selector is missing (JavaScript-only
+pages, bot walls...). Both paths extract the same page region, so cached
+content does not depend on which one fetched it.
+
+A per-domain router remembers which path worked so that domains that
+never serve static content stop paying for the extra HTTP request.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import httpx
+import structlog
+from bs4 import BeautifulSoup
+
+from hireme.scraper.rate_limiter import FetchOutcome
+from hireme.utils.retry_after import parse_retry_after
+
+if TYPE_CHECKING:
+    from hireme.scraper.playwright_scraper import ScraperConfig
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Below this length an element most likely holds a JS placeholder
+MIN_CONTENT_LENGTH = 200
+
+# Page regions holding the posting (title, company, description), tried in
+# order before falling back to the whole body
+MAIN_CONTENT_SELECTORS = [
+    "article",
+    "[role='main']",
+    ".job-description",
+    ".job-details",
+    ".job-posting",
+    "#job-content",
+    "main",
+]
+
+
+# =============================================================================
+# Pooled HTTP client
+# =============================================================================
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client(config: "ScraperConfig") -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it lazily."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            headers={
+                "User-Agent": config.user_agent,
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+            },
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_connections,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# =============================================================================
+# Static extraction
+# =============================================================================
+
+
+def extract_main_content(html: str, selector: str) -> str | None:
+    """Extract the main content of a server-rendered page from raw HTML.
+
+    `selector` (the job description) only tells whether the page is
+    server-rendered; the text returned is the region the browser path
+    extracts: the first of MAIN_CONTENT_SELECTORS with enough text, or the
+    body.
+
+    Returns:
+        The page text, or None when the selector element is missing or too
+        short to be the rendered posting.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+
+    element = soup.select_one(selector)
+    if element is None or len(element.get_text(strip=True)) < MIN_CONTENT_LENGTH:
+        return None
+
+    for content_selector in MAIN_CONTENT_SELECTORS:
+        region = soup.select_one(content_selector)
+        if region is not None:
+            text = region.get_text("\n", strip=True)
+            if len(text) > MIN_CONTENT_LENGTH:
+                return text
+
+    body = soup.body or soup
+    return body.get_text("\n", strip=True)
+
+
+async def fetch_static_content(
+    url: str,
+    selector: str,
+    timeout: int,
+    config: "ScraperConfig",
+    outcome: FetchOutcome | None = None,
+) -> str | None:
+    """Fetch a page over plain HTTP and extract its main content.
+
+    Args:
+        url: URL to fetch
+        selector: CSS selector of the job description, which must be in the
+            HTML for the page to be used
+        timeout: Timeout in milliseconds
+        config: Scraper configuration
+        outcome: Filled with the status, timeout and Retry-After, if given
+
+    Returns:
+        Extracted text, or None if the browser is needed
+    """
+    client = get_http_client(config)
+    try:
+        response = await client.get(url, timeout=timeout / 1000)
+    except httpx.TimeoutException as e:
+        logger.debug("HTTP fetch timed out", url=url, error=str(e))
+        if outcome is not None:
+            outcome.timed_out = True
+        return None
+    except httpx.HTTPError as e:
+        logger.debug("HTTP fetch failed", url=url, error=str(e))
+        return None
+
+    if outcome is not None:
+        outcome.status = response.status_code
+        if response.status_code in (429, 503):
+            outcome.retry_after = parse_retry_after(response.headers.get("retry-after"))
+
+    if response.status_code >= 400:
+        logger.debug("HTTP fetch rejected", url=url, status=response.status_code)
+        return None
+
+    return extract_main_content(response.text, selector)
+
+
+# =============================================================================
+# Per-domain routing
+# =============================================================================
+
+
+@dataclass
+class RouteStats:
+    """Outcome counters of the HTTP path for one domain."""
+
+    http_ok: int = 0
+    http_failed: int = 0
+    skipped: int = 0  # browser-routed fetches since the last HTTP probe
+
+
+class FetchRouter:
+    """Learns per domain whether the HTTP path is worth trying.
+
+    A domain is routed to the browser once the HTTP path failed
+    `min_failures` times and clearly more often than it worked. Such
+    domains are still probed over HTTP every `reprobe_every` fetches in
+    case they changed. Stats are persisted in the page store so routing
+    survives across runs.
+    """
+
+    KEY_PREFIX = "route:"
+
+    def __init__(self, min_failures: int = 2, reprobe_every: int = 20):
+        self.min_failures = min_failures
+        self.reprobe_every = reprobe_every
+        self._routes: dict[str, RouteStats] = {}
+
+    def should_try_http(self, url: str) -> bool:
+        """Decide whether to try the HTTP path for this URL."""
+        stats = self._get(_domain(url))
+        if stats.http_failed < self.min_failures:
+            return True
+        if stats.http_failed <= 2 * stats.http_ok:
+            return True
+
+        stats.skipped += 1
+        if stats.skipped >= self.reprobe_every:
+            stats.skipped = 0
+            return True
+        return False
+
+    def record(self, url: str, ok: bool) -> None:
+        """Record the outcome of an HTTP attempt."""
+        domain = _domain(url)
+        stats = self._get(domain)
+        if ok:
+            stats.http_ok += 1
+        else:
+            stats.http_failed += 1
+        self._save(domain, stats)
+
+    def preferred_path(self, url: str) -> str:
+        """Get the currently learned path for a URL's domain."""
+        stats = self._get(_domain(url))
+        if stats.http_failed >= self.min_failures and (
+            stats.http_failed > 2 * stats.http_ok
+        ):
+            return "browser"
+        return "http"
+
+    def _get(self, domain: str) -> RouteStats:
+        if domain not in self._routes:
+            self._routes[domain] = self._load(domain)
+        return self._routes[domain]
+
+    def _load(self, domain: str) -> RouteStats:
+        from hireme.scraper.playwright_scraper import get_page_store
+
+        raw = get_page_store().get(self.KEY_PREFIX + domain)
+        if raw is None:
+            return RouteStats()
+        try:
+            return RouteStats(**json.loads(raw))
+        except (TypeError, ValueError):
+            return RouteStats()
+
+    def _save(self, domain: str, stats: RouteStats) -> None:
+        from hireme.scraper.playwright_scraper import get_page_store
+
+        # Routing knowledge outlives page content
+        get_page_store().set(
+            self.KEY_PREFIX + domain, json.dumps(asdict(stats)), ttl=30 * 24 * 3600
+        )
+
+
+def _domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+# Global router instance
+_router = FetchRouter()
+
+
+def get_router() -> FetchRouter:
+    """Get the global fetch router."""
+    return _router
@@ -5,6 +5,7 @@ Migrated to Playwright for better async support and resource efficiency.
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from urllib.parse import quote_plus, urljoin
 
@@ -13,6 +14,12 @@ from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from hireme.scraper.playwright_scraper import BrowserManager
+from hireme.scraper.retry import (
+    RetryableError,
+    backoff_delay,
+    get_breaker,
+    is_retryable_status,
+)
 
 logger = structlog.get_logger(logger_name=__name__)
 
@@ -33,6 +40,28 @@ class JobSearchResult:
 # =============================================================================
 
 
+# Runs in the page: collects every card field in a single CDP round trip
+_EXTRACT_CARDS_JS = """
+([cardSelector, linkSelector, titleSelector, companySelector, locationSelector, maxResults]) => {
+    const text = (root, selector) => {
+        const element = root.querySelector(selector);
+        return element ? element.innerText : null;
+    };
+    return Array.from(document.querySelectorAll(cardSelector))
+        .slice(0, maxResults)
+        .map((card) => {
+            const link = card.querySelector(linkSelector);
+            return {
+                url: link ? link.getAttribute("href") : null,
+                title: text(card, titleSelector),
+                company: text(card, companySelector),
+                location: text(card, locationSelector),
+            };
+        });
+}
+"""
+
+
 async def _extract_job_card(
     page: Page,
     card_selector: str,
@@ -44,7 +73,98 @@ async def _extract_job_card(
     max_results: int,
     base_url: str = "",
 ) -> list[JobSearchResult]:
-    """Generic job card extractor for any job board."""
+    """Generic job card extractor for any job board.
+
+    Extracts all cards with one `page.evaluate` call, falling back to
+    per-element queries if the batched extraction fails.
+    """
+    cards = await _extract_job_cards_batched(
+        page,
+        card_selector,
+        link_selector,
+        title_selector,
+        company_selector,
+        location_selector,
+        max_results,
+    )
+    if cards is None:
+        return await _extract_job_card_per_element(
+            page,
+            card_selector,
+            link_selector,
+            title_selector,
+            company_selector,
+            location_selector,
+            source,
+            max_results,
+            base_url,
+        )
+
+    results = []
+    for card in cards:
+        url = card.get("url")
+        if not url:
+            continue
+        results.append(
+            JobSearchResult(
+                url=_absolute_url(url, base_url),
+                title=card.get("title"),
+                company=card.get("company"),
+                location=card.get("location"),
+                source=source,
+            )
+        )
+    return results
+
+
+async def _extract_job_cards_batched(
+    page: Page,
+    card_selector: str,
+    link_selector: str,
+    title_selector: str,
+    company_selector: str,
+    location_selector: str,
+    max_results: int,
+) -> list[dict] | None:
+    """Extract raw card fields in a single round trip.
+
+    Returns:
+        List of dicts with url/title/company/location keys, or None if the
+        in-page extraction failed.
+    """
+    try:
+        cards = await page.evaluate(
+            _EXTRACT_CARDS_JS,
+            [
+                card_selector,
+                link_selector,
+                title_selector,
+                company_selector,
+                location_selector,
+                max_results,
+            ],
+        )
+    except Exception as e:
+        logger.debug("Batched card extraction failed", error=str(e))
+        return None
+
+    if not isinstance(cards, list):
+        return None
+    return [card for card in cards if isinstance(card, dict)]
+
+
+async def _extract_job_card_per_element(
+    page: Page,
+    card_selector: str,
+    link_selector: str,
+    title_selector: str,
+    company_selector: str,
+    location_selector: str,
+    source: str,
+    max_results: int,
+    base_url: str = "",
+) -> list[JobSearchResult]:
+    """Per-element job card extractor (one round trip per field)."""
     results = []
 
     cards = await page.query_selector_all(card_selector)
@@ -59,8 +179,7 @@ async def _extract_job_card(
                 continue
 
             # Convert relative URLs to absolute
-            if not url.startswith(("http://", "https://")):
-                url = urljoin(base_url, url)
+            url = _absolute_url(url, base_url)
 
             # Extract title
             title = None
@@ -95,10 +214,209 @@ async def _extract_job_card(
     return results
 
 
+def _absolute_url(url: str, base_url: str) -> str:
+    """Convert relative URLs to absolute."""
+    if not url.startswith(("http://", "https://")):
+        return urljoin(base_url, url)
+    return url
+
+
+# =============================================================================
+# Paginated source specs
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _SourceSpec:
+    """Selectors and URL scheme of a paginated job board."""
+
+    name: str
+    label: str  # used in log messages
+    base_url: str
+    wait_selector: str
+    card_selector: str
+    link_selector: str
+    title_selector: str
+    company_selector: str
+    location_selector: str
+    page_size: int
+    build_url: Callable[[str, str, int], str]  # (query, location, page_index)
+
+    def card_selectors(self) -> dict[str, str]:
+        """Selectors in the shape expected by _extract_job_card."""
+        return {
+            "card_selector": self.card_selector,
+            "link_selector": self.link_selector,
+            "title_selector": self.title_selector,
+            "company_selector": self.company_selector,
+            "location_selector": self.location_selector,
+        }
+
+
+def _indeed_url(query: str, location: str, page_index: int) -> str:
+    url = f"https://fr.indeed.com/jobs?q={quote_plus(query)}&l={quote_plus(location)}"
+    if page_index:
+        url += f"&start={page_index * 10}"
+    return url
+
+
+def _wttj_url(query: str, location: str, page_index: int) -> str:
+    url = (
+        "https://www.welcometothejungle.com/fr/jobs"
+        f"?query={quote_plus(query)}&refinementList%5Boffices.country_code%5D%5B%5D=FR"
+    )
+    if page_index:
+        url += f"&page={page_index + 1}"
+    return url
+
+
+INDEED_SPEC = _SourceSpec(
+    name="indeed",
+    label="Indeed",
+    base_url="https://fr.indeed.com",
+    wait_selector=".job_seen_beacon, .jobsearch-ResultsList",
+    card_selector=".job_seen_beacon",
+    link_selector="a[data-jk], h2 a",
+    title_selector="h2 span[title], .jobTitle",
+    company_selector="[data-testid='company-name'], .companyName",
+    location_selector="[data-testid='text-location'], .companyLocation",
+    page_size=10,
+    build_url=_indeed_url,
+)
+
+WTTJ_SPEC = _SourceSpec(
+    name="wttj",
+    label="WTTJ",
+    base_url="https://www.welcometothejungle.com",
+    wait_selector="[data-testid='search-results-list-item-wrapper'], article",
+    card_selector="[data-testid='search-results-list-item-wrapper'], article",
+    link_selector="a[href*='/jobs/']",
+    title_selector="h4, [data-testid='job-title']",
+    company_selector="span[data-testid='company-name'], h3",
+    location_selector="[data-testid='job-location'], .location",
+    page_size=30,
+    build_url=_wttj_url,
+)
+
+
+async def _iter_source_pages(
+    spec: _SourceSpec,
+    query: str,
+    location: str,
+    max_pages: int,
+) -> AsyncIterator[list[JobSearchResult]]:
+    """Yield the job cards of each result page of a source, in order.
+
+    Timeouts and 5xx responses are retried with backoff. Stops at the first
+    page that still fails or has no cards; failures count against the
+    source's circuit breaker, and an open circuit skips the source. Past the
+    first page a timeout means there are no more results and is not retried.
+    """
+    label = spec.label
+    config = BrowserManager._config
+    breaker = get_breaker(config)
+    if not breaker.allow(spec.name):
+        logger.warning(f"{label}: Circuit open, skipping source")
+        return
+
+    for page_index in range(max_pages):
+        url = spec.build_url(query, location, page_index)
+        # Hold a pooled page only while loading: the consumer may fetch
+        # postings from the same pool between result pages
+        async with BrowserManager.get_page() as page:
+            try:
+                for attempt in range(config.retry_attempts + 1):
+                    try:
+                        results = await _load_results_page(page, spec, url)
+                        break
+                    except (PlaywrightTimeout, RetryableError) as e:
+                        if attempt == config.retry_attempts:
+                            raise
+                        if page_index > 0 and isinstance(e, PlaywrightTimeout):
+                            raise
+                        delay = backoff_delay(attempt, config)
+                        logger.info(
+                            f"{label}: Retrying page",
+                            page=page_index,
+                            attempt=attempt + 1,
+                            delay=round(delay, 2),
+                            error=str(e),
+                        )
+                        await asyncio.sleep(delay)
+            except PlaywrightTimeout:
+                if page_index > 0:
+                    # Past the last result page, boards render no cards
+                    logger.debug(f"{label}: No more result pages", page=page_index)
+                    return
+                logger.error(f"{label}: Timeout waiting for results", page=page_index)
+                breaker.record_failure(spec.name)
+                return
+            except Exception as e:
+                logger.error(f"{label}: Error", error=str(e), page=page_index)
+                breaker.record_failure(spec.name)
+                return
+
+        breaker.record_success(spec.name)
+        logger.debug(f"{label} page parsed", page=page_index, results=len(results))
+        if not results:
+            return
+        yield results
+
+
+async def _load_results_page(
+    page: Page, spec: _SourceSpec, url: str
+) -> list[JobSearchResult]:
+    """Navigate to a result page and extract its job cards.
+
+    Raises:
+        RetryableError: The board answered with a 5xx status
+        PlaywrightTimeout: The page or its cards did not load in time
+    """
+    response = await page.goto(url, wait_until="domcontentloaded")
+    if response is not None and is_retryable_status(response.status):
+        raise RetryableError(f"HTTP {response.status}")
+
+    # Wait for job cards
+    await page.wait_for_selector(spec.wait_selector, timeout=10000)
+
+    return await _extract_job_card(
+        page=page,
+        **spec.card_selectors(),
+        source=spec.name,
+        max_results=100,
+        base_url=spec.base_url,
+    )
+
+
+async def _search_source(
+    spec: _SourceSpec,
+    query: str,
+    location: str,
+    max_results: int,
+    max_pages: int | None,
+) -> list[JobSearchResult]:
+    """Collect up to max_results cards from a paginated source."""
+    if max_pages is None:
+        max_pages = max(1, -(-max_results // spec.page_size))
+
+    results: list[JobSearchResult] = []
+    pages = _iter_source_pages(spec, query, location, max_pages)
+    try:
+        async for page_results in pages:
+            results.extend(page_results)
+            if len(results) >= max_results:
+                break
+    finally:
+        await pages.aclose()
+
+    return results[:max_results]
+
+
 async def search_indeed_async(
     query: str,
     location: str = "France",
     max_results: int = 10,
+    max_pages: int | None = None,
 ) -> list[JobSearchResult]:
     """Search Indeed France for job postings.
 
@@ -106,43 +424,15 @@ async def search_indeed_async(
         query: Search keywords
         location: Job location
         max_results: Maximum number of results to return
+        max_pages: Maximum result pages to crawl (default: enough pages
+            to reach max_results)
 
     Returns:
         List of job search results
     """
-    base_url = "https://fr.indeed.com/jobs"
-    search_url = f"{base_url}?q={quote_plus(query)}&l={quote_plus(location)}"
-
-    try:
-        async with BrowserManager.get_page() as page:
-            await page.goto(search_url, wait_until="domcontentloaded")
-
-            # Wait for job cards
-            await page.wait_for_selector(
-                ".job_seen_beacon, .jobsearch-ResultsList", timeout=10000
-            )
-
-            results = await _extract_job_card(
-                page=page,
-                card_selector=".job_seen_beacon",
-                link_selector="a[data-jk], h2 a",
-                title_selector="h2 span[title], .jobTitle",
-                company_selector="[data-testid='company-name'], .companyName",
-                location_selector="[data-testid='text-location'], .companyLocation",
-                source="indeed",
-                max_results=max_results,
-                base_url="https://fr.indeed.com",
-            )
-
-            logger.info("Indeed search complete", results=len(results))
-            return results
-
-    except PlaywrightTimeout:
-        logger.error("Indeed: Timeout waiting for results")
-        return []
-    except Exception as e:
-        logger.error("Indeed: Error", error=str(e))
-        return []
+    results = await _search_source(INDEED_SPEC, query, location, max_results, max_pages)
+    logger.info("Indeed search complete", results=len(results))
+    return results
 
 
 def search_indeed(
@@ -158,6 +448,7 @@ async def search_wttj_async(
     query: str,
     location: str = "France",
     max_results: int = 10,
+    max_pages: int | None = None,
 ) -> list[JobSearchResult]:
     """Search Welcome to the Jungle for job postings.
 
@@ -165,44 +456,15 @@ async def search_wttj_async(
         query: Search keywords
         location: Job location (unused, France filter applied)
         max_results: Maximum number of results to return
+        max_pages: Maximum result pages to crawl (default: enough pages
+            to reach max_results)
 
     Returns:
         List of job search results
     """
-    base_url = "https://www.welcometothejungle.com/fr/jobs"
-    search_url = f"{base_url}?query={quote_plus(query)}&refinementList%5Boffices.country_code%5D%5B%5D=FR"
-
-    try:
-        async with BrowserManager.get_page() as page:
-            await page.goto(search_url, wait_until="domcontentloaded")
-
-            # Wait for job cards
-            await page.wait_for_selector(
-                "[data-testid='search-results-list-item-wrapper'], article",
-                timeout=10000,
-            )
-
-            results = await _extract_job_card(
-                page=page,
-                card_selector="[data-testid='search-results-list-item-wrapper'], article",
-                link_selector="a[href*='/jobs/']",
-                title_selector="h4, [data-testid='job-title']",
-                company_selector="span[data-testid='company-name'], h3",
-                location_selector="[data-testid='job-location'], .location",
-                source="wttj",
-                max_results=max_results,
-                base_url="https://www.welcometothejungle.com",
-            )
-
-            logger.info("WTTJ search complete", results=len(results))
-            return results
-
-    except PlaywrightTimeout:
-        logger.error("WTTJ: Timeout waiting for results")
-        return []
-    except Exception as e:
-        logger.error("WTTJ: Error", error=str(e))
-        return []
+    results = await _search_source(WTTJ_SPEC, query, location, max_results, max_pages)
+    logger.info("WTTJ search complete", results=len(results))
+    return results
 
 
 def search_wttj(
@@ -284,6 +546,12 @@ SOURCES = {
     "glassdoor": search_glassdoor,
 }
 
+# Sources crawled page by page (others are searched once via SOURCES_ASYNC)
+PAGINATED_SOURCES = {
+    "indeed": INDEED_SPEC,
+    "wttj": WTTJ_SPEC,
+}
+
 DEFAULT_SOURCES = ["indeed", "wttj"]
 
 
@@ -376,6 +644,117 @@ def search_jobs(
     )
 
 
+async def iter_jobs_async(
+    query: str,
+    location: str = "France",
+    sources: list[str] | None = None,
+    max_pages_per_source: int = 5,
+    max_results_per_source: int = 100,
+    max_results: int | None = None,
+) -> AsyncIterator[JobSearchResult]:
+    """Stream job search results as soon as each result page is parsed.
+
+    Sources are crawled concurrently on the shared browser and results are
+    deduplicated by URL. A source stops at its page or result cap, or at
+    the first page that only yields already-seen URLs.
+
+    The browser is left running so that postings can be fetched while the
+    search continues: call `cleanup()` when done.
+
+    Args:
+        query: Search keywords (e.g., "data analyst internship")
+        location: Job location (default: "France")
+        sources: List of sources to search (default: ["indeed", "wttj"])
+        max_pages_per_source: Max result pages crawled per source
+        max_results_per_source: Max results yielded per source
+        max_results: Max results yielded overall (default: no limit)
+
+    Yields:
+        Unique job search results, in discovery order
+    """
+    if sources is None:
+        sources = DEFAULT_SOURCES
+
+    valid_sources = []
+    for source in sources:
+        if source not in SOURCES_ASYNC:
+            logger.warning("Unknown source", source=source)
+            continue
+        valid_sources.append(source)
+    if not valid_sources:
+        return
+
+    await BrowserManager.initialize()
+
+    # Bounded: producers pause while the consumer is busy
+    queue: asyncio.Queue[list[JobSearchResult] | None] = asyncio.Queue(
+        maxsize=2 * len(valid_sources)
+    )
+    seen: set[str] = set()
+
+    def take_new(results: list[JobSearchResult], budget: int) -> list[JobSearchResult]:
+        new = []
+        for result in results:
+            if result.url in seen:
+                continue
+            seen.add(result.url)
+            new.append(result)
+            if len(new) >= budget:
+                break
+        return new
+
+    async def crawl(source: str) -> None:
+        found = 0
+        try:
+            if source not in PAGINATED_SOURCES:
+                results = await SOURCES_ASYNC[source](
+                    query, location, max_results_per_source
+                )
+                new = take_new(results, max_results_per_source)
+                found = len(new)
+                await queue.put(new)
+            else:
+                pages = _iter_source_pages(
+                    PAGINATED_SOURCES[source], query, location, max_pages_per_source
+                )
+                try:
+                    async for page_results in pages:
+                        new = take_new(page_results, max_results_per_source - found)
+                        if not new:
+                            logger.info("No new results, stopping", source=source)
+                            break
+                        found += len(new)
+                        await queue.put(new)
+                        if found >= max_results_per_source:
+                            break
+                finally:
+                    await pages.aclose()
+        except Exception as e:
+            logger.error("Search failed", source=source, error=str(e))
+
+        logger.info("Search complete", source=source, results=found)
+        await queue.put(None)
+
+    tasks = [asyncio.create_task(crawl(source)) for source in valid_sources]
+    yielded = 0
+    try:
+        running = len(tasks)
+        while running:
+            batch = await queue.get()
+            if batch is None:
+                running -= 1
+                continue
+            for result in batch:
+                yield result
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def get_job_urls_async(
     query: str,
     location: str = "France",
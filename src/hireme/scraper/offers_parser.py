@@ -135,7 +135,8 @@ def _get_wait_selector(url: str) -> str | None:
 async def get_job_page_async(url: str) -> str | None:
     """Scrape a job posting page (async).
 
-    Uses caching to avoid redundant requests.
+    Uses caching to avoid redundant requests. Known server-rendered boards
+    are fetched over plain HTTP, falling back to the browser when needed.
 
     Args:
         url: Job posting URL
@@ -147,6 +148,18 @@ async def get_job_page_async(url: str) -> str | None:
     return await get_page_text_async(url, wait_selector=wait_selector)
 
 
+async def get_job_page_raw_async(url: str) -> str | None:
+    """Fetch a job posting page without cleaning it (see clean_text).
+
+    Args:
+        url: Job posting URL
+
+    Returns:
+        Raw extracted text or None
+    """
+    return await get_page_content(url, _get_wait_selector(url), use_cache=True)
+
+
 def get_job_page(url: str) -> str | None:
     """Convenience function to scrape a job posting page (sync).
 
@@ -177,7 +190,7 @@ async def get_job_pages_async(urls: list[str]) -> dict[str, str | None]:
     try:
         results = await get_multiple_pages(
             urls,
-            max_concurrent=3,
+            max_concurrent=6,
             use_cache=True,
         )
         # Clean all results
@@ -0,0 +1,260 @@
+"""Per-host request scheduling for the scraper.
+
+Each host gets its own limiter so that a slow or throttling job board does
+not hold back the others:
+- Token bucket: caps the request rate (with a small burst)
+- Adaptive concurrency (AIMD): the number of in-flight requests grows by
+  about one per round trip while responses are fast, and is halved on
+  429s, timeouts or slow responses
+- Retry-After: a throttled host is paused for the delay it asked for
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import structlog
+
+from hireme.utils.retry_after import MAX_RETRY_AFTER
+
+if TYPE_CHECKING:
+    from hireme.scraper.playwright_scraper import ScraperConfig
+
+logger = structlog.get_logger(logger_name=__name__)
+
+
+@dataclass
+class FetchOutcome:
+    """What a fetch reported back to its host limiter."""
+
+    status: int | None = None
+    timed_out: bool = False
+    retry_after: float | None = None  # seconds
+    latency: float | None = None  # seconds, measured by the slot if unset
+    error: str | None = None  # set when the fetch raised before a response
+
+    @property
+    def throttled(self) -> bool:
+        return self.status == 429
+
+
+@dataclass
+class HostStats:
+    """Counters for one host."""
+
+    requests: int = 0
+    throttled: int = 0  # 429 responses
+    timeouts: int = 0
+    slow: int = 0  # responses above the target latency
+    decreases: int = 0  # multiplicative concurrency decreases
+    waits: int = 0  # acquisitions that had to wait for a slot or a token
+
+
+class HostLimiter:
+    """Token bucket and AIMD concurrency limit for a single host."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        initial_concurrency: int,
+        max_concurrency: int,
+        target_latency: float,
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self.target_latency = target_latency
+        self.limit = float(min(max(1, initial_concurrency), self.max_concurrency))
+        self.stats = HostStats()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of allowed in-flight requests."""
+        return max(1, int(self.limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot, then for a token."""
+        waited = False
+        async with self._cond:
+            if self._in_flight >= self.concurrency:
+                waited = True
+                await self._cond.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+
+        try:
+            while True:
+                delay = self._take_token()
+                if delay <= 0:
+                    break
+                waited = True
+                await asyncio.sleep(delay)
+        except BaseException:
+            await self._release_slot()
+            raise
+
+        self.stats.requests += 1
+        if waited:
+            self.stats.waits += 1
+
+    async def release(self, outcome: FetchOutcome, latency: float) -> None:
+        """Free the slot and adapt the limit to the outcome."""
+        now = time.monotonic()
+        if outcome.retry_after:
+            pause = min(outcome.retry_after, MAX_RETRY_AFTER)
+            self._paused_until = max(self._paused_until, now + pause)
+            logger.info("Host asked to back off", seconds=round(pause, 1))
+
+        if outcome.throttled:
+            self.stats.throttled += 1
+            self._decrease(now)
+        elif outcome.timed_out:
+            self.stats.timeouts += 1
+            self._decrease(now)
+        elif latency > self.target_latency:
+            self.stats.slow += 1
+            self._decrease(now)
+        elif outcome.status is not None and outcome.status < 400:
+            # Additive increase: about +1 per window of `limit` successes
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+        await self._release_slot()
+
+    def _take_token(self) -> float:
+        """Consume a token, or return how long to wait for one."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _decrease(self, now: float) -> None:
+        # One decrease per latency window: a burst of failures from the same
+        # round of requests only counts once
+        if now - self._last_decrease < self.target_latency:
+            return
+        self._last_decrease = now
+        self.limit = max(1.0, self.limit / 2)
+        self.stats.decreases += 1
+
+    async def _release_slot(self) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+
+class HostScheduler:
+    """Hands out per-host limiters built from the scraper configuration.
+
+    Usage:
+        async with scheduler.slot(url) as outcome:
+            response = await fetch(url)
+            outcome.status = response.status
+    """
+
+    def __init__(self, config: "ScraperConfig"):
+        self._config = config
+        self._limiters: dict[str, HostLimiter] = {}
+
+    def for_url(self, url: str) -> HostLimiter:
+        """Get the limiter of a URL's host, creating it on first use."""
+        host = urlparse(url).netloc.lower()
+        if host not in self._limiters:
+            cfg = self._config
+            self._limiters[host] = HostLimiter(
+                rate=_host_rate(host, cfg),
+                burst=cfg.host_burst,
+                initial_concurrency=cfg.host_initial_concurrency,
+                max_concurrency=cfg.host_max_concurrency,
+                target_latency=cfg.host_target_latency,
+            )
+        return self._limiters[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncGenerator[FetchOutcome, None]:
+        """Hold a request slot for a URL's host.
+
+        The caller fills in the yielded outcome; a TimeoutError escaping the
+        block is recorded as a timeout.
+        """
+        limiter = self.for_url(url)
+        await limiter.acquire()
+        outcome = FetchOutcome()
+        started = time.monotonic()
+        try:
+            yield outcome
+        except TimeoutError:
+            outcome.timed_out = True
+            raise
+        finally:
+            latency = outcome.latency
+            if latency is None:
+                latency = time.monotonic() - started
+            await limiter.release(outcome, latency)
+
+    def stats(self) -> dict[str, HostStats]:
+        """Get the counters of every host seen so far."""
+        return {host: limiter.stats for host, limiter in self._limiters.items()}
+
+    def log_stats(self) -> None:
+        """Log per-host counters and the concurrency they settled on."""
+        for host, limiter in self._limiters.items():
+            stats = limiter.stats
+            logger.info(
+                "Host scheduler stats",
+                host=host,
+                requests=stats.requests,
+                concurrency=limiter.concurrency,
+                throttled=stats.throttled,
+                timeouts=stats.timeouts,
+                slow=stats.slow,
+                waits=stats.waits,
+            )
+
+
+def _host_rate(host: str, config: "ScraperConfig") -> float:
+    """Get the request rate for a host, honouring per-domain overrides."""
+    for domain, rate in config.host_rates.items():
+        if domain in host:
+            return rate
+    return config.host_rate
+
+
+# Global scheduler instance (created with the first config that needs it)
+_scheduler: HostScheduler | None = None
+
+
+def get_scheduler(config: "ScraperConfig") -> HostScheduler:
+    """Get the global host scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = HostScheduler(config)
+    return _scheduler
+
+
+def reset_scheduler() -> HostScheduler | None:
+    """Drop the global scheduler, returning it (e.g. to log its stats)."""
+    global _scheduler
+    scheduler, _scheduler = _scheduler, None
+    return scheduler
@@ -0,0 +1,69 @@
+"""Retry policy and circuit breaker for the scraper.
+
+- Retries: transient failures (timeouts, 5xx) are retried with capped
+  exponential backoff and full jitter
+- Circuit breaker: a source or domain that keeps failing is skipped for a
+  while instead of burning a timeout on every URL, then probed again
+  (half-open) to see whether it recovered (see hireme.utils.circuit_breaker)
+"""
+
+import random
+from typing import TYPE_CHECKING
+
+from hireme.scraper.rate_limiter import FetchOutcome
+from hireme.utils.circuit_breaker import CircuitBreaker
+
+if TYPE_CHECKING:
+    from hireme.scraper.playwright_scraper import ScraperConfig
+
+
+def is_retryable_status(status: int | None) -> bool:
+    """Check whether an HTTP status is worth retrying (5xx only)."""
+    return isinstance(status, int) and 500 <= status < 600
+
+
+def should_retry(outcome: FetchOutcome) -> bool:
+    """Check whether a fetch failed transiently (timeout or 5xx)."""
+    return outcome.timed_out or is_retryable_status(outcome.status)
+
+
+def is_failure(outcome: FetchOutcome) -> bool:
+    """Check whether a fetch counts against the circuit breaker.
+
+    Client errors (404...) mean the site is up and are not failures.
+    """
+    return should_retry(outcome) or (
+        outcome.status is None and outcome.error is not None
+    )
+
+
+class RetryableError(Exception):
+    """A transient failure (e.g. a 5xx response) worth retrying."""
+
+
+def backoff_delay(attempt: int, config: "ScraperConfig") -> float:
+    """Get the delay before retry number `attempt` (0-based).
+
+    Full jitter: a random delay between 0 and the exponential backoff, so
+    that concurrent fetches failing together do not retry in lockstep.
+    """
+    ceiling = min(config.retry_max_delay, config.retry_base_delay * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+# =============================================================================
+# Circuit breaker
+# =============================================================================
+
+# Global breaker instance (created with the first config that needs it)
+_breaker: CircuitBreaker | None = None
+
+
+def get_breaker(config: "ScraperConfig") -> CircuitBreaker:
+    """Get the global circuit breaker."""
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker(
+            config.breaker_failure_threshold, config.breaker_reset_timeout
+        )
+    return _breaker
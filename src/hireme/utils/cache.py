@@ -0,0 +1,228 @@
+"""SQLite-backed persistent key/value cache.
+
+Shared storage layer for the on-disk caches (scraped pages, ...).
+Entries carry an optional expiry date and are evicted least-recently-used
+first once the total payload exceeds a byte budget. The total is kept in a
+one-row meta table by triggers, so writes never sum the whole table.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(logger_name=__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PersistentCache:
+    """Persistent string cache stored in a single SQLite file.
+
+    Usage:
+        cache = PersistentCache(cfg.hireme_dir / "cache" / "pages.sqlite3")
+        cache.set("key", "value", ttl=3600)
+        cache.get("key")
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_bytes: int | None = 200 * 1024 * 1024,
+        default_ttl: float | None = None,
+    ):
+        """
+        Args:
+            db_path: SQLite file backing the cache (created if missing)
+            max_bytes: Payload budget before LRU eviction, None for unbounded
+            default_ttl: Expiry in seconds used when `set` gets no ttl
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_accessed_at ON entries (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_expires_at ON entries (expires_at)"
+        )
+        self._create_size_tracking()
+
+    def get(self, key: str) -> str | None:
+        """Get a fresh value for key, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store value under key, expiring after ttl seconds (or default_ttl)."""
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl is not None else None
+        size = len(value.encode("utf-8"))
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO entries
+                    (key, value, size, created_at, accessed_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at,
+                    expires_at = excluded.expires_at
+                """,
+                (key, value, size, now, now, expires_at),
+            )
+            self._evict()
+
+    def has(self, key: str) -> bool:
+        """Check if a fresh entry exists, without touching the counters."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def delete(self, key: str) -> None:
+        """Remove an entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def size_bytes(self) -> int:
+        """Total payload size currently stored."""
+        with self._lock:
+            return self._total_bytes()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _create_size_tracking(self) -> None:
+        """Keep the payload total in `meta`, updated by the entry writes.
+
+        The triggers run in the transaction of the statement changing
+        `entries`. Upserts fire the update trigger, which is why `set` does
+        not use INSERT OR REPLACE: its implicit delete fires no trigger.
+        """
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total_bytes INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO meta (id, total_bytes)
+                SELECT 0, COALESCE(SUM(size), 0) FROM entries;
+            CREATE TRIGGER IF NOT EXISTS entries_size_insert
+                AFTER INSERT ON entries
+            BEGIN
+                UPDATE meta SET total_bytes = total_bytes + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_size_update
+                AFTER UPDATE OF size ON entries
+            BEGIN
+                UPDATE meta SET total_bytes = total_bytes - OLD.size + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_size_delete
+                AFTER DELETE ON entries
+            BEGIN
+                UPDATE meta SET total_bytes = total_bytes - OLD.size;
+            END;
+            """
+        )
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT total_bytes FROM meta").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones over budget."""
+        self._conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        if self.max_bytes is None:
+            return
+
+        overflow = self._total_bytes() - self.max_bytes
+        if overflow <= 0:
+            return
+
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ):
+            victims.append((key,))
+            freed += size
+            if freed >= overflow:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+        logger.debug("Cache eviction", path=str(self.db_path), evicted=len(victims))
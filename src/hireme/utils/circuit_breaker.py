@@ -0,0 +1,100 @@
+"""Circuit breaker for calls to services that keep failing.
+
+Shared by the scraper (sources and domains) and the model router (LLM
+servers): a key that keeps failing is skipped for a while instead of
+paying for a failed call every time, then probed again (half-open) to
+see whether it recovered.
+"""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+import structlog
+
+logger = structlog.get_logger(logger_name=__name__)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0  # consecutive
+    opened_at: float = 0.0
+    probe_started: float | None = None  # a half-open probe is in flight
+
+
+class CircuitBreaker:
+    """Short-circuits calls to sources or domains that keep failing.
+
+    A key opens after `failure_threshold` consecutive failures. Once
+    `reset_timeout` seconds have passed a single probe call is let through
+    (half-open): success closes the circuit, failure opens it again. A
+    probe that never reports back (cancelled) is replaced after another
+    `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._circuits: dict[str, _Circuit] = {}
+
+    def allow(self, key: str) -> bool:
+        """Check whether a call for this key may go through."""
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state is CircuitState.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if circuit.state is CircuitState.OPEN:
+            if now - circuit.opened_at < self.reset_timeout:
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probe_started = None
+
+        # Half-open: one probe at a time
+        if (
+            circuit.probe_started is not None
+            and now - circuit.probe_started < self.reset_timeout
+        ):
+            return False
+        circuit.probe_started = now
+        logger.info("Circuit half-open, probing", key=key)
+        return True
+
+    def record_success(self, key: str) -> None:
+        """Record a successful call, closing the circuit."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            return
+        if circuit.state is not CircuitState.CLOSED:
+            logger.info("Circuit closed", key=key)
+        self._circuits[key] = _Circuit()
+
+    def record_failure(self, key: str) -> None:
+        """Record a failed call, opening the circuit past the threshold."""
+        circuit = self._circuits.setdefault(key, _Circuit())
+        circuit.failures += 1
+        circuit.probe_started = None
+        if circuit.state is CircuitState.HALF_OPEN or (
+            circuit.failures >= self.failure_threshold
+        ):
+            if circuit.state is not CircuitState.OPEN:
+                logger.warning(
+                    "Circuit opened",
+                    key=key,
+                    failures=circuit.failures,
+                    retry_in=self.reset_timeout,
+                )
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = time.monotonic()
+
+    def state(self, key: str) -> CircuitState:
+        """Get the current state of a key (without triggering a probe)."""
+        circuit = self._circuits.get(key)
+        return circuit.state if circuit else CircuitState.CLOSED
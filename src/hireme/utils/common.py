@@ -8,6 +8,9 @@ from hireme.utils.models.models import FileContent, UserContext
 
 logger = structlog.get_logger(logger_name=__name__)
 
+# Loaded contexts by (profile dir, context note), with the files they came from
+_user_contexts: dict[tuple[Path, str], tuple[tuple, UserContext]] = {}
+
 
 # =============================================================================
 # File Loading Functions
@@ -75,6 +78,10 @@ def load_user_context_from_directory(
 ) -> UserContext:
     """Load user context from a directory containing various files.
 
+    The context is memoized per profile directory until one of its files
+    is added, removed or modified. PDFs are not parsed: the context only
+    carries the context note, so their text would be discarded.
+
     Args:
         profile_dir: Path to the directory containing user files
         context_note_filename: Name of the main context note file (md or txt)
@@ -99,6 +106,13 @@ def load_user_context_from_directory(
     if not profile_dir.exists():
         raise FileNotFoundError(f"Profile directory not found: {profile_dir}")
 
+    memo_key = (profile_dir.resolve(), context_note_filename)
+    signature = _profile_signature(profile_dir)
+    memoized = _user_contexts.get(memo_key)
+    if memoized is not None and memoized[0] == signature:
+        logger.debug("Reusing loaded user context", profile_dir=str(profile_dir))
+        return memoized[1].model_copy()
+
     files: list[FileContent] = []
     context_note = ""
     personal_info = {}
@@ -117,13 +131,15 @@ def load_user_context_from_directory(
             logger.debug("Skipping unsupported file", file=file_path.name)
             continue
 
+        if ext == ".pdf":
+            # Slow to parse and not part of UserContext (no file contents)
+            logger.debug("Skipping PDF", file=file_path.name)
+            continue
+
         logger.info("Loading file", file=file_path.name, type=ext)
 
         try:
-            if ext == ".pdf":
-                content = load_pdf_content(file_path)
-                file_type = "pdf"
-            elif ext in {".yaml", ".yml"}:
+            if ext in {".yaml", ".yml"}:
                 content, parsed = load_yaml_content(file_path)
                 file_type = "yaml"
 
@@ -161,7 +177,7 @@ def load_user_context_from_directory(
     )
 
     # should parse user context from context.md
-    return UserContext(
+    user_context = UserContext(
         # name=personal_info.get("name", ""),
         # email=personal_info.get("email", ""),
         # phone=personal_info.get("phone"),
@@ -172,6 +188,18 @@ def load_user_context_from_directory(
         # files=files,
         context_note=context_note,
     )
+    _user_contexts[memo_key] = (signature, user_context)
+    return user_context.model_copy()
+
+
+def _profile_signature(profile_dir: Path) -> tuple:
+    """Names, modification times and sizes of a profile directory's files."""
+    signature = []
+    for file_path in profile_dir.iterdir():
+        if file_path.is_file():
+            stat = file_path.stat()
+            signature.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
 
 
 def write_job_offer_to_json(url: str, data: dict, export_dir: Path) -> None:
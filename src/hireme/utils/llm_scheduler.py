@@ -0,0 +1,348 @@
+"""Per-provider scheduling of LLM requests.
+
+Every LLM call of the process (job extraction, resume tailoring) goes
+through the scheduler of its provider, so agents running side by side
+share one budget instead of tripping the provider's rate limits:
+
+- Budgets: requests per minute and tokens per minute token buckets, plus
+  a cap on requests in flight
+- Priorities: queued interactive requests are served before batch ones
+- Deadlines: a request queued for longer than its scheduling timeout fails
+  fast with DeadlineExceeded
+- Backoff: a 429 pauses the whole provider (Retry-After, else exponential)
+  and the request is retried
+
+Budgets are per process: a second CLI process hitting the same provider
+is only accounted for through the 429s it causes.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+import structlog
+
+from hireme.utils.providers import PROVIDER_LIMITS, ProviderLimits, get_provider_name
+from hireme.utils.retry_after import MAX_RETRY_AFTER, parse_retry_after
+
+logger = structlog.get_logger(logger_name=__name__)
+
+T = TypeVar("T")
+
+Priority = Literal["interactive", "batch"]
+_PRIORITY_RANK: dict[Priority, int] = {"interactive": 0, "batch": 1}
+
+BACKOFF_BASE = 2.0  # seconds, doubled on consecutive 429s
+MAX_THROTTLE_RETRIES = 3
+
+_priority: ContextVar[Priority] = ContextVar("llm_priority", default="interactive")
+_timeout: ContextVar[float | None] = ContextVar("llm_timeout", default=None)
+
+
+@contextmanager
+def scheduling(priority: Priority, timeout: float | None = None) -> Iterator[None]:
+    """Set the priority (and queueing timeout) of LLM calls made inside.
+
+    Args:
+        priority: "interactive" requests are served before "batch" ones
+        timeout: Seconds each request may wait in the queue before failing
+            (inherited from the enclosing block when None)
+    """
+    priority_token = _priority.set(priority)
+    timeout_token = _timeout.set(timeout if timeout is not None else _timeout.get())
+    try:
+        yield
+    finally:
+        _priority.reset(priority_token)
+        _timeout.reset(timeout_token)
+
+
+class DeadlineExceeded(TimeoutError):
+    """An LLM request waited in the queue past its deadline."""
+
+
+class _Bucket:
+    """Token bucket refilled continuously; may go into debt."""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` is available (capped at the capacity)."""
+        if math.isinf(self.rate):
+            return 0.0
+        self._refill()
+        needed = min(amount, self.capacity)
+        return max(0.0, (needed - self.level) / self.rate)
+
+    def consume(self, amount: float) -> None:
+        if not math.isinf(self.rate):
+            self._refill()
+            self.level -= amount
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+    queued_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters for one provider."""
+
+    requests: int = 0
+    throttled: int = 0  # 429 responses
+    expired: int = 0  # deadline exceeded while queued
+    queue_depth: int = 0  # requests waiting right now
+    max_queue_depth: int = 0
+    total_wait: float = 0.0  # seconds spent queued, summed
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class ProviderScheduler:
+    """Priority queue in front of one provider's budgets."""
+
+    def __init__(self, name: str, limits: ProviderLimits):
+        self.name = name
+        self.limits = limits
+        self.stats = SchedulerStats()
+        self._requests = _Bucket(limits.requests_per_minute)
+        self._tokens = _Bucket(limits.tokens_per_minute)
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(
+        self,
+        tokens: int,
+        priority: Priority = "interactive",
+        deadline: float | None = None,
+    ) -> float:
+        """Wait for a request slot and budget.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            DeadlineExceeded: The deadline passed before the request started
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            _PRIORITY_RANK[priority], next(self._seq), tokens, loop.create_future()
+        )
+        heapq.heappush(self._queue, waiter)
+        self._update_depth()
+        self._dispatch()
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(tokens, tokens)  # granted just as we gave up
+            else:
+                waiter.future.cancel()
+                self._queue.remove(waiter)
+                heapq.heapify(self._queue)
+                self._update_depth()
+            if isinstance(e, TimeoutError):
+                self.stats.expired += 1
+                raise DeadlineExceeded(
+                    f"LLM request queued on {self.name} past its deadline"
+                ) from e
+            raise
+
+        waited = time.monotonic() - waiter.queued_at
+        self.stats.requests += 1
+        self.stats.total_wait += waited
+        self.stats.max_wait = max(self.stats.max_wait, waited)
+        return waited
+
+    def release(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Free the slot, charging the difference to the token budget."""
+        self._tokens.consume(actual_tokens - estimated_tokens)
+        self._in_flight -= 1
+        self._dispatch()
+
+    def throttle(self, retry_after: float | None = None) -> float:
+        """Pause the provider after a 429; returns the pause in seconds."""
+        self.stats.throttled += 1
+        self._consecutive_throttles += 1
+        if retry_after is None:
+            retry_after = BACKOFF_BASE * 2 ** (self._consecutive_throttles - 1)
+        delay = min(retry_after, MAX_RETRY_AFTER)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logger.warning("LLM provider throttled", provider=self.name, pause=delay)
+        return delay
+
+    def record_success(self) -> None:
+        self._consecutive_throttles = 0
+
+    def _update_depth(self) -> None:
+        self.stats.queue_depth = len(self._queue)
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(self._queue))
+
+    def _dispatch(self) -> None:
+        """Start queued requests, in priority order, while budgets allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._queue and self._in_flight < self.limits.max_concurrency:
+            head = self._queue[0]
+            delay = max(
+                self._paused_until - time.monotonic(),
+                self._requests.delay(1),
+                self._tokens.delay(head.tokens),
+            )
+            if delay > 0:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(delay, self._dispatch)
+                break
+
+            heapq.heappop(self._queue)
+            self._requests.consume(1)
+            self._tokens.consume(head.tokens)
+            self._in_flight += 1
+            head.future.set_result(None)
+        self._update_depth()
+
+
+class LLMScheduler:
+    """Per-provider schedulers for every LLM call of the process."""
+
+    def __init__(self, limits: dict[str, ProviderLimits] | None = None):
+        self.limits = dict(limits or PROVIDER_LIMITS)
+        self._providers: dict[str, ProviderScheduler] = {}
+
+    def for_model(self, model: str) -> ProviderScheduler:
+        """Get the scheduler of the provider serving a model."""
+        name = get_provider_name(model)  # type: ignore[arg-type]
+        if name not in self._providers:
+            self._providers[name] = ProviderScheduler(name, self.limits[name])
+        return self._providers[name]
+
+    async def run(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        tokens_of: Callable[[T], int] | None = None,
+    ) -> T:
+        """Run an LLM call within its provider's budgets.
+
+        Priority and queueing timeout come from the enclosing `scheduling`
+        block; the deadline covers the throttling retries too. 429 responses
+        pause the provider and the call is retried.
+
+        Args:
+            model: Model identifier (selects the provider)
+            call: Makes the request
+            estimated_tokens: Prompt plus expected answer tokens
+            tokens_of: Actual tokens used, read from the call's result
+        """
+        provider = self.for_model(model)
+        priority, timeout = _priority.get(), _timeout.get()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            await provider.acquire(estimated_tokens, priority, deadline)
+            try:
+                result = await call()
+            except Exception as e:
+                provider.release(estimated_tokens, estimated_tokens)
+                if getattr(e, "status_code", None) != 429:
+                    raise
+                provider.throttle(retry_after_of(e))
+                if attempt == MAX_THROTTLE_RETRIES:
+                    raise
+                continue
+
+            provider.record_success()
+            actual = tokens_of(result) if tokens_of else estimated_tokens
+            provider.release(estimated_tokens, actual)
+            return result
+        raise AssertionError("unreachable")
+
+    def stats(self) -> dict[str, SchedulerStats]:
+        """Get the counters of every provider used so far."""
+        return {name: p.stats for name, p in self._providers.items()}
+
+    def log_stats(self) -> None:
+        """Log queue depth, wait times and throttling per provider."""
+        for name, stats in self.stats().items():
+            logger.info(
+                "LLM scheduler stats",
+                provider=name,
+                requests=stats.requests,
+                throttled=stats.throttled,
+                expired=stats.expired,
+                max_queue_depth=stats.max_queue_depth,
+                avg_wait=round(stats.avg_wait, 2),
+                max_wait=round(stats.max_wait, 2),
+            )
+
+
+# Global scheduler instance
+_scheduler: LLMScheduler | None = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get the process-wide LLM scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler()
+    return _scheduler
+
+
+def retry_after_of(error: BaseException) -> float | None:
+    """Get the Retry-After of a throttled LLM call, in seconds, if sent.
+
+    Older pydantic-ai releases do not copy the response headers onto
+    ModelHTTPError; they are then read from the provider SDK error it was
+    raised from (`response` for OpenAI clients, `raw_response` for Mistral).
+    """
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        cause = error.__cause__
+        response = getattr(cause, "response", None) or getattr(
+            cause, "raw_response", None
+        )
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def usage_tokens(result: Any) -> int:
+    """Get the total tokens of a pydantic-ai run result."""
+    return int(result.usage().total_tokens or 0)
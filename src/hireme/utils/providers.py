@@ -3,8 +3,13 @@ TODO: support more providers and models.
 TODO: add caching support.
 """
 
+import functools
+import math
+from dataclasses import dataclass
 from typing import Literal
 
+import httpx
+import structlog
 from pydantic_ai.models.mistral import MistralModel
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.mistral import MistralProvider
@@ -13,6 +18,8 @@ from pydantic_ai.settings import ModelSettings
 
 from hireme.config import cfg
 
+logger = structlog.get_logger(logger_name=__name__)
+
 SUPPORTED_MODELS = Literal[
     "llama3.1:8b",
     "qwen2.5:7b-instruct",
@@ -24,6 +31,59 @@ SUPPORTED_MODELS = Literal[
     "default",  # special case to use default from config
 ]
 
+ProviderName = Literal["mistral", "ollama"]
+
+# Concurrent requests each provider handles comfortably: the Mistral API is
+# rate limited per workspace, a local Ollama server runs one request at a time
+PROVIDER_CONCURRENCY: dict[ProviderName, int] = {"mistral": 4, "ollama": 1}
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Request budgets shared by every LLM call sent to a provider."""
+
+    requests_per_minute: float
+    tokens_per_minute: float
+    max_concurrency: int
+
+
+PROVIDER_LIMITS: dict[ProviderName, ProviderLimits] = {
+    "mistral": ProviderLimits(
+        requests_per_minute=60,
+        tokens_per_minute=500_000,
+        max_concurrency=PROVIDER_CONCURRENCY["mistral"],
+    ),
+    "ollama": ProviderLimits(
+        requests_per_minute=math.inf,
+        tokens_per_minute=math.inf,
+        max_concurrency=PROVIDER_CONCURRENCY["ollama"],
+    ),
+}
+
+
+# Seconds to wait for the local Ollama server to answer the startup probe
+OLLAMA_PROBE_TIMEOUT = 1.0
+
+
+def get_provider_name(model: SUPPORTED_MODELS) -> ProviderName:
+    """Get the provider serving a model identifier."""
+    return "mistral" if model == "mistral-medium-latest" else "ollama"
+
+
+@functools.cache
+def ollama_available() -> bool:
+    """Check once per process whether the Ollama server answers."""
+    if not cfg.ollama.base_url:
+        return False
+    # The API root sits above the OpenAI-compatible /v1 endpoint
+    root = cfg.ollama.base_url.rstrip("/").removesuffix("/v1")
+    try:
+        httpx.get(f"{root}/api/version", timeout=OLLAMA_PROBE_TIMEOUT)
+    except httpx.HTTPError as e:
+        logger.info("Ollama server unreachable", base_url=root, error=str(e))
+        return False
+    return True
+
 
 def get_llm_model(
     model: SUPPORTED_MODELS = "qwen3:14b",
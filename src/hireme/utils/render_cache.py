@@ -0,0 +1,160 @@
+"""Content-addressed store of rendered resume PDFs.
+
+A resume whose RenderCV input (cv data, design, locale and settings) is
+identical to one rendered before gives the same PDF, so the PDF is kept
+under the hash of that input and reused instead of rendering again.
+Reused PDFs are hard-linked into the output directory (copied when the
+store is on another filesystem).
+
+RenderCV prints the current date on the resume unless the input sets
+`settings.current_date`, so the date is part of the key in that case.
+
+The store is bounded like the other caches: PDFs unused for `max_age` are
+dropped, then the least recently used ones past a byte budget.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import date
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from hireme.utils.cache import CacheStats
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Bump when the rendering pipeline changes, it invalidates stored PDFs
+RENDER_CACHE_VERSION = 1
+
+
+def _rendercv_version() -> str:
+    try:
+        return version("rendercv")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def render_cache_key(rendercv_input: dict[str, Any]) -> str:
+    """Hash a complete RenderCV input (cv, design, locale, settings)."""
+    current_date = rendercv_input.get("settings", {}).get("current_date")
+    fingerprint = {
+        "version": RENDER_CACHE_VERSION,
+        "rendercv": _rendercv_version(),
+        "date": None
+        if current_date not in (None, "today")
+        else date.today().isoformat(),
+        "input": rendercv_input,
+    }
+    payload = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _place(source: Path, destination: Path) -> None:
+    """Hard-link `source` to `destination`, copying across filesystems."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destination.with_name(f".{destination.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copy2(source, tmp)
+    os.replace(tmp, destination)
+
+
+class RenderCache:
+    """Rendered PDFs stored by the hash of their RenderCV input."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int | None = 500 * 1024 * 1024,
+        max_age: float | None = 90 * 24 * 3600,
+    ):
+        """
+        Args:
+            root: Directory of the stored PDFs (created if missing)
+            max_bytes: Size budget before LRU eviction, None for unbounded
+            max_age: Seconds a PDF is kept unused, None to keep it forever
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = CacheStats()
+        root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str, destination: Path) -> Path | None:
+        """Place the stored PDF of a key at `destination`, if there is one."""
+        stored = self._path(key)
+        if not stored.exists():
+            self.stats.misses += 1
+            return None
+        _place(stored, destination)
+        os.utime(stored)  # mtime is the last use, for eviction
+        self.stats.hits += 1
+        logger.info("Reused rendered PDF", key=key[:12], path=str(destination))
+        return destination
+
+    def put(self, key: str, pdf_path: Path) -> None:
+        """Store a freshly rendered PDF under its input hash."""
+        _place(pdf_path, self._path(key))
+        self._evict()
+
+    def clear(self) -> None:
+        """Delete every stored PDF."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _evict(self) -> None:
+        """Drop PDFs unused for max_age, then least recently used over budget."""
+        entries = []
+        for path in self.root.glob("*/*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # evicted concurrently
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        expired = 0
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            while entries and entries[0][0] < cutoff:
+                entries.pop(0)[2].unlink(missing_ok=True)
+                expired += 1
+
+        evicted = 0
+        if self.max_bytes is not None:
+            total = sum(size for _, size, _ in entries)
+            while entries and total > self.max_bytes:
+                _, size, path = entries.pop(0)
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+        if expired or evicted:
+            self.stats.expired += expired
+            self.stats.evictions += evicted
+            logger.debug("Render cache eviction", expired=expired, evicted=evicted)
+
+
+# Global cache instance
+_render_cache: RenderCache | None = None
+
+
+def get_render_cache() -> RenderCache:
+    """Get the render cache stored in the hireme directory."""
+    global _render_cache
+    if _render_cache is None:
+        from hireme.config import cfg
+
+        _render_cache = RenderCache(cfg.hireme_dir / "cache" / "renders")
+    return _render_cache
@@ -0,0 +1,190 @@
+"""Warm RenderCV workers rendering resumes in-process.
+
+`run_rendercv` starts the `rendercv` CLI for each resume, paying the
+interpreter startup, the RenderCV/Typst imports and the font scan every
+time. The render pool keeps long-lived worker processes instead: each one
+imports RenderCV and builds its Typst compiler (fonts, bundled package)
+once, then takes render jobs from the pool's queue.
+
+RenderCV's own compiler cache is keyed by the input directory, which
+changes with every resume. Workers cache their compilers by user font
+folder instead (none for most inputs) and pass each job's output directory
+as the Typst root when compiling, so a compiler is reused across resumes
+without giving Typst access beyond the directory it renders.
+
+The worker path uses RenderCV's Python modules, pinned to the 2.8 series in
+the project dependencies; when they cannot be imported, workers fall back
+to the `rendercv` CLI.
+"""
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(logger_name=__name__)
+
+# Renders a RenderCV YAML input into an output dir, returns the PDF path
+RenderFunction = Callable[[Path, Path], Path]
+
+# Typst compilation is CPU bound: leave cores for the rest
+DEFAULT_RENDER_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def _user_fonts(yaml_path: Path) -> Path | None:
+    """The `fonts` folder next to a RenderCV input, as RenderCV resolves it."""
+    fonts_dir = yaml_path.absolute().parent / "fonts"
+    return fonts_dir if fonts_dir.is_dir() else None
+
+
+@functools.cache
+def _typst_compiler(user_fonts: Path | None = None):
+    """Build a Typst compiler once per user font folder.
+
+    The root is given per compilation, so the font scan and the bundled
+    package are shared by every resume using the same fonts.
+    """
+    import rendercv_fonts
+    import typst
+    from rendercv.renderer.pdf_png import get_package_path
+
+    font_paths = list(rendercv_fonts.paths_to_font_folders)
+    if user_fonts is not None:
+        font_paths.append(user_fonts)
+    return typst.Compiler(font_paths=font_paths, package_path=get_package_path())
+
+
+def warm_up() -> None:
+    """Import RenderCV and build the Typst compiler ahead of the first job."""
+    try:
+        import rendercv.renderer.typst  # noqa: F401  # templates and schema
+    except ImportError:
+        logger.warning("RenderCV modules unavailable, workers will use the CLI")
+        return
+
+    _typst_compiler()
+
+
+def render_pdf(yaml_path: Path, output_dir: Path) -> Path:
+    """Render a RenderCV YAML input to PDF with the RenderCV Python API.
+
+    Writes `<stem>.typ` and `<stem>.pdf` into `output_dir`, like
+    `run_rendercv` with markdown, HTML and PNG outputs disabled. Falls back
+    to `run_rendercv` when the RenderCV modules cannot be imported (a
+    RenderCV release outside the supported series).
+
+    Raises:
+        RuntimeError: RenderCV rejected the input
+    """
+    try:
+        from rendercv.exception import (
+            RenderCVUserError,
+            RenderCVUserValidationError,
+        )
+        from rendercv.renderer.pdf_png import copy_photo_next_to_typst_file
+        from rendercv.renderer.typst import generate_typst
+        from rendercv.schema.rendercv_model_builder import (
+            build_rendercv_dictionary_and_model,
+        )
+    except ImportError:
+        from hireme.utils.rendercv_helpers import run_rendercv
+
+        return run_rendercv(yaml_path, output_dir)
+
+    output_dir = output_dir.absolute()
+    pdf_path = output_dir / f"{yaml_path.stem}.pdf"
+    try:
+        _, model = build_rendercv_dictionary_and_model(
+            yaml_path.read_text(encoding="utf-8"),
+            input_file_path=yaml_path.absolute(),
+            output_folder=output_dir,
+            typst_path=output_dir / f"{yaml_path.stem}.typ",
+            pdf_path=pdf_path,
+            dont_generate_markdown=True,
+            dont_generate_html=True,
+            dont_generate_png=True,
+        )
+    except RenderCVUserValidationError as e:
+        errors = "; ".join(error.message for error in e.validation_errors)
+        raise RuntimeError(f"RenderCV failed: {errors}") from e
+    except RenderCVUserError as e:
+        raise RuntimeError(f"RenderCV failed: {e.message}") from e
+
+    typst_path = generate_typst(model)
+    if typst_path is None:
+        raise RuntimeError("RenderCV failed: Typst generation is disabled")
+    copy_photo_next_to_typst_file(model, typst_path)
+    _typst_compiler(_user_fonts(yaml_path)).compile(
+        input=typst_path, format="pdf", output=pdf_path, root=typst_path.parent
+    )
+    return pdf_path
+
+
+class RenderPool:
+    """Long-lived render workers fed through the executor's job queue."""
+
+    def __init__(
+        self,
+        workers: int,
+        processes: bool = True,
+        render: RenderFunction = render_pdf,
+    ):
+        """
+        Args:
+            workers: Renders running at once
+            processes: Render in worker processes (threads otherwise, for
+                callers that cannot spawn processes)
+            render: Render function run by the workers (must be picklable
+                with processes)
+        """
+        self.workers = max(1, workers)
+        self.render_fn = render
+        self._executor: Executor
+        if processes:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=warm_up)
+        else:
+            self._executor = ThreadPoolExecutor(self.workers, "render")
+
+    async def render(self, yaml_path: Path, output_dir: Path | None = None) -> Path:
+        """Queue a render job and wait for its PDF."""
+        if output_dir is None:
+            output_dir = yaml_path.parent
+        loop = asyncio.get_running_loop()
+        pdf_path = await loop.run_in_executor(
+            self._executor, self.render_fn, yaml_path, output_dir
+        )
+        logger.info("Resume PDF generated", path=str(pdf_path))
+        return pdf_path
+
+    def shutdown(self) -> None:
+        """Stop the workers once the queued jobs are done."""
+        self._executor.shutdown(wait=True, cancel_futures=False)
+
+
+# Global pool instance
+_render_pool: RenderPool | None = None
+
+
+def get_render_pool(workers: int | None = None) -> RenderPool:
+    """Get the process-wide render pool, created on first use.
+
+    Args:
+        workers: Pool size when it gets created (default: one per two cores,
+            at most 4)
+    """
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = RenderPool(workers or DEFAULT_RENDER_WORKERS)
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the process-wide render pool, if it was started."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
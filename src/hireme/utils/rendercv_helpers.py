@@ -1,3 +1,4 @@
+import asyncio
 import subprocess
 from pathlib import Path
 
@@ -115,14 +116,32 @@ def load_design_template() -> dict:
     return design_data or {}
 
 
-def generate_rendercv_input(resume: TailoredResume, output_dir: Path) -> Path:
-    """Generate the complete RenderCV input YAML file."""
+def build_rendercv_input(resume: TailoredResume) -> dict:
+    """Build the complete RenderCV input (cv data plus design template)."""
     cv_data = convert_to_rendercv_yaml(resume)
     design_data = load_design_template()
-    complete_data = {**cv_data, **design_data}
+    return {**cv_data, **design_data}
 
+
+def rendercv_input_path(resume: TailoredResume, output_dir: Path) -> Path:
+    """Get the path of a resume's RenderCV input YAML file."""
     safe_name = resume.name.replace(" ", "_").lower()
-    output_file = output_dir / f"{safe_name}_cv.yaml"
+    return output_dir / f"{safe_name}_cv.yaml"
+
+
+def generate_rendercv_input(
+    resume: TailoredResume, output_dir: Path, complete_data: dict | None = None
+) -> Path:
+    """Generate the complete RenderCV input YAML file.
+
+    Args:
+        resume: Tailored resume to render
+        output_dir: Directory of the YAML file
+        complete_data: Prebuilt `build_rendercv_input` output, if any
+    """
+    if complete_data is None:
+        complete_data = build_rendercv_input(resume)
+    output_file = rendercv_input_path(resume, output_dir)
 
     with open(output_file, "w") as f:
         yaml.dump(
@@ -137,17 +156,12 @@ def generate_rendercv_input(resume: TailoredResume, output_dir: Path) -> Path:
     return output_file
 
 
-def run_rendercv(yaml_path: Path, output_dir: Path | None = None) -> Path:
-    """Run RenderCV to generate the PDF resume."""
-    if output_dir is None:
-        output_dir = yaml_path.parent
-
-    cmd = [
+def rendercv_command(yaml_path: Path, output_dir: Path) -> list[str]:
+    """Build the RenderCV CLI command rendering a YAML input to a PDF."""
+    return [
         "rendercv",
         "render",
         str(yaml_path.absolute()),
-        "--output-folder-name",
-        str(output_dir.absolute()) + "/",
         "-pdf",
         str(output_dir.absolute()) + "/" + yaml_path.stem + ".pdf",
         "-typ",
@@ -157,20 +171,60 @@ def run_rendercv(yaml_path: Path, output_dir: Path | None = None) -> Path:
         "-nopng",
     ]
 
+
+def _rendered_pdf(yaml_path: Path, output_dir: Path) -> Path:
+    """Locate the PDF RenderCV wrote for a YAML input.
+
+    The command names the PDF after the input, so any other PDF in the
+    output directory belongs to another render and is never returned.
+
+    Raises:
+        FileNotFoundError: RenderCV did not write the expected PDF
+    """
+    pdf_path = output_dir / f"{yaml_path.stem}.pdf"
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"RenderCV did not generate {pdf_path}")
+    logger.info("Resume PDF generated", path=str(pdf_path))
+    return pdf_path
+
+
+def run_rendercv(yaml_path: Path, output_dir: Path | None = None) -> Path:
+    """Run RenderCV to generate the PDF resume."""
+    if output_dir is None:
+        output_dir = yaml_path.parent
+
+    cmd = rendercv_command(yaml_path, output_dir)
     logger.info("Running RenderCV", command=" ".join(cmd))
 
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         logger.debug("RenderCV stdout", output=result.stdout)
-
-        pdf_files = list((output_dir).glob("*.pdf"))
-        if pdf_files:
-            pdf_path = pdf_files[0]
-            logger.info("Resume PDF generated", path=str(pdf_path))
-            return pdf_path
-        else:
-            raise FileNotFoundError("RenderCV did not generate a PDF file")
+        return _rendered_pdf(yaml_path, output_dir)
 
     except subprocess.CalledProcessError as e:
         logger.error("RenderCV failed", stderr=e.stderr, stdout=e.stdout)
         raise RuntimeError(f"RenderCV failed: {e.stderr}") from e
+
+
+async def run_rendercv_async(yaml_path: Path, output_dir: Path | None = None) -> Path:
+    """Run RenderCV without blocking the event loop.
+
+    Same as `run_rendercv`, with the subprocess awaited so that several
+    renders (and LLM calls) can run at once.
+    """
+    if output_dir is None:
+        output_dir = yaml_path.parent
+
+    cmd = rendercv_command(yaml_path, output_dir)
+    logger.info("Running RenderCV", command=" ".join(cmd))
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        logger.error("RenderCV failed", stderr=stderr.decode(), stdout=stdout.decode())
+        raise RuntimeError(f"RenderCV failed: {stderr.decode()}")
+
+    logger.debug("RenderCV stdout", output=stdout.decode())
+    return _rendered_pdf(yaml_path, output_dir)
@@ -0,0 +1,29 @@
+"""Retry-After handling for throttled HTTP services.
+
+Shared by the scraper's host scheduler and the LLM provider schedulers:
+both pause for the delay a 429 (or 503) asked for, within a cap.
+"""
+
+import time
+from email.utils import parsedate_to_datetime
+
+# Never pause longer than this, whatever Retry-After says
+MAX_RETRY_AFTER = 300.0  # seconds
+
+
+def parse_retry_after(value: object) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date).
+
+    Returns:
+        The delay in seconds, or None if the value is missing or invalid
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -10,6 +10,43 @@ import pytest
 pytest_plugins = ("pytest_asyncio",)
 
 
+@pytest.fixture(autouse=True)
+def isolated_extraction_cache(tmp_path, monkeypatch):
+    """Keep the LLM extraction cache out of the user's hireme directory."""
+    from hireme.agents import job_agent
+    from hireme.utils.cache import PersistentCache
+
+    extraction_cache = PersistentCache(tmp_path / "extractions.sqlite3")
+    monkeypatch.setattr(job_agent, "_extraction_cache", extraction_cache)
+    yield extraction_cache
+    extraction_cache.close()
+
+
+@pytest.fixture(autouse=True)
+def single_model_router(monkeypatch):
+    """Route LLM calls to a single model, unless a test builds its own router."""
+    from hireme.agents import model_router
+
+    router = model_router.ModelRouter(
+        {
+            "job_extraction": ["mistral-medium-latest"],
+            "resume": ["mistral-medium-latest"],
+        }
+    )
+    monkeypatch.setattr(model_router, "_router", router)
+    return router
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm_scheduler(monkeypatch):
+    """Give each test its own LLM scheduler (budgets and stats)."""
+    from hireme.utils import llm_scheduler
+
+    scheduler = llm_scheduler.LLMScheduler()
+    monkeypatch.setattr(llm_scheduler, "_scheduler", scheduler)
+    return scheduler
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
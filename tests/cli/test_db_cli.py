@@ -19,7 +19,7 @@ from typer.testing import CliRunner
 
 from hireme.cli.commands.db_cli import app
 from hireme.db import ApplicationStatus, JobSource
-from hireme.db.database import DatabaseManager
+from hireme.db.database import DatabaseManager, JobOffer
 
 runner = CliRunner()
 
@@ -189,6 +189,14 @@ class TestDbJobsList:
         assert result.exit_code == 0
         # Should only show 1 job
 
+    def test_list_jobs_rejects_non_positive_limit(self, mock_get_db):
+        """Test that --limit must be at least 1."""
+        result = runner.invoke(app, ["jobs", "list", "--limit", "0"])
+
+        assert result.exit_code == 2
+        with pytest.raises(ValueError):
+            mock_get_db.list_job_summaries(limit=0)
+
     def test_list_jobs_empty_database(self, temp_db):
         """Test list with empty database."""
         with patch("hireme.cli.commands.db_cli.get_db", return_value=temp_db):
@@ -197,6 +205,66 @@ class TestDbJobsList:
             assert result.exit_code == 0
             assert "No job offers found" in result.output
 
+    def test_list_jobs_next_page(self, mock_get_db):
+        """Test that --after continues from the last job shown."""
+        first = runner.invoke(app, ["jobs", "list", "--limit", "1"])
+        assert "More jobs: --after" in first.output
+        after = first.output.split("--after")[-1].split()[0]
+
+        second = runner.invoke(app, ["jobs", "list", "--limit", "1", "--after", after])
+
+        assert second.exit_code == 0
+        assert "More jobs" not in second.output
+        assert ("TechCorp" in first.output) != ("TechCorp" in second.output)
+
+    def test_listing_leaves_heavy_columns_unloaded(self, db_with_data):
+        """Test that raw_text/processed_data are only loaded on request."""
+        from sqlalchemy import inspect
+
+        (job,) = db_with_data.get_all_jobs(only_processed=True)
+        assert {"raw_text", "processed_data"} <= inspect(job).unloaded
+
+        (job,) = db_with_data.get_all_jobs(
+            only_processed=True, with_processed_data=True
+        )
+        assert job.processed_data["title"] == "Python Developer"
+        assert "raw_text" in inspect(job).unloaded
+
+        job = db_with_data.get_job_by_id(job.id)
+        assert job.raw_text == "Sample job description for Python Developer"
+
+    def test_written_jobs_carry_their_payload(self, temp_db):
+        """Test that jobs returned by writes can be read once detached."""
+        job = temp_db.add_job_offer(
+            title="Data Engineer", company_name="Acme", raw_text="Build pipelines"
+        )
+        assert job.raw_text == "Build pipelines"
+
+        job = temp_db.mark_job_processed(job.id, {"title": "Data Engineer"})
+        assert job.processed_data == {"title": "Data Engineer"}
+        assert job.raw_text == "Build pipelines"
+
+    def test_search_returns_summaries(self, db_with_data):
+        """Test that search builds summaries from a column-only select."""
+        from hireme.db.schemas import JobOfferSummary
+
+        (job,) = db_with_data.search_job_summaries("techcorp")
+
+        assert isinstance(job, JobOfferSummary)
+        assert job.title == "Python Developer" and job.resumes_count == 1
+
+    def test_summaries_come_with_counts_and_status(self, db_with_data):
+        """Test that summary rows carry resume counts and application status."""
+        page = db_with_data.list_job_summaries(limit=10)
+
+        by_company = {job.company_name: job for job in page.jobs}
+        assert set(by_company) == {"TechCorp", "DataCo"}
+        assert by_company["TechCorp"].resumes_count == 1
+        assert by_company["TechCorp"].has_resume
+        assert by_company["TechCorp"].application_status == "applied"
+        assert by_company["DataCo"].resumes_count == 0
+        assert page.next_after is None
+
 
 # =============================================================================
 # Test: db jobs show
@@ -487,6 +555,25 @@ class TestDbImport:
                     assert result.exit_code == 0
                     assert "Imported" in result.output
 
+    def test_import_counts_only_new_raw_jobs(self, temp_db):
+        """Test that re-importing known raw jobs reports nothing imported."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job_dir = Path(tmpdir) / "job_offers"
+            raw_dir = job_dir / "raw"
+            raw_dir.mkdir(parents=True)
+            (raw_dir / "job_Python Developer-TechCorp.txt").write_text(
+                "Sample job description"
+            )
+
+            with patch("hireme.cli.commands.db_cli.get_db", return_value=temp_db):
+                with patch("hireme.config.cfg") as mock_cfg:
+                    mock_cfg.job_offers_dir = job_dir
+                    first = runner.invoke(app, ["import"])
+                    second = runner.invoke(app, ["import"])
+
+                    assert "Imported 1 job(s)" in first.output
+                    assert "Imported 0 job(s)" in second.output
+
     def test_import_processed_jobs(self, temp_db):
         """Test importing processed job JSON files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -514,3 +601,157 @@ class TestDbImport:
 
                     assert result.exit_code == 0
                     assert "Imported" in result.output
+
+
+# =============================================================================
+# Test: DatabaseManager engine
+# =============================================================================
+
+
+class TestDatabaseEngine:
+    """Tests for the tuned SQLite engine of DatabaseManager."""
+
+    def test_tuned_connections_use_wal(self, temp_db):
+        """Test that pooled connections get the performance pragmas."""
+        from sqlalchemy import text
+
+        with temp_db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 10_000
+
+    def test_defaults_kept_when_not_tuned(self):
+        """Test that tuned=False leaves SQLite's rollback journal."""
+        from sqlalchemy import text
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = DatabaseManager(db_path=Path(tmpdir) / "plain.db", tuned=False)
+            with db.engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+            db.close()
+
+    def test_reads_proceed_during_a_write(self, temp_db):
+        """Test that an open write transaction does not block readers."""
+        job = temp_db.add_job_offer(title="Python Developer", company_name="TechCorp")
+
+        with temp_db.get_session() as writer:
+            writer.get(JobOffer, job.id).title = "Senior Python Developer"
+            writer.flush()  # holds the write lock until commit
+
+            assert temp_db.get_job_by_id(job.id).title == "Python Developer"
+            writer.commit()
+
+        assert temp_db.get_job_by_id(job.id).title == "Senior Python Developer"
+
+
+# =============================================================================
+# Test: bulk job upsert
+# =============================================================================
+
+
+class TestUpsertJobOffers:
+    """Tests for DatabaseManager.upsert_job_offers and the dedup index."""
+
+    def test_flags_created_and_existing_jobs(self, temp_db):
+        """Test that known jobs are matched on their normalized key."""
+        from hireme.db.schemas import JobOfferCreate
+
+        existing = temp_db.add_job_offer(
+            title="Python Developer", company_name="TechCorp"
+        )
+
+        results = temp_db.upsert_job_offers(
+            [
+                JobOfferCreate(title="python  developer", company_name="TECHCORP"),
+                JobOfferCreate(title="Data Engineer", company_name="DataCorp"),
+                JobOfferCreate(title="Data engineer ", company_name="DataCorp"),
+            ]
+        )
+
+        assert [r.created for r in results] == [False, True, False]
+        assert results[0].id == existing.id
+        assert results[1].id == results[2].id
+        assert len(temp_db.get_all_jobs()) == 2
+
+    def test_archived_job_does_not_block_a_new_one(self, temp_db):
+        """Test that the dedup key is only unique among active jobs."""
+        from hireme.db.schemas import JobOfferCreate
+
+        old = temp_db.add_job_offer(title="Python Developer", company_name="TechCorp")
+        temp_db.archive_job(old.id)
+
+        (result,) = temp_db.upsert_job_offers(
+            [JobOfferCreate(title="Python Developer", company_name="TechCorp")]
+        )
+
+        assert result.created and result.id != old.id
+
+    def test_existing_database_gets_dedup_keys(self):
+        """Test that a database created before the dedup key is migrated."""
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "old.db"
+            db = DatabaseManager(db_path=db_path)
+            db.close()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("DROP INDEX ux_job_offers_dedup_key")
+                conn.execute("ALTER TABLE job_offers DROP COLUMN dedup_key")
+                conn.executemany(
+                    "INSERT INTO job_offers (title, company_name, source, is_processed,"
+                    " discovered_at, last_updated, is_archived)"
+                    " VALUES (?, ?, 'other', 0, ?, ?, 0)",
+                    [("Python Developer", "TechCorp", "2024-01-01", "2024-01-01")] * 2,
+                )
+            conn.close()
+
+            db = DatabaseManager(db_path=db_path)
+            job = db.add_job_offer(title="Python Developer", company_name="TechCorp")
+            db.close()
+
+            assert job.id == 1
+            assert job.dedup_key == "techcorp|python developer"
+
+
+# =============================================================================
+# Test: stats counters
+# =============================================================================
+
+
+class TestStatsCounters:
+    """Tests for the trigger-maintained counters behind get_application_stats."""
+
+    def test_counters_follow_changes(self, db_with_data):
+        """Test that counters match a recount after inserts, updates, deletes."""
+        stats = db_with_data.get_application_stats()
+        assert stats["total_jobs"] == 3
+        assert stats["processed_jobs"] == 1
+        assert stats["total_resumes"] == 1
+        assert stats["applied"] == 1 and stats["not_applied"] == 0
+        assert stats["by_source"] == {"indeed": 1, "other": 2}
+        assert sum(stats["by_week"].values()) == 3
+
+        jobs = {job.company_name: job for job in db_with_data.get_all_jobs()}
+        db_with_data.update_application_status(
+            jobs["TechCorp"].id, ApplicationStatus.INTERVIEWED
+        )
+        db_with_data.mark_job_processed(jobs["DataCo"].id, {"title": "Data Analyst"})
+        with db_with_data.get_session() as session:
+            session.delete(session.get(JobOffer, jobs["DataCo"].id))
+            session.commit()
+
+        stats = db_with_data.get_application_stats()
+        assert (stats["applied"], stats["interviewed"]) == (0, 1)
+        assert (stats["total_jobs"], stats["processed_jobs"]) == (2, 1)
+        assert stats["by_source"] == {"indeed": 1, "other": 1}
+        db_with_data.recount_stats()
+        assert db_with_data.get_application_stats() == stats
+
+    def test_stats_sections(self, mock_get_db):
+        """Test that db stats shows the per-source and per-week breakdowns."""
+        result = runner.invoke(app, ["stats"])
+
+        assert result.exit_code == 0
+        assert "Jobs by Source" in result.output
+        assert "indeed" in result.output
+        assert "Jobs per Week" in result.output
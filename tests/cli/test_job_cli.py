@@ -4,7 +4,10 @@ Tests for:
 - hireme job find (with various options)
 """
 
+import asyncio
+import math
 import tempfile
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -342,3 +345,1069 @@ class TestJobFindDatabaseIntegration:
 
             # Job should not be saved on failure
             mock_db.add_job_offer.assert_not_called()
+
+
+# =============================================================================
+# Test: job find - Pipeline
+# =============================================================================
+
+
+class TestJobPipeline:
+    """Tests for the concurrent search -> fetch -> extract -> persist pipeline."""
+
+    @staticmethod
+    async def _items(urls):
+        from hireme.agents.job_pipeline import JobItem
+
+        for url in urls:
+            yield JobItem(url=url, source="indeed")
+
+    async def test_processes_every_item(self):
+        """Test that each fetched posting is extracted and persisted."""
+        from hireme.agents.job_pipeline import run_job_pipeline
+
+        persisted = []
+        stats = await run_job_pipeline(
+            self._items([f"https://example.com/{i}" for i in range(5)]),
+            fetch=AsyncMock(side_effect=lambda url: f"posting {url}"),
+            clean=str.upper,
+            extract=AsyncMock(side_effect=lambda text: f"job {text}"),
+            persist=persisted.append,
+        )
+
+        assert len(persisted) == 5
+        assert persisted[0].text.startswith("POSTING")
+        assert stats["fetch"].done == 5
+        assert stats["persist"].done == 5
+
+    async def test_drops_failed_fetches(self):
+        """Test that postings that could not be fetched are not extracted."""
+        from hireme.agents.job_pipeline import run_job_pipeline
+
+        extract = AsyncMock(return_value="job")
+        stats = await run_job_pipeline(
+            self._items(["https://example.com/ok", "https://example.com/gone"]),
+            fetch=AsyncMock(side_effect=lambda url: None if "gone" in url else "x"),
+            clean=lambda text: text,
+            extract=extract,
+            persist=lambda item: None,
+        )
+
+        assert extract.call_count == 1
+        assert stats["fetch"].failed == 1
+
+    async def test_extraction_errors_do_not_stop_pipeline(self):
+        """Test that an exception in one item only drops that item."""
+        from hireme.agents.job_pipeline import run_job_pipeline
+
+        async def extract(text):
+            if text == "bad":
+                raise RuntimeError("LLM error")
+            return "job"
+
+        persisted = []
+        stats = await run_job_pipeline(
+            self._items(["bad", "good"]),
+            fetch=AsyncMock(side_effect=lambda url: url),
+            clean=lambda text: text,
+            extract=extract,
+            persist=persisted.append,
+        )
+
+        assert [item.url for item in persisted] == ["good"]
+        assert stats["extract"].failed == 1
+
+    async def test_fetch_overlaps_extraction(self):
+        """Test that later fetches run while earlier postings are extracted."""
+        import asyncio
+
+        from hireme.agents.job_pipeline import PipelineConfig, run_job_pipeline
+
+        events = []
+        first_extract_started = asyncio.Event()
+
+        async def fetch(url):
+            if url != "https://example.com/0":
+                await first_extract_started.wait()
+            events.append(("fetch", url))
+            return url
+
+        async def extract(text):
+            first_extract_started.set()
+            await asyncio.sleep(0.01)
+            events.append(("extract", text))
+            return "job"
+
+        await run_job_pipeline(
+            self._items([f"https://example.com/{i}" for i in range(3)]),
+            fetch=fetch,
+            clean=lambda text: text,
+            extract=extract,
+            persist=lambda item: None,
+            config=PipelineConfig(fetch_workers=2, extract_workers=1),
+        )
+
+        # Second posting fetched before the first extraction finished
+        assert events.index(("fetch", "https://example.com/1")) < events.index(
+            ("extract", "https://example.com/0")
+        )
+
+    async def test_bounded_queues_apply_back_pressure(self):
+        """Test that fetching waits when extraction falls behind."""
+        import asyncio
+
+        from hireme.agents.job_pipeline import PipelineConfig, run_job_pipeline
+
+        release = asyncio.Event()
+        fetched = []
+
+        async def fetch(url):
+            fetched.append(url)
+            return url
+
+        async def extract(text):
+            await release.wait()
+            return "job"
+
+        config = PipelineConfig(
+            fetch_workers=1, clean_workers=1, extract_workers=1, queue_size=1
+        )
+        task = asyncio.create_task(
+            run_job_pipeline(
+                self._items([f"https://example.com/{i}" for i in range(20)]),
+                fetch=fetch,
+                clean=lambda text: text,
+                extract=extract,
+                persist=lambda item: None,
+                config=config,
+            )
+        )
+        await asyncio.sleep(0.05)
+
+        # Only a few postings fit in the queues while extraction is blocked
+        assert len(fetched) < 10
+        release.set()
+        stats = await task
+        assert stats["persist"].done == 20
+
+    async def test_find_jobs_streams_search_results(self, mock_job_details):
+        """Test that scrapper mode feeds search results into the pipeline."""
+        from hireme.agents.job_agent import JobDetails
+        from hireme.agents.job_pipeline import PipelineConfig
+        from hireme.cli.commands.job_agent_cli import _find_jobs
+        from hireme.scraper.offers_finder import DEFAULT_SOURCES, JobSearchResult
+
+        mock_job = MagicMock(spec=JobDetails)
+        mock_job.title = "Python Developer"
+        mock_job.company = MagicMock()
+        mock_job.company.name = "TechCorp"
+
+        async def fake_search(*args, **kwargs):
+            for i in range(3):
+                yield JobSearchResult(url=f"https://example.com/{i}", source="wttj")
+
+        with (
+            patch("hireme.scraper.iter_jobs_async", fake_search),
+            patch(
+                "hireme.scraper.offers_parser.get_job_page_raw_async",
+                AsyncMock(return_value="Job posting"),
+            ),
+            patch(
+                "hireme.agents.job_agent.extract_job",
+                new_callable=AsyncMock,
+                return_value=mock_job,
+            ) as mock_extract,
+            patch("hireme.scraper.cleanup", new_callable=AsyncMock) as mock_cleanup,
+            patch(
+                "hireme.scraper.BrowserManager.set_pool_size", new_callable=AsyncMock
+            ) as mock_pool_size,
+        ):
+            await _find_jobs(
+                query="Python",
+                location="Paris",
+                max_results_per_source=3,
+                mode="scrapper",
+                save_to_db=False,
+                export_dir=None,
+            )
+
+        assert mock_extract.call_count == 3
+        mock_cleanup.assert_awaited_once()
+        # Search crawls get pages on top of the fetch workers
+        (pool_size,) = mock_pool_size.await_args.args
+        assert pool_size == PipelineConfig().fetch_workers + len(DEFAULT_SOURCES)
+
+
+# =============================================================================
+# Extraction cache Tests
+# =============================================================================
+
+
+class TestExtractionCache:
+    """Tests for the content-hash keyed extraction cache of extract_job."""
+
+    @staticmethod
+    def _job():
+        from hireme.agents.job_agent import CompanyInfo, JobDetails
+
+        return JobDetails(
+            title="Python Developer",
+            company=CompanyInfo(name="TechCorp"),
+            location="Paris, France",
+        )
+
+    def _agent(self, output):
+        result = MagicMock()
+        result.output = output
+        agent = MagicMock()
+        agent.run = AsyncMock(return_value=result)
+        return agent
+
+    async def test_identical_posting_hits_cache(self, isolated_extraction_cache):
+        """Test that a re-seen posting costs no LLM call."""
+        from hireme.agents.job_agent import JobDetails, extract_job
+
+        agent = self._agent(self._job())
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            first = await extract_job("Python   Developer\nat TechCorp")
+            second = await extract_job("Python Developer at TechCorp")
+
+        assert agent.run.await_count == 1
+        assert isinstance(second, JobDetails)
+        assert second == first
+        assert isolated_extraction_cache.stats.hits == 1
+
+    async def test_no_cache_always_calls_llm(self, isolated_extraction_cache):
+        """Test that use_cache=False bypasses reads and writes."""
+        from hireme.agents.job_agent import extract_job
+
+        agent = self._agent(self._job())
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            await extract_job("posting", use_cache=False)
+            await extract_job("posting", use_cache=False)
+
+        assert agent.run.await_count == 2
+        assert len(isolated_extraction_cache) == 0
+
+    async def test_failures_are_not_cached(self, isolated_extraction_cache):
+        """Test that ExtractionFailed results are retried next time."""
+        from hireme.agents.job_agent import ExtractionFailed, extract_job
+
+        agent = self._agent(ExtractionFailed(reason="not a job posting"))
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            await extract_job("hello")
+            await extract_job("hello")
+
+        assert agent.run.await_count == 2
+
+    async def test_invalid_entry_is_dropped(self, isolated_extraction_cache):
+        """Test that an entry no longer matching the schema is a miss."""
+        from hireme.agents.job_agent import extract_job, extraction_cache_key
+
+        isolated_extraction_cache.set(extraction_cache_key("posting"), '{"title": 1}')
+        agent = self._agent(self._job())
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            result = await extract_job("posting")
+
+        assert result.title == "Python Developer"
+        assert agent.run.await_count == 1
+
+    def test_key_depends_on_model(self):
+        """Test that switching models invalidates cached extractions."""
+        from hireme.agents.job_agent import extraction_cache_key
+
+        assert extraction_cache_key("posting", "model-a") != extraction_cache_key(
+            "posting", "model-b"
+        )
+        assert extraction_cache_key("a  b") == extraction_cache_key("a b")
+
+
+# =============================================================================
+# Batch extraction Tests
+# =============================================================================
+
+
+class TestExtractJobsBatch:
+    """Tests for concurrent batch extraction."""
+
+    async def test_results_follow_input_order(self):
+        """Test that results are aligned with the postings."""
+        import asyncio
+
+        from hireme.agents.job_agent import extract_jobs_batch
+
+        async def fake_extract(text, use_cache=True):
+            await asyncio.sleep(0.01 * (3 - int(text)))
+            return text
+
+        streamed = []
+        with patch("hireme.agents.job_agent.extract_job", side_effect=fake_extract):
+            results = await extract_jobs_batch(
+                ["0", "1", "2"],
+                concurrency=3,
+                on_result=lambda i, result: streamed.append(i),
+            )
+
+        assert results == ["0", "1", "2"]
+        assert streamed == [2, 1, 0]
+
+    async def test_caps_concurrency(self):
+        """Test that at most `concurrency` extractions run at once."""
+        import asyncio
+
+        from hireme.agents.job_agent import extract_jobs_batch
+
+        running = peak = 0
+
+        async def fake_extract(text, use_cache=True):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return text
+
+        with patch("hireme.agents.job_agent.extract_job", side_effect=fake_extract):
+            await extract_jobs_batch([str(i) for i in range(8)], concurrency=2)
+
+        assert peak == 2
+
+    async def test_errors_become_extraction_failed(self):
+        """Test that one failing extraction does not abort the batch."""
+        from hireme.agents.job_agent import ExtractionFailed, extract_jobs_batch
+
+        async def fake_extract(text, use_cache=True):
+            if text == "bad":
+                raise RuntimeError("provider down")
+            return text
+
+        with patch("hireme.agents.job_agent.extract_job", side_effect=fake_extract):
+            results = await extract_jobs_batch(["ok", "bad"])
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], ExtractionFailed)
+        assert "provider down" in results[1].reason
+
+    def test_concurrency_depends_on_provider(self):
+        """Test that local models get a lower default concurrency."""
+        from hireme.agents.job_agent import extraction_concurrency
+
+        assert extraction_concurrency("qwen3:14b") < extraction_concurrency(
+            "mistral-medium-latest"
+        )
+
+
+# =============================================================================
+# Rule pre-extraction Tests
+# =============================================================================
+
+RULE_POSTING = """Job title: Data Engineer
+Company: Acme
+Location: Lyon, France
+Contrat : CDI - Temps plein
+Hybride, 2 jours de télétravail par semaine
+Salaire : 45 - 55k€ brut annuel
+Pour postuler : https://acme.io/jobs/42/apply
+Contact : jobs@acme.io
+Date limite : 15/11/2026
+"""
+
+
+class TestRulePreExtraction:
+    """Tests for the rule-based pre-extractor."""
+
+    def test_finds_structured_fields(self):
+        """Test the individual matchers on a French posting."""
+        from hireme.agents.job_agent import ContractType, WorkMode
+        from hireme.agents.job_rules import pre_extract
+
+        findings = pre_extract(RULE_POSTING)
+
+        assert findings.contact_email == "jobs@acme.io"
+        assert findings.application_url == "https://acme.io/jobs/42/apply"
+        assert findings.application_deadline == "15/11/2026"
+        assert findings.contract_type == [ContractType.CDI, ContractType.FULL_TIME]
+        assert findings.work_mode is WorkMode.HYBRID
+        assert findings.salary is not None
+        assert (findings.salary.min_amount, findings.salary.max_amount) == (
+            45000,
+            55000,
+        )
+        assert findings.salary.period == "yearly"
+        assert findings.is_complete
+
+    def test_salary_formats(self):
+        """Test salary parsing across currencies and periods."""
+        from hireme.agents.job_rules import pre_extract
+
+        usd = pre_extract("Salary: $80,000 - $95,000 per year").salary
+        daily = pre_extract("TJM : 550 € / jour").salary
+
+        assert usd is not None and usd.currency == "USD"
+        assert (usd.min_amount, usd.max_amount) == (80000, 95000)
+        assert daily is not None and daily.period == "daily"
+        assert pre_extract("Series B, 20M€ raised in 2023").salary is None
+
+    def test_ambiguous_values_are_skipped(self):
+        """Test that conflicting matches are not reported."""
+        from hireme.agents.job_rules import pre_extract
+
+        findings = pre_extract(
+            "Write to a@acme.io or b@acme.io. Full remote or on-site, your call."
+        )
+
+        assert findings.contact_email is None
+        assert findings.work_mode is None
+
+    async def test_hints_sent_and_gaps_filled(self):
+        """Test that rule findings reach the prompt and fill the output."""
+        from hireme.agents.job_agent import (
+            CompanyInfo,
+            JobDetails,
+            WorkMode,
+            extract_job,
+        )
+
+        llm_job = JobDetails(
+            title="Data Engineer", company=CompanyInfo(name="Acme"), location="Lyon"
+        )
+        result = MagicMock(output=llm_job)
+        agent = MagicMock()
+        agent.run = AsyncMock(return_value=result)
+
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            job = await extract_job(RULE_POSTING)
+
+        assert "- contact_email: jobs@acme.io" in agent.run.call_args.args[0]
+        assert job.contact_email == "jobs@acme.io"
+        assert job.work_mode is WorkMode.HYBRID
+        assert job.location == "Lyon"  # LLM values win
+
+    async def test_skips_llm_when_rules_complete(self):
+        """Test the rules-only path."""
+        from hireme.agents.job_agent import extract_job
+
+        with patch("hireme.agents.job_agent.get_job_extraction_agent") as get_agent:
+            job = await extract_job(RULE_POSTING, skip_llm_when_complete=True)
+
+        get_agent.assert_not_called()
+        assert job.title == "Data Engineer"
+        assert job.company.name == "Acme"
+
+
+# =============================================================================
+# Posting compaction Tests
+# =============================================================================
+
+BODY_FALLBACK_PAGE = "\n".join(
+    [
+        "Se connecter",
+        "Mon compte",
+        "Data Engineer - Acme",
+        "Acme recrute un Data Engineer pour son équipe plateforme à Lyon, en CDI.",
+        "Vos missions :",
+        "- Concevoir et maintenir les pipelines de données batch et streaming",
+        "Profil recherché :",
+        "- 3 ans d'expérience en Python et SQL, idéalement sur Spark ou dbt",
+        "Rémunération et avantages",
+        "Salaire entre 45k et 55k euros selon expérience, tickets restaurant, mutuelle.",
+        "Offres similaires",
+        *[f"Data Analyst H/F {i}\nParis" for i in range(40)],
+        "Suivez-nous",
+        "LinkedIn",
+        "© 2026 All rights reserved",
+    ]
+)
+
+
+class TestPostingCompaction:
+    """Tests for token-budgeted compaction of postings."""
+
+    def test_short_postings_are_untouched(self):
+        """Test that postings under budget are passed through."""
+        from hireme.agents.job_compaction import compact_posting
+
+        result = compact_posting("Short posting", token_budget=100)
+
+        assert result.text == "Short posting"
+        assert result.ratio == 1.0
+
+    def test_keeps_relevant_sections_within_budget(self):
+        """Test that navigation and similar-jobs lists are dropped first."""
+        from hireme.agents.job_compaction import compact_posting
+
+        result = compact_posting(BODY_FALLBACK_PAGE, token_budget=200)
+
+        assert result.tokens <= 200
+        assert result.ratio < 0.5
+        assert "Vos missions" in result.text
+        assert "Salaire entre 45k" in result.text
+        assert "Offres similaires" not in result.text
+        assert "All rights reserved" not in result.text
+        # Original order is preserved
+        assert result.text.index("missions") < result.text.index("Salaire")
+
+    def test_oversized_section_is_truncated(self):
+        """Test that a single huge section is cut to the budget."""
+        from hireme.agents.job_compaction import compact_posting
+
+        text = "Missions :\n" + "\n".join(["Build data pipelines in Python."] * 200)
+
+        result = compact_posting(text, token_budget=50)
+
+        assert 0 < result.tokens <= 50
+        assert result.text.startswith("Missions :")
+
+    def test_keeps_header_without_keywords(self):
+        """Test that the title, company and location header is never dropped."""
+        from hireme.agents.job_compaction import compact_posting
+
+        text = "\n".join(
+            [
+                "Widget Maker",
+                "Globex - Springfield",
+                "Missions :",
+                *["Build and run the widget assembly lines every day."] * 30,
+            ]
+        )
+
+        result = compact_posting(text, token_budget=100)
+
+        assert result.tokens <= 100
+        assert result.text.startswith("Widget Maker\nGlobex - Springfield")
+        assert "Missions :" in result.text
+
+    async def test_llm_receives_compacted_text(self):
+        """Test that extract_job sends the compacted posting."""
+        from hireme.agents.job_agent import ExtractionFailed, extract_job
+
+        agent = MagicMock()
+        agent.run = AsyncMock(
+            return_value=MagicMock(output=ExtractionFailed(reason=""))
+        )
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent", return_value=agent
+        ):
+            await extract_job(BODY_FALLBACK_PAGE, token_budget=200)
+
+        prompt = agent.run.call_args.args[0]
+        assert "Vos missions" in prompt
+        assert "Offres similaires" not in prompt
+
+
+# =============================================================================
+# Packed extraction Tests
+# =============================================================================
+
+
+class TestPackedExtraction:
+    """Tests for multi-posting LLM requests."""
+
+    @staticmethod
+    def _job(title):
+        from hireme.agents.job_agent import CompanyInfo, JobDetails
+
+        return JobDetails(
+            title=title, company=CompanyInfo(name="Acme"), location="Lyon"
+        )
+
+    @staticmethod
+    def _run_result(output, tokens):
+        result = MagicMock(output=output)
+        result.usage.return_value = MagicMock(total_tokens=tokens)
+        return result
+
+    def test_pack_postings_is_greedy(self):
+        """Test packing by token budget and group size."""
+        from hireme.agents.job_batching import pack_postings
+
+        assert pack_postings([100, 100, 100, 500, 100], token_budget=300) == [
+            [0, 1, 2],
+            [3],
+            [4],
+        ]
+        assert pack_postings([1] * 5, max_postings=2) == [[0, 1], [2, 3], [4]]
+
+    async def test_packs_postings_into_one_request(self):
+        """Test that short postings share a request, aligned by index."""
+        from hireme.agents.job_agent import extract_jobs_batch, extraction_stats
+        from hireme.agents.job_batching import ExtractionBatch, PostingExtraction
+
+        batch = ExtractionBatch(
+            results=[
+                PostingExtraction(index=i, result=self._job(f"Job {i}"))
+                for i in (2, 0, 1)
+            ]
+        )
+        agent = MagicMock()
+        agent.run = AsyncMock(return_value=self._run_result(batch, 900))
+        requests = extraction_stats().requests
+
+        with patch(
+            "hireme.agents.job_batching.get_batch_extraction_agent",
+            return_value=agent,
+        ):
+            results = await extract_jobs_batch(
+                ["posting a", "posting b", "posting c"], pack=True, use_cache=False
+            )
+
+        assert [r.title for r in results] == ["Job 0", "Job 1", "Job 2"]
+        assert agent.run.await_count == 1
+        assert "### Posting 2" in agent.run.call_args.args[0]
+        assert extraction_stats().requests == requests + 1
+
+    async def test_malformed_batch_falls_back_to_single(self):
+        """Test that unanswered postings are extracted one by one."""
+        from hireme.agents.job_agent import extract_jobs_batch
+        from hireme.agents.job_batching import ExtractionBatch, PostingExtraction
+
+        batch = ExtractionBatch(
+            results=[
+                PostingExtraction(index=0, result=self._job("Job 0")),
+                PostingExtraction(index=7, result=self._job("Bogus")),
+            ]
+        )
+        batch_agent = MagicMock()
+        batch_agent.run = AsyncMock(return_value=self._run_result(batch, 500))
+        single_agent = MagicMock()
+        single_agent.run = AsyncMock(
+            return_value=self._run_result(self._job("Job 1"), 400)
+        )
+
+        with (
+            patch(
+                "hireme.agents.job_batching.get_batch_extraction_agent",
+                return_value=batch_agent,
+            ),
+            patch(
+                "hireme.agents.job_agent.get_job_extraction_agent",
+                return_value=single_agent,
+            ),
+        ):
+            results = await extract_jobs_batch(
+                ["posting a", "posting b"], pack=True, use_cache=False
+            )
+
+        assert [r.title for r in results] == ["Job 0", "Job 1"]
+        assert single_agent.run.await_count == 1
+
+    async def test_failed_request_falls_back_to_single(self):
+        """Test that a batch request error does not lose the postings."""
+        from hireme.agents.job_agent import extract_jobs_batch
+
+        batch_agent = MagicMock()
+        batch_agent.run = AsyncMock(side_effect=RuntimeError("invalid output"))
+        single_agent = MagicMock()
+        single_agent.run = AsyncMock(
+            return_value=self._run_result(self._job("Job"), 400)
+        )
+
+        with (
+            patch(
+                "hireme.agents.job_batching.get_batch_extraction_agent",
+                return_value=batch_agent,
+            ),
+            patch(
+                "hireme.agents.job_agent.get_job_extraction_agent",
+                return_value=single_agent,
+            ),
+        ):
+            results = await extract_jobs_batch(["a", "b"], pack=True, use_cache=False)
+
+        assert [r.title for r in results] == ["Job", "Job"]
+        assert single_agent.run.await_count == 2
+
+    async def test_failed_posting_is_a_valid_answer(self):
+        """Test that an ExtractionFailed entry does not reject the batch."""
+        from hireme.agents.job_agent import ExtractionFailed, extract_jobs_batch
+        from hireme.agents.job_batching import ExtractionBatch, PostingExtraction
+
+        batch = ExtractionBatch(
+            results=[
+                PostingExtraction(index=0, result=self._job("Job 0")),
+                PostingExtraction(
+                    index=1, result=ExtractionFailed(reason="not a job posting")
+                ),
+            ]
+        )
+        batch_agent = MagicMock()
+        batch_agent.run = AsyncMock(return_value=self._run_result(batch, 500))
+        single_agent = MagicMock()
+        single_agent.run = AsyncMock()
+
+        with (
+            patch(
+                "hireme.agents.job_batching.get_batch_extraction_agent",
+                return_value=batch_agent,
+            ),
+            patch(
+                "hireme.agents.job_agent.get_job_extraction_agent",
+                return_value=single_agent,
+            ),
+        ):
+            results = await extract_jobs_batch(
+                ["posting a", "posting b"], pack=True, use_cache=False
+            )
+
+        assert results[0].title == "Job 0"
+        assert isinstance(results[1], ExtractionFailed)
+        assert batch_agent.run.await_count == 1
+        single_agent.run.assert_not_called()
+
+    async def test_fallback_postings_run_concurrently(self):
+        """Test that unanswered postings are extracted at the same time."""
+        from hireme.agents.job_agent import extract_jobs_batch
+
+        running = 0
+        peak = 0
+
+        async def single_run(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return self._run_result(self._job("Job"), 400)
+
+        batch_agent = MagicMock()
+        batch_agent.run = AsyncMock(side_effect=RuntimeError("invalid output"))
+        single_agent = MagicMock()
+        single_agent.run = AsyncMock(side_effect=single_run)
+
+        with (
+            patch(
+                "hireme.agents.job_batching.get_batch_extraction_agent",
+                return_value=batch_agent,
+            ),
+            patch(
+                "hireme.agents.job_agent.get_job_extraction_agent",
+                return_value=single_agent,
+            ),
+        ):
+            results = await extract_jobs_batch(
+                ["a", "b", "c"], pack=True, use_cache=False
+            )
+
+        assert [r.title for r in results] == ["Job", "Job", "Job"]
+        assert peak == 3
+
+
+# =============================================================================
+# Model router Tests
+# =============================================================================
+
+
+class TestModelRouter:
+    """Tests for the local-first model cascade."""
+
+    @staticmethod
+    def _agents(outputs):
+        """Agents per model answering `outputs[model]` (raised if exception)."""
+        agents = {}
+        for model, output in outputs.items():
+            agent = MagicMock()
+            if isinstance(output, Exception):
+                agent.run = AsyncMock(side_effect=output)
+            else:
+                result = MagicMock(output=output)
+                result.usage.return_value = MagicMock(total_tokens=100)
+                agent.run = AsyncMock(return_value=result)
+            agents[model] = agent
+        return agents
+
+    @staticmethod
+    def _job(location="Lyon"):
+        from hireme.agents.job_agent import CompanyInfo, JobDetails
+
+        return JobDetails(
+            title="Data Engineer", company=CompanyInfo(name="Acme"), location=location
+        )
+
+    async def test_local_answer_is_kept(self):
+        """Test that a valid local answer does not reach the big model."""
+        from hireme.agents.job_agent import job_output_check
+        from hireme.agents.model_router import ModelRouter
+
+        router = ModelRouter({"job_extraction": ["local", "big"]})
+        agents = self._agents({"local": self._job(), "big": self._job()})
+
+        routed = await router.run(
+            "job_extraction", "prompt", agents.__getitem__, job_output_check
+        )
+
+        assert routed.model == "local"
+        assert routed.escalations == 0
+        agents["big"].run.assert_not_called()
+        assert router.stats["job_extraction"].models["local"].tokens == 100
+
+    async def test_escalates_low_confidence_output(self):
+        """Test that placeholder required fields go to the next model."""
+        from hireme.agents.job_agent import job_output_check
+        from hireme.agents.model_router import ModelRouter
+
+        router = ModelRouter({"job_extraction": ["local", "big"]})
+        agents = self._agents(
+            {"local": self._job(location="Unknown"), "big": self._job()}
+        )
+
+        routed = await router.run(
+            "job_extraction", "prompt", agents.__getitem__, job_output_check
+        )
+
+        assert routed.model == "big"
+        assert routed.tokens == 200
+        assert router.stats["job_extraction"].escalations == 1
+
+    async def test_escalates_errors_and_trips_breaker(self):
+        """Test that a local server that is down gets skipped."""
+        from hireme.agents.model_router import ModelRouter
+        from hireme.utils.circuit_breaker import CircuitBreaker
+
+        router = ModelRouter(
+            {"job_extraction": ["local", "big"]},
+            breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60),
+        )
+        agents = self._agents({"local": ConnectionError("refused"), "big": self._job()})
+
+        for _ in range(2):
+            routed = await router.run(
+                "job_extraction", "prompt", agents.__getitem__, lambda output: None
+            )
+            assert routed.model == "big"
+
+        assert agents["local"].run.await_count == 1
+
+    async def test_last_model_errors_are_raised(self):
+        """Test that nothing is swallowed once the cascade is exhausted."""
+        from hireme.agents.model_router import ModelRouter
+
+        router = ModelRouter({"job_extraction": ["big"]})
+        agents = self._agents({"big": RuntimeError("boom")})
+
+        with pytest.raises(RuntimeError):
+            await router.run(
+                "job_extraction", "prompt", agents.__getitem__, lambda output: None
+            )
+
+    async def test_extract_job_uses_cascade(self, monkeypatch):
+        """Test that extract_job escalates failed local extractions."""
+        from hireme.agents import model_router
+        from hireme.agents.job_agent import ExtractionFailed, extract_job
+
+        monkeypatch.setattr(
+            model_router,
+            "_router",
+            model_router.ModelRouter(
+                {"job_extraction": ["qwen3:14b", "mistral-medium-latest"]}
+            ),
+        )
+        agents = self._agents(
+            {
+                "qwen3:14b": ExtractionFailed(reason="confused"),
+                "mistral-medium-latest": self._job(),
+            }
+        )
+
+        with patch(
+            "hireme.agents.job_agent.get_job_extraction_agent",
+            side_effect=lambda model: agents[model],
+        ):
+            job = await extract_job("posting", use_cache=False)
+
+        assert job.title == "Data Engineer"
+        assert agents["qwen3:14b"].run.await_count == 1
+
+    @pytest.mark.parametrize(
+        ("available", "expected"),
+        [
+            (True, ["qwen3:14b", "mistral-medium-latest"]),
+            (False, ["mistral-medium-latest"]),
+        ],
+    )
+    def test_local_models_need_ollama(self, monkeypatch, available, expected):
+        """Test that local models are dropped when Ollama does not answer."""
+        from hireme.agents.model_router import reachable_models
+        from hireme.utils import providers
+
+        monkeypatch.setattr(providers, "ollama_available", lambda: available)
+
+        assert reachable_models(["qwen3:14b", "mistral-medium-latest"]) == expected
+        # A local-only cascade is kept so that its errors are reported
+        assert reachable_models(["qwen3:14b"]) == ["qwen3:14b"]
+
+    def test_ollama_probe_runs_once(self):
+        """Test that the Ollama server is probed once per process."""
+        import httpx
+
+        from hireme.utils.providers import ollama_available
+
+        ollama_available.cache_clear()
+        try:
+            with patch(
+                "hireme.utils.providers.httpx.get",
+                side_effect=httpx.ConnectError("refused"),
+            ) as mock_get:
+                assert not ollama_available()
+                assert not ollama_available()
+        finally:
+            ollama_available.cache_clear()
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/api/version")
+
+
+class TestLLMScheduler:
+    """Tests for the per-provider LLM request scheduler."""
+
+    @staticmethod
+    def _provider(rpm=math.inf, tpm=math.inf, concurrency=1):
+        from hireme.utils.llm_scheduler import ProviderScheduler
+        from hireme.utils.providers import ProviderLimits
+
+        return ProviderScheduler("test", ProviderLimits(rpm, tpm, concurrency))
+
+    async def test_interactive_requests_jump_the_queue(self):
+        """Test that queued interactive requests start before batch ones."""
+        provider = self._provider()
+        await provider.acquire(10)
+        started = []
+
+        async def request(name, priority):
+            await provider.acquire(10, priority)
+            started.append(name)
+            provider.release(10, 10)
+
+        batch = asyncio.create_task(request("batch", "batch"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", "interactive"))
+        await asyncio.sleep(0)
+        assert provider.stats.queue_depth == 2
+
+        provider.release(10, 10)
+        await asyncio.gather(batch, interactive)
+
+        assert started == ["interactive", "batch"]
+        assert provider.stats.max_queue_depth == 2
+
+    async def test_request_budget_and_deadline(self):
+        """Test that a request over the RPM budget expires at its deadline."""
+        from hireme.utils.llm_scheduler import DeadlineExceeded
+
+        provider = self._provider(rpm=1, concurrency=4)
+        await provider.acquire(10)
+
+        with pytest.raises(DeadlineExceeded):
+            await provider.acquire(10, deadline=time.monotonic() + 0.05)
+
+        assert provider.stats.expired == 1
+        assert provider.stats.queue_depth == 0
+        assert provider.in_flight == 1
+
+    async def test_token_budget_charges_actual_usage(self):
+        """Test that tokens used over the estimate delay the next request."""
+        from hireme.utils.llm_scheduler import DeadlineExceeded
+
+        provider = self._provider(tpm=600, concurrency=4)
+        await provider.acquire(100)
+        provider.release(100, 600)
+
+        with pytest.raises(DeadlineExceeded):
+            await provider.acquire(100, deadline=time.monotonic() + 0.05)
+
+    async def test_throttled_call_is_retried(self):
+        """Test that a 429 pauses the provider and the call is retried."""
+        from pydantic_ai.exceptions import ModelHTTPError
+
+        from hireme.utils.llm_scheduler import LLMScheduler
+
+        scheduler = LLMScheduler()
+        call = AsyncMock(
+            side_effect=[
+                ModelHTTPError(429, "qwen3:14b", headers={"retry-after": "0"}),
+                "answer",
+            ]
+        )
+
+        assert await scheduler.run("qwen3:14b", call, estimated_tokens=10) == "answer"
+
+        stats = scheduler.stats()["ollama"]
+        assert call.await_count == 2
+        assert stats.throttled == 1
+        assert stats.requests == 2
+        assert scheduler.for_model("qwen3:14b").in_flight == 0
+
+    async def test_retry_after_read_from_provider_error(self):
+        """Test that Retry-After is found on the SDK error behind ModelHTTPError."""
+        import httpx
+        from pydantic_ai.exceptions import ModelHTTPError
+
+        from hireme.utils.llm_scheduler import retry_after_of
+
+        sdk_error = Exception("rate limited")
+        sdk_error.raw_response = httpx.Response(429, headers={"Retry-After": "7"})
+        error = ModelHTTPError(429, "mistral-medium-latest")
+        error.headers = None
+        error.__cause__ = sdk_error
+
+        assert retry_after_of(error) == 7.0
+        assert retry_after_of(ModelHTTPError(429, "qwen3:14b")) is None
+
+    async def test_scheduling_timeout_expires_queued_calls(self):
+        """Test that calls queued past the scheduling timeout fail fast."""
+        from hireme.utils import llm_scheduler
+        from hireme.utils.providers import ProviderLimits
+
+        scheduler = llm_scheduler.LLMScheduler(
+            {"ollama": ProviderLimits(1, 1_000_000, 4)}
+        )
+        call = AsyncMock(return_value="answer")
+        await scheduler.run("qwen3:14b", call, estimated_tokens=10)
+
+        with (
+            llm_scheduler.scheduling("interactive", timeout=0.05),
+            pytest.raises(llm_scheduler.DeadlineExceeded),
+        ):
+            await scheduler.run("qwen3:14b", call, estimated_tokens=10)
+
+        assert call.await_count == 1
+        assert scheduler.stats()["ollama"].expired == 1
+
+    async def test_other_errors_are_not_retried(self):
+        """Test that non-429 errors are raised and free their slot."""
+        from hireme.utils.llm_scheduler import LLMScheduler
+
+        scheduler = LLMScheduler()
+        call = AsyncMock(side_effect=ConnectionError("refused"))
+
+        with pytest.raises(ConnectionError):
+            await scheduler.run("qwen3:14b", call, estimated_tokens=10)
+
+        assert call.await_count == 1
+        assert scheduler.for_model("qwen3:14b").in_flight == 0
+
+    async def test_scheduling_sets_priority(self):
+        """Test that calls inside a scheduling block use its priority."""
+        from hireme.utils import llm_scheduler
+
+        scheduler = llm_scheduler.LLMScheduler()
+        provider = scheduler.for_model("qwen3:14b")
+        acquire = AsyncMock(return_value=0.0)
+
+        with (
+            patch.object(provider, "acquire", acquire),
+            patch.object(provider, "release"),
+            llm_scheduler.scheduling("batch"),
+        ):
+            await scheduler.run("qwen3:14b", AsyncMock(), estimated_tokens=10)
+
+        assert acquire.await_args.args[1] == "batch"
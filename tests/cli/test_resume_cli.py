@@ -4,6 +4,8 @@ Tests for:
 - hireme resume generate (with various options)
 """
 
+import asyncio
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -522,3 +524,411 @@ class TestResumeGenerateOptions:
                 )
 
                 # The command should accept the parse-job flag
+
+
+class TestPromptRegistry:
+    """Tests for the cached Langfuse prompt registry."""
+
+    @staticmethod
+    def _registry(fetch, tmp_path, ttl=300.0):
+        from hireme.agents.prompt_registry import PromptRegistry
+
+        (tmp_path / "resume_agent_text.md").write_text("file: {{user_context}}")
+        return PromptRegistry(fetch=fetch, fallback_dir=tmp_path, ttl=ttl)
+
+    async def test_fresh_prompt_is_fetched_once(self, tmp_path):
+        """Test that repeated lookups within the TTL hit the cache."""
+        fetch = MagicMock(return_value=("remote: {{user_context}}", 3))
+        registry = self._registry(fetch, tmp_path)
+
+        for _ in range(3):
+            prompt = await registry.get("resume_agent_text")
+
+        assert fetch.call_count == 1
+        assert prompt.version == 3
+        assert prompt.compile(user_context="me") == "remote: me"
+        assert registry.stats.misses == 1
+        assert registry.stats.hits == 2
+
+    async def test_stale_prompt_is_served_while_refreshing(self, tmp_path):
+        """Test stale-while-revalidate once the TTL is over."""
+        fetch = MagicMock(side_effect=[("v1", 1), ("v2", 2)])
+        registry = self._registry(fetch, tmp_path, ttl=0.0)
+
+        await registry.get("resume_agent_text")
+        stale = await registry.get("resume_agent_text")
+        await asyncio.sleep(0.05)  # let the background refresh land
+        registry.ttl = 300.0
+        fresh = await registry.get("resume_agent_text")
+
+        assert stale.template == "v1"
+        assert fresh.template == "v2"
+        assert registry.stats.stale_hits == 1
+
+    async def test_unreachable_langfuse_falls_back_to_file(self, tmp_path):
+        """Test that generation keeps working when Langfuse is down."""
+        fetch = MagicMock(side_effect=ConnectionError("unreachable"))
+        registry = self._registry(fetch, tmp_path)
+
+        prompt = await registry.get("resume_agent_text")
+        again = await registry.get("resume_agent_text")
+
+        assert prompt.source == "disk"
+        assert prompt.compile(user_context="me") == "file: me"
+        assert again is prompt
+        assert fetch.call_count == 1
+        assert registry.stats.fallbacks == 1
+
+    async def test_failed_refresh_keeps_stale_prompt(self, tmp_path):
+        """Test that a refresh error does not drop the cached template."""
+        fetch = MagicMock(side_effect=[("v1", 1), ConnectionError("down")])
+        registry = self._registry(fetch, tmp_path, ttl=0.0)
+
+        await registry.get("resume_agent_text")
+        await registry.get("resume_agent_text")
+        await asyncio.sleep(0.05)
+        registry.ttl = 300.0
+
+        assert (await registry.get("resume_agent_text")).template == "v1"
+        assert registry.stats.refresh_errors == 1
+
+    def test_compile_keeps_unknown_placeholders(self):
+        """Test that variables not given are left in place."""
+        from hireme.agents.prompt_registry import CachedPrompt
+
+        prompt = CachedPrompt("p", "{{ a }} and {{b}}", None, "disk", 0.0)
+
+        assert prompt.compile(a="x") == "x and {{b}}"
+
+
+class TestResumePipeline:
+    """Tests for the concurrent tailor -> render -> persist pipeline."""
+
+    @staticmethod
+    def _items(tmp_path, count):
+        from hireme.agents.job_agent import CompanyInfo, JobDetails
+        from hireme.agents.resume_pipeline import ResumeItem
+
+        return [
+            ResumeItem(
+                job_id=i,
+                job=JobDetails(
+                    title=f"Job {i}", company=CompanyInfo(name="Acme"), location="Lyon"
+                ),
+                output_dir=tmp_path / f"job_{i}",
+            )
+            for i in range(count)
+        ]
+
+    async def test_llm_calls_run_concurrently(self, tmp_path, mock_tailored_resume):
+        """Test that tailoring overlaps and every resume is persisted."""
+        from hireme.agents.resume_pipeline import (
+            ResumePipelineConfig,
+            run_resume_pipeline,
+        )
+
+        in_flight = peak = 0
+
+        async def tailor(job):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_tailored_resume
+
+        async def render(resume, output_dir):
+            return output_dir / "resume.pdf"
+
+        persisted = []
+        stats = await run_resume_pipeline(
+            self._items(tmp_path, 6),
+            tailor=tailor,
+            render=render,
+            persist=persisted.append,
+            config=ResumePipelineConfig(tailor_workers=3, render_workers=2),
+        )
+
+        assert peak == 3
+        assert sorted(item.job_id for item in persisted) == list(range(6))
+        assert all(
+            item.pdf_path == item.output_dir / "resume.pdf" for item in persisted
+        )
+        assert all(item.output_dir.is_dir() for item in persisted)
+        assert stats["render"].done == 6
+        assert stats["tailor"].avg_time > 0
+        assert set(persisted[0].timings) == {"tailor", "render", "persist"}
+
+    async def test_failures_are_reported_not_rendered(
+        self, tmp_path, mock_tailored_resume
+    ):
+        """Test that failed items skip rendering but still reach persist."""
+        from hireme.agents.resume_pipeline import run_resume_pipeline
+        from hireme.utils.models.resume_models import GenerationFailed
+
+        async def tailor(job):
+            if job.title == "Job 0":
+                return GenerationFailed(reason="not enough context")
+            return mock_tailored_resume
+
+        render = AsyncMock(side_effect=[RuntimeError("typst error")])
+        persisted = []
+
+        stats = await run_resume_pipeline(
+            self._items(tmp_path, 2),
+            tailor=tailor,
+            render=render,
+            persist=persisted.append,
+        )
+
+        errors = {item.job_id: item.error for item in persisted}
+        assert "not enough context" in errors[0]
+        assert errors[1] == "typst error"
+        assert render.await_count == 1
+        assert stats["tailor"].failed == 1
+        assert stats["render"].failed == 1
+        assert stats["persist"].done == 2
+
+
+def _fake_render(yaml_path, output_dir):
+    pdf_path = output_dir / f"{yaml_path.stem}.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    return pdf_path
+
+
+class TestRenderPool:
+    """Tests for the warm RenderCV worker pool."""
+
+    async def test_render_jobs_run_on_workers(self, tmp_path):
+        """Test that queued render jobs run concurrently on the pool."""
+        from hireme.utils.render_pool import RenderPool
+
+        pool = RenderPool(workers=2, processes=False, render=_fake_render)
+        try:
+            pdfs = await asyncio.gather(
+                *[pool.render(tmp_path / f"cv_{i}.yaml", tmp_path) for i in range(4)]
+            )
+        finally:
+            pool.shutdown()
+
+        assert [pdf.name for pdf in pdfs] == [f"cv_{i}.pdf" for i in range(4)]
+        assert all(pdf.read_bytes() == b"%PDF" for pdf in pdfs)
+
+    async def test_render_errors_propagate(self, tmp_path):
+        """Test that a failing render raises in the caller."""
+        from hireme.utils.render_pool import RenderPool
+
+        def broken(yaml_path, output_dir):
+            raise RuntimeError("RenderCV failed: bad date")
+
+        pool = RenderPool(workers=1, processes=False, render=broken)
+        try:
+            with pytest.raises(RuntimeError, match="bad date"):
+                await pool.render(tmp_path / "cv.yaml")
+        finally:
+            pool.shutdown()
+
+    def test_global_pool_is_shut_down(self, monkeypatch):
+        """Test that the process-wide pool is created once and released."""
+        from hireme.utils import render_pool
+
+        thread_pool = render_pool.RenderPool
+        monkeypatch.setattr(
+            render_pool,
+            "RenderPool",
+            lambda workers: thread_pool(workers, processes=False),
+        )
+
+        pool = render_pool.get_render_pool(3)
+        assert render_pool.get_render_pool() is pool
+        assert pool.workers == 3
+
+        render_pool.shutdown_render_pool()
+        assert render_pool._render_pool is None
+
+    def test_user_fonts_resolve_next_to_input(self, tmp_path, monkeypatch):
+        """Test that user fonts come from the input directory, not the cwd."""
+        from hireme.utils.render_pool import _user_fonts
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "fonts").mkdir()
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+
+        assert _user_fonts(job_dir / "cv.yaml") is None
+        (job_dir / "fonts").mkdir()
+        assert _user_fonts(job_dir / "cv.yaml") == job_dir / "fonts"
+
+    def test_render_falls_back_to_cli(self, tmp_path, monkeypatch):
+        """Test that workers use the CLI when RenderCV modules are missing."""
+        from hireme.utils import render_pool, rendercv_helpers
+
+        monkeypatch.setitem(sys.modules, "rendercv.exception", None)
+        monkeypatch.setattr(rendercv_helpers, "run_rendercv", _fake_render)
+
+        pdf_path = render_pool.render_pdf(tmp_path / "cv.yaml", tmp_path)
+
+        assert pdf_path == tmp_path / "cv.pdf"
+
+    def test_cli_render_returns_the_input_pdf(self, tmp_path):
+        """Test that another resume's PDF is never taken for the render."""
+        from hireme.utils.rendercv_helpers import run_rendercv
+
+        (tmp_path / "other_resume.pdf").write_bytes(b"%PDF")
+
+        with patch("hireme.utils.rendercv_helpers.subprocess.run"):
+            with pytest.raises(FileNotFoundError, match="cv.pdf"):
+                run_rendercv(tmp_path / "cv.yaml", tmp_path)
+
+            (tmp_path / "cv.pdf").write_bytes(b"%PDF")
+            assert run_rendercv(tmp_path / "cv.yaml", tmp_path) == tmp_path / "cv.pdf"
+
+
+class TestRenderCache:
+    """Tests for the content-addressed rendered PDF store."""
+
+    @staticmethod
+    def _resume(name="Jane Doe"):
+        from hireme.utils.models.resume_models import TailoredResume
+
+        return TailoredResume(
+            name=name,
+            email="jane@example.com",
+            location="Lyon",
+            education=[],
+            experience=[],
+            projects=[],
+            skills=[],
+        )
+
+    def test_key_covers_cv_and_design(self):
+        """Test that the key changes with any part of the RenderCV input."""
+        from hireme.utils.render_cache import render_cache_key
+
+        data = {"cv": {"name": "Jane"}, "design": {"theme": "sb2nov"}}
+
+        assert render_cache_key(data) == render_cache_key(dict(reversed(data.items())))
+        assert render_cache_key(data) != render_cache_key(
+            {**data, "design": {"theme": "classic"}}
+        )
+        assert render_cache_key(data) != render_cache_key(
+            {**data, "settings": {"current_date": "2024-01-01"}}
+        )
+
+    def test_stored_pdf_is_linked_into_output(self, tmp_path):
+        """Test that a hit places the stored PDF without copying it."""
+        from hireme.utils.render_cache import RenderCache
+
+        cache = RenderCache(tmp_path / "renders")
+        rendered = tmp_path / "first" / "cv.pdf"
+        rendered.parent.mkdir()
+        rendered.write_bytes(b"%PDF")
+
+        assert cache.get("ab" * 32, tmp_path / "second" / "cv.pdf") is None
+        cache.put("ab" * 32, rendered)
+        placed = cache.get("ab" * 32, tmp_path / "second" / "cv.pdf")
+
+        assert placed is not None and placed.read_bytes() == b"%PDF"
+        assert placed.stat().st_ino == rendered.stat().st_ino
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_old_and_least_recently_used_pdfs_are_evicted(self, tmp_path):
+        """Test that the store drops PDFs unused for too long, then over budget."""
+        import os
+        import time
+
+        from hireme.utils.render_cache import RenderCache
+
+        cache = RenderCache(tmp_path / "renders", max_bytes=8, max_age=3600)
+
+        def store(key, last_used_ago):
+            rendered = tmp_path / "cv.pdf"
+            rendered.write_bytes(b"%PDF")
+            cache.put(key, rendered)
+            rendered.unlink()
+            last_used = time.time() - last_used_ago
+            os.utime(cache.root / key[:2] / f"{key}.pdf", (last_used, last_used))
+
+        store("aa" * 32, last_used_ago=7200)
+        store("bb" * 32, last_used_ago=60)
+        store("cc" * 32, last_used_ago=0)
+        store("dd" * 32, last_used_ago=0)
+
+        stored = sorted(p.stem[:2] for p in cache.root.glob("*/*.pdf"))
+        assert stored == ["cc", "dd"]
+        assert (cache.stats.expired, cache.stats.evictions) == (1, 1)
+
+    async def test_unchanged_resume_is_not_rendered_again(self, tmp_path):
+        """Test that render_resume reuses the PDF of an identical input."""
+        pytest.importorskip("yaml")
+        from hireme.agents import resume_agent
+        from hireme.utils.render_cache import RenderCache
+
+        pool = MagicMock()
+        pool.render = AsyncMock(
+            side_effect=lambda yaml_path, output_dir: _fake_render(
+                yaml_path, output_dir
+            )
+        )
+        cache = RenderCache(tmp_path / "renders")
+
+        with (
+            patch.object(resume_agent, "get_render_pool", return_value=pool),
+            patch.object(resume_agent, "get_render_cache", return_value=cache),
+        ):
+            for job in ("job_1", "job_2"):
+                (tmp_path / job).mkdir()
+                pdf = await resume_agent.render_resume(self._resume(), tmp_path / job)
+                assert pdf.exists()
+                assert (tmp_path / job / "jane_doe_cv.yaml").exists()
+
+            (tmp_path / "job_3").mkdir()
+            await resume_agent.render_resume(
+                self._resume("John Roe"), tmp_path / "job_3"
+            )
+
+        assert pool.render.await_count == 2
+        assert cache.stats.hits == 1
+
+
+class TestUserContextCache:
+    """Tests for the memoized user context."""
+
+    @pytest.fixture
+    def common(self, monkeypatch):
+        from hireme.utils import common
+
+        monkeypatch.setattr(common, "_user_contexts", {})
+        return common
+
+    def test_user_context_is_memoized_until_files_change(
+        self, common, temp_profile_dir
+    ):
+        """Test that the profile is reloaded only when one of its files changes."""
+        (temp_profile_dir / "context.md").write_text("Backend developer")
+
+        with patch.object(
+            common, "load_text_content", wraps=common.load_text_content
+        ) as load_text:
+            first = common.load_user_context_from_directory(temp_profile_dir)
+            loads = load_text.call_count
+            second = common.load_user_context_from_directory(temp_profile_dir)
+            assert load_text.call_count == loads
+            assert second == first and second is not first
+
+            (temp_profile_dir / "context.md").write_text("Data engineer since 2018")
+            third = common.load_user_context_from_directory(temp_profile_dir)
+
+        assert load_text.call_count > loads
+        assert third.context_note == "Data engineer since 2018"
+
+    def test_pdfs_are_not_parsed(self, common, temp_profile_dir):
+        """Test that PDFs, absent from the context, are never parsed."""
+        (temp_profile_dir / "context.md").write_text("Backend developer")
+        (temp_profile_dir / "resume.pdf").write_bytes(b"%PDF-1.4")
+
+        with patch.object(common, "load_pdf_content") as load_pdf:
+            context = common.load_user_context_from_directory(temp_profile_dir)
+
+        load_pdf.assert_not_called()
+        assert context.context_note == "Backend developer"
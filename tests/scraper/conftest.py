@@ -4,10 +4,27 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from hireme.scraper import http_fetcher, playwright_scraper, rate_limiter, retry
+from hireme.utils.cache import PersistentCache
+
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
 
 
+@pytest.fixture(autouse=True)
+def isolated_page_store(tmp_path, monkeypatch):
+    """Isolate global scraper state (page store, routing, limits) per test."""
+    store = PersistentCache(tmp_path / "pages.sqlite3")
+    monkeypatch.setattr(playwright_scraper, "_page_store", store)
+    monkeypatch.setattr(http_fetcher, "_router", http_fetcher.FetchRouter())
+    monkeypatch.setattr(rate_limiter, "_scheduler", None)
+    monkeypatch.setattr(retry, "_breaker", None)
+    # Retry immediately: backoff timing is covered in test_retry.py
+    monkeypatch.setattr(playwright_scraper.DEFAULT_CONFIG, "retry_base_delay", 0.0)
+    yield store
+    store.close()
+
+
 @pytest.fixture
 def mock_page():
     """Create a mock Playwright page."""
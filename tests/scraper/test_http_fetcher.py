@@ -0,0 +1,248 @@
+"""Tests for http_fetcher.py - HTTP-first fetch path and per-domain routing."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from hireme.scraper import http_fetcher
+from hireme.scraper.http_fetcher import (
+    FetchRouter,
+    extract_main_content,
+    fetch_static_content,
+    get_router,
+)
+from hireme.scraper.playwright_scraper import (
+    BrowserManager,
+    ScraperConfig,
+    _extract_main_content,
+    get_cache,
+    get_page_content,
+)
+
+DESCRIPTION = "We are hiring a Python developer to build data pipelines. " * 5
+
+STATIC_HTML = f"""
+<html><body>
+  <nav>Menu</nav>
+  <main>
+    <h1>Python Developer</h1>
+    <div class="company">Acme</div>
+    <div class="location">Lyon, France</div>
+    <div id="jobDescriptionText"><p>{DESCRIPTION}</p><script>track()</script></div>
+  </main>
+</body></html>
+"""
+
+JS_ONLY_HTML = """
+<html><body><div id="root"></div><script src="/app.js"></script></body></html>
+"""
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Install a mock transport on the shared HTTP client."""
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_fetcher, "_client", client)
+        return client
+
+    yield install
+    monkeypatch.setattr(http_fetcher, "_client", None)
+
+
+# =============================================================================
+# Static extraction Tests
+# =============================================================================
+
+
+class TestExtractMainContent:
+    """Tests for extract_main_content."""
+
+    def test_extracts_main_region(self):
+        """Test extraction of the main region, header included, without scripts."""
+        text = extract_main_content(STATIC_HTML, "#jobDescriptionText")
+
+        assert text is not None
+        assert "Python developer" in text
+        assert "Python Developer" in text
+        assert "Acme" in text
+        assert "Lyon, France" in text
+        assert "track()" not in text
+        assert "Menu" not in text
+
+    def test_falls_back_to_body(self):
+        """Test that pages without a known region use the body text."""
+        html = f'<body><h1>Data Engineer</h1><div id="desc">{DESCRIPTION}</div></body>'
+
+        text = extract_main_content(html, "#desc")
+
+        assert text is not None
+        assert "Data Engineer" in text
+        assert "Python developer" in text
+
+    def test_missing_selector_returns_none(self):
+        """Test that JS-only pages need the browser."""
+        assert extract_main_content(JS_ONLY_HTML, "#jobDescriptionText") is None
+
+    def test_short_content_returns_none(self):
+        """Test that placeholder content is not accepted."""
+        html = '<div id="jobDescriptionText">Loading...</div>'
+        assert extract_main_content(html, "#jobDescriptionText") is None
+
+    async def test_matches_browser_extraction(self):
+        """Test that the HTTP and browser paths extract the same text."""
+        from playwright.async_api import Error, async_playwright
+
+        async with async_playwright() as p:
+            try:
+                browser = await p.chromium.launch()
+            except Error:
+                pytest.skip("Chromium is not installed")
+            try:
+                page = await browser.new_page()
+                await page.set_content(STATIC_HTML)
+                browser_text = await _extract_main_content(page)
+            finally:
+                await browser.close()
+
+        http_text = extract_main_content(STATIC_HTML, "#jobDescriptionText")
+
+        assert http_text is not None
+        assert http_text.split() == browser_text.split()
+
+
+class TestFetchStaticContent:
+    """Tests for fetch_static_content."""
+
+    async def test_fetches_and_parses(self, mock_http):
+        """Test a successful static fetch."""
+        mock_http(lambda request: httpx.Response(200, text=STATIC_HTML))
+
+        text = await fetch_static_content(
+            "https://fr.indeed.com/viewjob?jk=1",
+            "#jobDescriptionText",
+            5000,
+            ScraperConfig(),
+        )
+
+        assert text is not None and "Python developer" in text
+
+    async def test_http_error_returns_none(self, mock_http):
+        """Test that blocked requests fall back to the browser."""
+        mock_http(lambda request: httpx.Response(403, text="Blocked"))
+
+        text = await fetch_static_content(
+            "https://fr.indeed.com/viewjob?jk=1",
+            "#jobDescriptionText",
+            5000,
+            ScraperConfig(),
+        )
+
+        assert text is None
+
+
+# =============================================================================
+# Routing Tests
+# =============================================================================
+
+
+class TestFetchRouter:
+    """Tests for per-domain learned routing."""
+
+    def test_new_domain_tries_http(self):
+        """Test that unknown domains get the HTTP path."""
+        router = FetchRouter()
+        assert router.should_try_http("https://jobs.lever.co/acme/1") is True
+
+    def test_routes_to_browser_after_failures(self):
+        """Test that repeatedly failing domains skip HTTP."""
+        router = FetchRouter(min_failures=2, reprobe_every=100)
+        router.record("https://fr.indeed.com/a", ok=False)
+        router.record("https://fr.indeed.com/b", ok=False)
+
+        assert router.should_try_http("https://fr.indeed.com/c") is False
+        assert router.preferred_path("https://fr.indeed.com/c") == "browser"
+
+    def test_reprobes_periodically(self):
+        """Test that browser-routed domains are probed again."""
+        router = FetchRouter(min_failures=1, reprobe_every=3)
+        router.record("https://fr.indeed.com/a", ok=False)
+
+        decisions = [
+            router.should_try_http("https://fr.indeed.com/x") for _ in range(3)
+        ]
+        assert decisions == [False, False, True]
+
+    def test_routes_are_persisted(self):
+        """Test that routing knowledge survives a new router instance."""
+        FetchRouter(min_failures=1).record("https://fr.indeed.com/a", ok=False)
+
+        path = FetchRouter(min_failures=1).preferred_path("https://fr.indeed.com/b")
+        assert path == "browser"
+
+
+# =============================================================================
+# get_page_content integration Tests
+# =============================================================================
+
+
+class TestHttpFirstGetPageContent:
+    """Tests for the HTTP fast path inside get_page_content."""
+
+    @pytest.fixture(autouse=True)
+    async def cleanup(self):
+        """Clear cache and close browser after each test."""
+        yield
+        get_cache().clear()
+        await BrowserManager.close()
+
+    async def test_static_page_skips_browser(self, mock_http):
+        """Test that server-rendered pages never launch Chromium."""
+        mock_http(lambda request: httpx.Response(200, text=STATIC_HTML))
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            content = await get_page_content(
+                "https://fr.indeed.com/viewjob?jk=1",
+                wait_selector="#jobDescriptionText",
+            )
+
+        assert content is not None and "Python developer" in content
+        mock_get_page.assert_not_called()
+        assert get_router().preferred_path("https://fr.indeed.com/") == "http"
+
+    async def test_js_only_page_falls_back_to_browser(self, mock_http):
+        """Test fallback to the browser when the selector is missing."""
+        mock_http(lambda request: httpx.Response(200, text=JS_ONLY_HTML))
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_page = AsyncMock()
+            mock_page.goto = AsyncMock(return_value=AsyncMock(status=200))
+            body = AsyncMock()
+            body.inner_text = AsyncMock(return_value="Rendered content")
+            mock_page.query_selector = AsyncMock(
+                side_effect=lambda sel: body if sel == "body" else None
+            )
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(return_value=mock_page)
+            mock_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_get_page.return_value = mock_cm
+
+            content = await get_page_content(
+                "https://jobs.lever.co/acme/1", wait_selector=".posting-page"
+            )
+
+        assert content == "Rendered content"
+        mock_page.goto.assert_called_once()
+
+    async def test_unknown_domain_uses_browser_only(self, mock_http):
+        """Test that domains outside http_first_domains are not fetched twice."""
+        handler = AsyncMock(return_value=httpx.Response(200, text=STATIC_HTML))
+        mock_http(handler)
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_get_page.side_effect = RuntimeError("browser")
+            await get_page_content("https://example.com/job", wait_selector="main")
+
+        handler.assert_not_called()
@@ -1,17 +1,23 @@
 """Tests for offers_finder.py - job search functionality."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from hireme.scraper.offers_finder import (
     DEFAULT_SOURCES,
+    INDEED_SPEC,
     SOURCES,
     SOURCES_ASYNC,
+    WTTJ_SPEC,
     JobSearchResult,
     _extract_job_card,
+    _extract_job_cards_batched,
+    _iter_source_pages,
     get_job_urls,
     get_job_urls_async,
+    iter_jobs_async,
     search_indeed_async,
     search_jobs,
     search_jobs_async,
@@ -224,6 +230,96 @@ class TestExtractJobCard:
         assert results[0].location is None
 
 
+class TestExtractJobCardBatched:
+    """Tests for the single round-trip card extraction."""
+
+    async def test_uses_single_evaluate_call(self):
+        """Test that all cards come from one page.evaluate call."""
+        page = AsyncMock()
+        page.evaluate = AsyncMock(
+            return_value=[
+                {
+                    "url": "/rc/clk?jk=1",
+                    "title": "Data Analyst",
+                    "company": "DataCo",
+                    "location": "Lille",
+                },
+                {"url": None, "title": "No link", "company": None, "location": None},
+            ]
+        )
+
+        results = await _extract_job_card(
+            page=page,
+            card_selector=".job-card",
+            link_selector="a",
+            title_selector=".title",
+            company_selector=".company",
+            location_selector=".location",
+            source="indeed",
+            max_results=10,
+            base_url="https://fr.indeed.com",
+        )
+
+        page.evaluate.assert_called_once()
+        page.query_selector_all.assert_not_called()
+        assert len(results) == 1
+        assert results[0].url == "https://fr.indeed.com/rc/clk?jk=1"
+        assert results[0].title == "Data Analyst"
+        assert results[0].company == "DataCo"
+        assert results[0].location == "Lille"
+
+    async def test_passes_selectors_and_limit(self):
+        """Test that selectors and max_results are sent to the page."""
+        page = AsyncMock()
+        page.evaluate = AsyncMock(return_value=[])
+
+        await _extract_job_cards_batched(
+            page, ".card", "a", ".title", ".company", ".location", 5
+        )
+
+        args = page.evaluate.call_args[0][1]
+        assert args == [".card", "a", ".title", ".company", ".location", 5]
+
+    async def test_falls_back_to_per_element(self):
+        """Test fallback when page.evaluate fails."""
+        page = AsyncMock()
+        page.evaluate = AsyncMock(side_effect=Exception("Execution context destroyed"))
+
+        mock_link = AsyncMock()
+        mock_link.get_attribute = AsyncMock(return_value="https://example.com/job/1")
+        mock_card = AsyncMock()
+        mock_card.query_selector = AsyncMock(
+            side_effect=lambda sel: mock_link if sel == "a" else None
+        )
+        page.query_selector_all = AsyncMock(return_value=[mock_card])
+
+        results = await _extract_job_card(
+            page=page,
+            card_selector=".job-card",
+            link_selector="a",
+            title_selector=".title",
+            company_selector=".company",
+            location_selector=".location",
+            source="test",
+            max_results=10,
+        )
+
+        page.query_selector_all.assert_called_once()
+        assert len(results) == 1
+        assert results[0].url == "https://example.com/job/1"
+
+    def test_benchmark_fixture_matches_indeed_selectors(self):
+        """Test that the saved search page still matches the Indeed selectors."""
+        from bs4 import BeautifulSoup
+
+        fixture = Path(__file__).parent / "fixtures" / "indeed_search_page.html"
+        soup = BeautifulSoup(fixture.read_text(encoding="utf-8"), "html.parser")
+        cards = soup.select(".job_seen_beacon")
+
+        assert len(cards) == 50
+        assert all(card.select_one("a[data-jk], h2 a") for card in cards)
+
+
 # =============================================================================
 # Search Function Tests
 # =============================================================================
@@ -488,3 +584,194 @@ class TestPlaceholderSources:
 
         results = await search_glassdoor_async("query")
         assert results == []
+
+
+# =============================================================================
+# Pagination and Streaming Tests
+# =============================================================================
+
+
+def _page_results(source: str, start: int, count: int) -> list[JobSearchResult]:
+    return [
+        JobSearchResult(url=f"https://{source}.com/job{i}", source=source)
+        for i in range(start, start + count)
+    ]
+
+
+class TestPaginatedSearch:
+    """Tests for page-by-page crawling of paginated sources."""
+
+    def test_indeed_url_offsets_pages(self):
+        """Test that Indeed pages use the start offset."""
+        assert "start=" not in INDEED_SPEC.build_url("python", "Paris", 0)
+        assert INDEED_SPEC.build_url("python", "Paris", 2).endswith("&start=20")
+
+    def test_wttj_url_numbers_pages_from_one(self):
+        """Test that WTTJ pages are numbered from 1."""
+        assert "page=" not in WTTJ_SPEC.build_url("python", "France", 0)
+        assert WTTJ_SPEC.build_url("python", "France", 1).endswith("&page=2")
+
+    async def test_crawls_pages_until_max_results(self):
+        """Test that enough pages are crawled to reach max_results."""
+        pages = [_page_results("indeed", i * 10, 10) for i in range(5)]
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_page = AsyncMock()
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(return_value=mock_page)
+            mock_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_get_page.return_value = mock_cm
+
+            with patch(
+                "hireme.scraper.offers_finder._extract_job_card",
+                AsyncMock(side_effect=pages),
+            ):
+                results = await search_indeed_async("query", max_results=25)
+
+        assert len(results) == 25
+        assert mock_page.goto.call_count == 3
+
+    async def test_stops_on_empty_page(self):
+        """Test that crawling stops at the first page without cards."""
+        pages = [_page_results("wttj", 0, 30), []]
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_page = AsyncMock()
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(return_value=mock_page)
+            mock_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_get_page.return_value = mock_cm
+
+            with patch(
+                "hireme.scraper.offers_finder._extract_job_card",
+                AsyncMock(side_effect=pages),
+            ):
+                results = await search_wttj_async("query", max_results=100)
+
+        assert len(results) == 30
+        assert mock_page.goto.call_count == 2
+
+    async def test_releases_page_between_result_pages(self):
+        """Test that no pooled page is held while the consumer handles a page."""
+        pages = [_page_results("indeed", i * 10, 10) for i in range(3)]
+        held = []
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(side_effect=lambda: held.append(1))
+            mock_cm.__aexit__ = AsyncMock(side_effect=lambda *_: held.pop())
+            mock_get_page.return_value = mock_cm
+
+            with patch(
+                "hireme.scraper.offers_finder._load_results_page",
+                AsyncMock(side_effect=pages),
+            ):
+                held_per_page = [
+                    len(held)
+                    async for _ in _iter_source_pages(INDEED_SPEC, "q", "Paris", 3)
+                ]
+
+        assert held_per_page == [0, 0, 0]
+        assert mock_get_page.call_count == 3
+
+
+class TestIterJobsAsync:
+    """Tests for iter_jobs_async streaming search."""
+
+    @staticmethod
+    def _fake_pages(pages_by_source: dict[str, list[list[JobSearchResult]]]):
+        async def fake_iter(spec, query, location, max_pages):
+            for page in pages_by_source[spec.name][:max_pages]:
+                yield page
+
+        return fake_iter
+
+    async def _collect(self, pages_by_source, **kwargs) -> list[JobSearchResult]:
+        with patch.object(BrowserManager, "initialize", new_callable=AsyncMock):
+            with patch(
+                "hireme.scraper.offers_finder._iter_source_pages",
+                self._fake_pages(pages_by_source),
+            ):
+                return [result async for result in iter_jobs_async("query", **kwargs)]
+
+    async def test_streams_all_pages(self):
+        """Test that results from every page of every source are yielded."""
+        results = await self._collect(
+            {
+                "indeed": [
+                    _page_results("indeed", 0, 10),
+                    _page_results("indeed", 10, 10),
+                ],
+                "wttj": [_page_results("wttj", 0, 5)],
+            }
+        )
+
+        assert len(results) == 25
+        assert {r.source for r in results} == {"indeed", "wttj"}
+
+    async def test_respects_page_depth(self):
+        """Test that max_pages_per_source caps the crawl depth."""
+        results = await self._collect(
+            {
+                "indeed": [_page_results("indeed", i * 10, 10) for i in range(5)],
+                "wttj": [],
+            },
+            max_pages_per_source=2,
+        )
+
+        assert len(results) == 20
+
+    async def test_respects_result_caps(self):
+        """Test per-source and overall result caps."""
+        pages = {
+            "indeed": [_page_results("indeed", i * 10, 10) for i in range(5)],
+            "wttj": [_page_results("wttj", i * 10, 10) for i in range(5)],
+        }
+
+        per_source = await self._collect(pages, max_results_per_source=15)
+        overall = await self._collect(pages, max_results=7)
+
+        assert sum(r.source == "indeed" for r in per_source) == 15
+        assert sum(r.source == "wttj" for r in per_source) == 15
+        assert len(overall) == 7
+
+    async def test_stops_when_page_only_has_seen_urls(self):
+        """Test early stop when a page repeats already-yielded URLs."""
+        first = _page_results("indeed", 0, 10)
+        results = await self._collect(
+            {
+                "indeed": [first, first, _page_results("indeed", 10, 10)],
+                "wttj": [],
+            },
+            sources=["indeed"],
+        )
+
+        assert len(results) == 10
+
+    async def test_deduplicates_across_sources(self):
+        """Test that a URL found by two sources is yielded once."""
+        shared = [JobSearchResult(url="https://example.com/job", source="indeed")]
+        results = await self._collect(
+            {"indeed": [shared], "wttj": [shared + _page_results("wttj", 0, 2)]}
+        )
+
+        assert [r.url for r in results].count("https://example.com/job") == 1
+        assert len(results) == 3
+
+    async def test_non_paginated_source(self):
+        """Test that sources without pagination are searched once."""
+        mock_linkedin = AsyncMock(return_value=_page_results("linkedin", 0, 3))
+
+        with patch.dict(
+            "hireme.scraper.offers_finder.SOURCES_ASYNC", {"linkedin": mock_linkedin}
+        ):
+            results = await self._collect({}, sources=["linkedin"])
+
+        mock_linkedin.assert_called_once()
+        assert len(results) == 3
+
+    async def test_ignores_unknown_sources(self):
+        """Test that unknown sources yield nothing."""
+        results = await self._collect({}, sources=["unknown_source"])
+
+        assert results == []
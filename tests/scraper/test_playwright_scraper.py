@@ -1,20 +1,26 @@
 """Tests for playwright_scraper.py - core browser management and caching."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from hireme.scraper.playwright_scraper import (
     BrowserManager,
+    PagePool,
     ScraperConfig,
     URLCache,
+    _cache_ttl_for,
     _extract_main_content,
     _handle_route,
     get_cache,
     get_multiple_pages,
     get_page_content,
+    get_page_store,
+    normalize_url,
 )
+from hireme.utils.cache import PersistentCache
 
 # =============================================================================
 # ScraperConfig Tests
@@ -106,6 +112,100 @@ class TestURLCache:
         cache2 = get_cache()
         assert cache1 is cache2
 
+    def test_cache_keeps_query_string(self):
+        """Test that postings identified by query parameters don't collide."""
+        cache = URLCache()
+        cache.set("https://fr.indeed.com/viewjob?jk=1", "job1")
+        cache.set("https://fr.indeed.com/viewjob?jk=2", "job2")
+
+        assert cache.get("https://fr.indeed.com/viewjob?jk=1") == "job1"
+        assert cache.get("https://fr.indeed.com/viewjob?jk=2") == "job2"
+        assert normalize_url("https://example.com/a/#frag") == "https://example.com/a"
+
+
+# =============================================================================
+# PersistentCache Tests
+# =============================================================================
+
+
+class TestPersistentCache:
+    """Tests for the SQLite-backed page store."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test values survive reopening the store."""
+        store = PersistentCache(tmp_path / "cache.sqlite3")
+        store.set("key", "value")
+        store.close()
+
+        reopened = PersistentCache(tmp_path / "cache.sqlite3")
+        assert reopened.get("key") == "value"
+        reopened.close()
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries past their TTL are not served."""
+        store = PersistentCache(tmp_path / "cache.sqlite3")
+        store.set("key", "value", ttl=0.01)
+        time.sleep(0.02)
+
+        assert store.get("key") is None
+        assert store.has("key") is False
+        assert store.stats.expired == 1
+
+    def test_lru_eviction_by_byte_budget(self, tmp_path):
+        """Test that least recently used entries are evicted first."""
+        store = PersistentCache(tmp_path / "cache.sqlite3", max_bytes=30)
+        store.set("a", "x" * 10)
+        time.sleep(0.01)
+        store.set("b", "x" * 10)
+        time.sleep(0.01)
+        store.get("a")  # "b" becomes least recently used
+        time.sleep(0.01)
+        store.set("c", "x" * 15)
+
+        assert store.has("a")
+        assert not store.has("b")
+        assert store.has("c")
+        assert store.size_bytes() <= 30
+        assert store.stats.evictions == 1
+
+    def test_size_total_follows_writes(self, tmp_path):
+        """Test that the running payload total matches the stored entries."""
+        store = PersistentCache(tmp_path / "cache.sqlite3")
+        store.set("a", "x" * 10)
+        store.set("b", "x" * 20)
+        store.set("a", "x" * 5)  # overwrite
+        assert store.size_bytes() == 25
+
+        store.delete("b")
+        store.set("c", "x" * 7, ttl=0.01)
+        time.sleep(0.02)
+        assert store.get("c") is None
+        assert store.size_bytes() == 5
+        store.close()
+
+        reopened = PersistentCache(tmp_path / "cache.sqlite3")
+        assert reopened.size_bytes() == 5
+        reopened.clear()
+        assert reopened.size_bytes() == 0
+        reopened.close()
+
+    def test_hit_miss_counters(self, tmp_path):
+        """Test hit/miss accounting."""
+        store = PersistentCache(tmp_path / "cache.sqlite3")
+        store.set("key", "value")
+        store.get("key")
+        store.get("missing")
+
+        assert store.stats.hits == 1
+        assert store.stats.misses == 1
+        assert store.stats.hit_rate == 0.5
+
+    def test_domain_ttl_override(self):
+        """Test per-domain TTL resolution."""
+        config = ScraperConfig(cache_ttl=100, cache_domain_ttls={"indeed.com": 10})
+        assert _cache_ttl_for("https://fr.indeed.com/viewjob?jk=1", config) == 10
+        assert _cache_ttl_for("https://example.com/job", config) == 100
+
 
 # =============================================================================
 # BrowserManager Tests
@@ -164,6 +264,96 @@ class TestBrowserManager:
             mock_browser.new_context.assert_called_once()
 
 
+# =============================================================================
+# PagePool Tests
+# =============================================================================
+
+
+def _mock_browser() -> AsyncMock:
+    """Browser whose contexts each hand out a distinct page."""
+    browser = AsyncMock()
+
+    async def new_context(**kwargs):
+        context = AsyncMock()
+        context.new_page = AsyncMock(side_effect=lambda: AsyncMock())
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+class TestPagePool:
+    """Tests for the warm page pool."""
+
+    async def test_reuses_warm_page(self):
+        """Test that a released page is handed out again."""
+        browser = _mock_browser()
+        pool = PagePool(browser, ScraperConfig(), size=2)
+
+        slot = await pool.acquire()
+        await pool.release(slot)
+        again = await pool.acquire()
+
+        assert again.page is slot.page
+        assert browser.new_context.call_count == 1
+        assert pool.stats.checkouts == 2
+        assert pool.stats.created == 1
+
+    async def test_recycles_after_max_uses(self):
+        """Test that contexts are closed after max_uses navigations."""
+        pool = PagePool(_mock_browser(), ScraperConfig(pool_max_uses=2), size=1)
+
+        first = await pool.acquire()
+        await pool.release(first)
+        await pool.release(await pool.acquire())
+        third = await pool.acquire()
+
+        first.context.close.assert_called_once()
+        assert third.page is not first.page
+        assert pool.stats.recycles == 1
+
+    async def test_recycles_on_error(self):
+        """Test that a failed checkout is not reused."""
+        pool = PagePool(_mock_browser(), ScraperConfig(), size=1)
+
+        slot = await pool.acquire()
+        await pool.release(slot, failed=True)
+
+        slot.context.close.assert_called_once()
+        assert pool.stats.recycles == 1
+
+    async def test_bounded_checkouts_wait(self):
+        """Test that checkouts beyond size wait for a free slot."""
+        pool = PagePool(_mock_browser(), ScraperConfig(), size=1)
+        slot = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.release(slot)
+        again = await asyncio.wait_for(waiter, timeout=1)
+
+        assert again.page is slot.page
+        assert pool.stats.waits == 1
+
+    async def test_get_page_uses_pool(self):
+        """Test that BrowserManager.get_page checks pages out of the pool."""
+        with patch("hireme.scraper.playwright_scraper.async_playwright") as mock_pw:
+            mock_playwright = AsyncMock()
+            mock_playwright.chromium.launch = AsyncMock(return_value=_mock_browser())
+            mock_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+
+            async with BrowserManager.get_page() as page1:
+                pass
+            async with BrowserManager.get_page() as page2:
+                pass
+
+            assert page1 is page2
+            assert BrowserManager.pool_stats().checkouts == 2
+            await BrowserManager.close()
+
+
 # =============================================================================
 # Route Handling Tests
 # =============================================================================
@@ -302,6 +492,18 @@ class TestGetPageContent:
 
         assert content == "cached content"
 
+    async def test_returns_persisted_content_without_browser(self):
+        """Test that a fresh page store entry skips Chromium entirely."""
+        get_page_store().set("https://example.com/persisted", "stored content")
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            content = await get_page_content("https://example.com/persisted")
+
+        assert content == "stored content"
+        mock_get_page.assert_not_called()
+        # Promoted to the in-memory cache for the rest of the run
+        assert get_cache().get("https://example.com/persisted") == "stored content"
+
     async def test_caches_new_content(self):
         """Test that new content is cached."""
         with patch.object(BrowserManager, "get_page") as mock_get_page:
@@ -321,6 +523,27 @@ class TestGetPageContent:
             # Verify page was accessed
             mock_page.goto.assert_called()
 
+    async def test_persists_new_content(self):
+        """Test that fetched content is written to the page store."""
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_page = AsyncMock()
+            mock_page.goto = AsyncMock(return_value=MagicMock(status=200))
+            mock_page.set_default_timeout = MagicMock()
+            body = AsyncMock()
+            body.inner_text = AsyncMock(return_value="Fetched content")
+            mock_page.query_selector = AsyncMock(
+                side_effect=lambda sel: body if sel == "body" else None
+            )
+
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(return_value=mock_page)
+            mock_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_get_page.return_value = mock_cm
+
+            await get_page_content("https://example.com/fresh/")
+
+        assert get_page_store().get("https://example.com/fresh") == "Fetched content"
+
     async def test_returns_none_on_http_error(self):
         """Test that None is returned on HTTP error."""
         with patch.object(BrowserManager, "get_page") as mock_get_page:
@@ -375,10 +598,16 @@ class TestGetMultiplePages:
     async def test_respects_max_concurrent(self):
         """Test that max_concurrent limit is respected."""
         call_times = []
+        running = 0
+        peak = 0
 
         async def mock_get_content(*args, **kwargs):
+            nonlocal running, peak
             call_times.append(asyncio.get_event_loop().time())
+            running += 1
+            peak = max(peak, running)
             await asyncio.sleep(0.1)
+            running -= 1
             return "content"
 
         with patch(
@@ -391,6 +620,7 @@ class TestGetMultiplePages:
 
             # All 5 should complete
             assert len(call_times) == 5
+            assert peak == 2
 
 
 # =============================================================================
@@ -0,0 +1,280 @@
+"""Tests for rate_limiter.py - per-host token buckets and adaptive concurrency."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from hireme.scraper import http_fetcher
+from hireme.scraper.playwright_scraper import (
+    BrowserManager,
+    ScraperConfig,
+    get_cache,
+    get_page_content,
+)
+from hireme.scraper.rate_limiter import (
+    FetchOutcome,
+    HostLimiter,
+    HostScheduler,
+    get_scheduler,
+)
+from hireme.scraper.retry import get_breaker
+from hireme.utils.retry_after import parse_retry_after
+
+
+def _limiter(**kwargs) -> HostLimiter:
+    params = {
+        "rate": 100.0,
+        "burst": 10,
+        "initial_concurrency": 2,
+        "max_concurrency": 4,
+        "target_latency": 5.0,
+    }
+    params.update(kwargs)
+    return HostLimiter(**params)
+
+
+# =============================================================================
+# Retry-After parsing Tests
+# =============================================================================
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_parses_seconds(self):
+        """Test the delay-seconds form."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_parses_http_date(self):
+        """Test the HTTP-date form."""
+        delay = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+
+        assert delay is not None and 55 <= delay <= 61
+
+    def test_invalid_values(self):
+        """Test that missing or garbage values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+# =============================================================================
+# HostLimiter Tests
+# =============================================================================
+
+
+class TestHostLimiter:
+    """Tests for a single host limiter."""
+
+    async def test_caps_concurrency(self):
+        """Test that no more than `concurrency` requests run at once."""
+        limiter = _limiter(initial_concurrency=2, max_concurrency=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.02)
+            await limiter.release(FetchOutcome(status=200), latency=0.02)
+
+        await asyncio.gather(*[request() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.stats.requests == 6
+
+    async def test_token_bucket_limits_rate(self):
+        """Test that requests beyond the burst wait for tokens."""
+        limiter = _limiter(rate=20.0, burst=1, initial_concurrency=4)
+
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release(FetchOutcome(status=200), latency=0.0)
+
+        # 1 token in the bucket, then 2 refills at 20/s
+        assert time.monotonic() - started >= 0.09
+        assert limiter.stats.waits == 2
+
+    async def test_additive_increase_on_fast_success(self):
+        """Test that fast successes grow the limit up to the maximum."""
+        limiter = _limiter(initial_concurrency=1, max_concurrency=3)
+
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(FetchOutcome(status=200), latency=0.1)
+
+        assert limiter.concurrency == 3
+
+    async def test_multiplicative_decrease_on_429(self):
+        """Test that throttling halves the limit."""
+        limiter = _limiter(initial_concurrency=4)
+
+        await limiter.acquire()
+        await limiter.release(FetchOutcome(status=429), latency=0.1)
+
+        assert limiter.concurrency == 2
+        assert limiter.stats.throttled == 1
+
+    async def test_decreases_on_timeout_and_slow_responses(self):
+        """Test that timeouts and slow responses count as congestion."""
+        limiter = _limiter(initial_concurrency=4, target_latency=0.0)
+
+        await limiter.acquire()
+        await limiter.release(FetchOutcome(timed_out=True), latency=1.0)
+        await limiter.acquire()
+        await limiter.release(FetchOutcome(status=200), latency=1.0)
+
+        assert limiter.concurrency == 1
+        assert limiter.stats.timeouts == 1
+        assert limiter.stats.slow == 1
+
+    async def test_decreases_once_per_window(self):
+        """Test that a burst of failures only halves the limit once."""
+        limiter = _limiter(initial_concurrency=4, target_latency=60.0)
+
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release(FetchOutcome(status=429), latency=0.1)
+
+        assert limiter.concurrency == 2
+        assert limiter.stats.decreases == 1
+
+    async def test_honours_retry_after(self):
+        """Test that Retry-After pauses the host."""
+        limiter = _limiter()
+
+        await limiter.acquire()
+        await limiter.release(FetchOutcome(status=429, retry_after=0.1), latency=0.01)
+
+        started = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09
+
+
+# =============================================================================
+# HostScheduler Tests
+# =============================================================================
+
+
+class TestHostScheduler:
+    """Tests for per-host limiter dispatch."""
+
+    def test_one_limiter_per_host(self):
+        """Test that hosts get separate limiters."""
+        scheduler = HostScheduler(ScraperConfig())
+
+        indeed = scheduler.for_url("https://fr.indeed.com/viewjob?jk=1")
+
+        assert scheduler.for_url("https://fr.indeed.com/viewjob?jk=2") is indeed
+        assert scheduler.for_url("https://www.welcometothejungle.com/x") is not indeed
+
+    def test_per_domain_rates(self):
+        """Test that host_rates overrides the default rate."""
+        config = ScraperConfig(host_rate=5.0, host_rates={"indeed.com": 0.5})
+        scheduler = HostScheduler(config)
+
+        assert scheduler.for_url("https://fr.indeed.com/jobs").rate == 0.5
+        assert scheduler.for_url("https://jobs.lever.co/acme").rate == 5.0
+
+    async def test_slow_host_does_not_block_others(self):
+        """Test that a saturated host leaves other hosts free."""
+        config = ScraperConfig(host_initial_concurrency=1, host_max_concurrency=1)
+        scheduler = HostScheduler(config)
+        release_slow = asyncio.Event()
+
+        async def slow():
+            async with scheduler.slot("https://slow.example/a") as outcome:
+                await release_slow.wait()
+                outcome.status = 200
+
+        slow_task = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+
+        async with scheduler.slot("https://fast.example/a") as outcome:
+            outcome.status = 200
+
+        assert scheduler.for_url("https://slow.example/b").in_flight == 1
+        release_slow.set()
+        await slow_task
+
+    async def test_slot_records_timeouts(self):
+        """Test that a TimeoutError escaping the slot counts as a timeout."""
+        scheduler = HostScheduler(ScraperConfig())
+
+        with pytest.raises(TimeoutError):
+            async with scheduler.slot("https://example.com/a"):
+                raise TimeoutError
+
+        assert scheduler.stats()["example.com"].timeouts == 1
+
+
+# =============================================================================
+# get_page_content integration Tests
+# =============================================================================
+
+
+class TestScheduledGetPageContent:
+    """Tests for outcome reporting from get_page_content."""
+
+    @pytest.fixture(autouse=True)
+    async def cleanup(self):
+        """Clear cache, HTTP client and browser after each test."""
+        yield
+        get_cache().clear()
+        http_fetcher._client = None
+        await BrowserManager.close()
+
+    async def test_http_429_skips_browser_and_pauses_host(self):
+        """Test that a throttled HTTP fetch backs off instead of retrying."""
+        http_fetcher._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    429, headers={"Retry-After": "30"}, text="Too many requests"
+                )
+            )
+        )
+
+        breaker = get_breaker(ScraperConfig())
+
+        with (
+            patch.object(BrowserManager, "get_page") as mock_get_page,
+            patch.object(breaker, "record_success") as mock_success,
+            patch.object(breaker, "record_failure") as mock_failure,
+        ):
+            content = await get_page_content(
+                "https://fr.indeed.com/viewjob?jk=1",
+                wait_selector="#jobDescriptionText",
+            )
+
+        assert content is None
+        mock_get_page.assert_not_called()
+        # Throttling is left to the scheduler's pause, not the breaker
+        mock_success.assert_not_called()
+        mock_failure.assert_not_called()
+        limiter = get_scheduler(ScraperConfig()).for_url("https://fr.indeed.com/")
+        assert limiter.stats.throttled == 1
+        assert limiter._take_token() > 25
+
+    async def test_browser_status_is_reported(self):
+        """Test that browser responses feed the host limiter."""
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            mock_page = AsyncMock()
+            mock_page.goto = AsyncMock(return_value=MagicMock(status=429))
+            mock_page.set_default_timeout = MagicMock()
+            mock_cm = AsyncMock()
+            mock_cm.__aenter__ = AsyncMock(return_value=mock_page)
+            mock_cm.__aexit__ = AsyncMock(return_value=None)
+            mock_get_page.return_value = mock_cm
+
+            content = await get_page_content("https://example.com/job")
+
+        assert content is None
+        stats = get_scheduler(ScraperConfig()).stats()["example.com"]
+        assert stats.requests == 1
+        assert stats.throttled == 1
@@ -0,0 +1,281 @@
+"""Tests for retry.py - backoff policy and circuit breaker."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from hireme.scraper.offers_finder import search_indeed_async
+from hireme.scraper.playwright_scraper import (
+    BrowserManager,
+    ScraperConfig,
+    get_cache,
+    get_page_content,
+)
+from hireme.scraper.rate_limiter import FetchOutcome
+from hireme.scraper.retry import (
+    backoff_delay,
+    get_breaker,
+    is_failure,
+    should_retry,
+)
+from hireme.utils.circuit_breaker import CircuitBreaker, CircuitState
+
+
+def _mock_get_page(mock_get_page, page):
+    mock_cm = AsyncMock()
+    mock_cm.__aenter__ = AsyncMock(return_value=page)
+    mock_cm.__aexit__ = AsyncMock(return_value=None)
+    mock_get_page.return_value = mock_cm
+
+
+def _page_with_statuses(*statuses):
+    """Mock page whose successive navigations answer with `statuses`."""
+    page = AsyncMock()
+    page.set_default_timeout = MagicMock()
+    page.goto = AsyncMock(side_effect=[MagicMock(status=s) for s in statuses])
+    body = AsyncMock()
+    body.inner_text = AsyncMock(return_value="Job posting content")
+    page.query_selector = AsyncMock(
+        side_effect=lambda sel: body if sel == "body" else None
+    )
+    return page
+
+
+# =============================================================================
+# Retry policy Tests
+# =============================================================================
+
+
+class TestRetryPolicy:
+    """Tests for retry classification and backoff."""
+
+    def test_retries_timeouts_and_5xx_only(self):
+        """Test which outcomes are retried."""
+        assert should_retry(FetchOutcome(timed_out=True))
+        assert should_retry(FetchOutcome(status=502))
+        assert not should_retry(FetchOutcome(status=404))
+        assert not should_retry(FetchOutcome(status=429))
+        assert not should_retry(FetchOutcome(status=200))
+
+    def test_client_errors_are_not_failures(self):
+        """Test that a 404 does not count against the breaker."""
+        assert not is_failure(FetchOutcome(status=404))
+        assert is_failure(FetchOutcome(status=503))
+        assert is_failure(FetchOutcome(error="net::ERR_CONNECTION_REFUSED"))
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test full-jitter exponential backoff."""
+        config = ScraperConfig(retry_base_delay=1.0, retry_max_delay=5.0)
+
+        delays = [backoff_delay(attempt, config) for attempt in range(10)]
+
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+        with patch("hireme.scraper.retry.random.uniform", side_effect=max):
+            assert backoff_delay(0, config) == 1.0
+            assert backoff_delay(2, config) == 4.0
+            assert backoff_delay(5, config) == 5.0
+
+
+# =============================================================================
+# Circuit breaker Tests
+# =============================================================================
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit breaker state machine."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the threshold."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+        for _ in range(2):
+            breaker.record_failure("indeed")
+        assert breaker.allow("indeed")
+
+        breaker.record_failure("indeed")
+        assert breaker.state("indeed") is CircuitState.OPEN
+        assert not breaker.allow("indeed")
+        assert breaker.allow("wttj")
+
+    def test_success_resets_failures(self):
+        """Test that failures must be consecutive."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure("indeed")
+        breaker.record_success("indeed")
+        breaker.record_failure("indeed")
+
+        assert breaker.state("indeed") is CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        """Test that one probe goes through after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure("indeed")
+
+        breaker.reset_timeout = 60
+        breaker._circuits["indeed"].opened_at -= 61
+
+        assert breaker.allow("indeed")
+        assert breaker.state("indeed") is CircuitState.HALF_OPEN
+        assert not breaker.allow("indeed")
+
+    def test_probe_outcome_closes_or_reopens(self):
+        """Test half-open transitions."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+
+        breaker.record_failure("a")
+        assert breaker.allow("a")
+        breaker.record_success("a")
+        assert breaker.state("a") is CircuitState.CLOSED
+
+        breaker.record_failure("b")
+        assert breaker.allow("b")
+        breaker.record_failure("b")
+        assert breaker.state("b") is CircuitState.OPEN
+
+
+# =============================================================================
+# get_page_content Tests
+# =============================================================================
+
+
+class TestGetPageContentRetries:
+    """Tests for retries and the breaker inside get_page_content."""
+
+    @pytest.fixture(autouse=True)
+    async def cleanup(self):
+        """Clear cache and close browser after each test."""
+        yield
+        get_cache().clear()
+        await BrowserManager.close()
+
+    async def test_retries_5xx_then_succeeds(self):
+        """Test that a transient 503 is retried."""
+        page = _page_with_statuses(503, 200)
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            content = await get_page_content("https://example.com/job")
+
+        assert content == "Job posting content"
+        assert page.goto.call_count == 2
+
+    async def test_does_not_retry_404(self):
+        """Test that client errors fail fast."""
+        page = _page_with_statuses(404)
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            content = await get_page_content("https://example.com/missing")
+
+        assert content is None
+        assert page.goto.call_count == 1
+
+    async def test_retries_timeouts_up_to_limit(self):
+        """Test that timeouts are retried retry_attempts times."""
+        page = AsyncMock()
+        page.set_default_timeout = MagicMock()
+        page.goto = AsyncMock(side_effect=PlaywrightTimeout("Timeout"))
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            content = await get_page_content("https://example.com/slow")
+
+        assert content is None
+        assert page.goto.call_count == ScraperConfig().retry_attempts + 1
+
+    async def test_open_circuit_skips_domain(self):
+        """Test that a dead domain is short-circuited."""
+        breaker = get_breaker(BrowserManager._config)
+        for _ in range(BrowserManager._config.breaker_failure_threshold):
+            breaker.record_failure("dead.example")
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            content = await get_page_content("https://dead.example/job")
+
+        assert content is None
+        mock_get_page.assert_not_called()
+
+
+# =============================================================================
+# Search source Tests
+# =============================================================================
+
+
+class TestSearchRetries:
+    """Tests for retries and the breaker in paginated searches."""
+
+    @pytest.fixture(autouse=True)
+    async def cleanup(self):
+        """Close browser after each test."""
+        yield
+        await BrowserManager.close()
+
+    async def test_retries_search_page_timeout(self):
+        """Test that a timed out results page is retried."""
+        page = AsyncMock()
+        page.wait_for_selector = AsyncMock(
+            side_effect=[PlaywrightTimeout("Timeout"), None]
+        )
+        page.evaluate = AsyncMock(
+            return_value=[
+                {
+                    "url": "/rc/clk?jk=1",
+                    "title": None,
+                    "company": None,
+                    "location": None,
+                }
+            ]
+        )
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            results = await search_indeed_async("query", max_results=1)
+
+        assert len(results) == 1
+        assert page.goto.call_count == 2
+
+    async def test_timeout_past_first_page_is_not_retried(self):
+        """Test that a timeout past page 0 ends the search without retries."""
+        config = BrowserManager._config
+        page = AsyncMock()
+        page.wait_for_selector = AsyncMock(
+            side_effect=[None, PlaywrightTimeout("Timeout")]
+        )
+        page.evaluate = AsyncMock(
+            return_value=[
+                {
+                    "url": "/rc/clk?jk=1",
+                    "title": None,
+                    "company": None,
+                    "location": None,
+                }
+            ]
+        )
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            results = await search_indeed_async("query", max_results=50)
+
+        assert len(results) == 1
+        assert page.goto.call_count == 2
+        assert get_breaker(config).state("indeed") is CircuitState.CLOSED
+
+    async def test_failing_source_opens_circuit(self):
+        """Test that a source failing repeatedly is skipped."""
+        config = BrowserManager._config
+        page = AsyncMock()
+        page.wait_for_selector = AsyncMock(side_effect=PlaywrightTimeout("Timeout"))
+
+        with patch.object(BrowserManager, "get_page") as mock_get_page:
+            _mock_get_page(mock_get_page, page)
+            for _ in range(config.breaker_failure_threshold):
+                assert await search_indeed_async("query") == []
+
+            calls = page.goto.call_count
+            assert await search_indeed_async("query") == []
+
+        assert get_breaker(config).state("indeed") is CircuitState.OPEN
+        assert page.goto.call_count == calls